@@ -0,0 +1,3 @@
+"""
+Performance benchmarks for the NHL API client and model layer.
+"""
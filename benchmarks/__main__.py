@@ -0,0 +1,116 @@
+"""
+Runs the benchmark suite, optionally exporting the results as JSON and comparing
+them against a previous export to catch regressions.
+
+    python -m benchmarks                         # run everything
+    python -m benchmarks -k models               # only matching benchmarks
+    python -m benchmarks --json results.json     # export the results
+    python -m benchmarks --compare results.json  # compare with an export
+
+The scripts next to this one (`python -m benchmarks.bench_<name>`) compare
+implementations against each other instead.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from contextlib import ExitStack
+from datetime import datetime, timezone
+
+from benchmarks.common import measure_stats
+from benchmarks.suite import collect
+
+
+def _commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _parse_args(argv: list[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="keyword", help="only run benchmarks matching this")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark")
+    parser.add_argument("--json", dest="output", help="export the results to a file")
+    parser.add_argument("--compare", help="a previous export to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="how many times slower than the previous export counts as a "
+        "regression, defaults to 1.2",
+    )
+    return parser.parse_args(argv)
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """
+    Prints how each benchmark changed since a previous export.
+
+    :param results: the results of this run
+    :param baseline: a previous export
+    :param threshold: the ratio of best times above which a benchmark regressed
+    :return: the IDs of the benchmarks which regressed
+    """
+    previous = {result["id"]: result for result in baseline["benchmarks"]}
+    regressions = []
+    print(f"\nCompared with {baseline.get('commit') or 'the previous export'}")
+    for result in results:
+        before = previous.get(result["id"])
+        if before is None:
+            print(f"  {result['id']:<55} new")
+            continue
+        ratio = result["best"] / before["best"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions.append(result["id"])
+        print(f"  {result['id']:<55} {ratio:>6.2f}x the time{flag}")
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+    args = _parse_args(argv)
+    results = []
+    with ExitStack() as stack:
+        for benchmark in collect(stack):
+            if args.keyword and args.keyword not in benchmark.id:
+                continue
+            stats = measure_stats(benchmark.func, repeat=args.repeat)
+            results.append({"id": benchmark.id, **stats})
+            print(
+                f"{benchmark.id:<55} {stats['best'] * 1e3:>10.3f} ms"
+                f"  (mean {stats['mean'] * 1e3:.3f} ± {stats['stdev'] * 1e3:.3f})"
+            )
+    if args.output:
+        export = {
+            "commit": _commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "machine": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "processor": platform.processor(),
+            },
+            "benchmarks": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(export, file, indent=2)
+        print(f"\nResults exported to {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
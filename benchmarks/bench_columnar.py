@@ -0,0 +1,76 @@
+"""
+Benchmarks the columnar play store against a list of `Play` models.
+
+Run with `python -m benchmarks.bench_columnar`.
+"""
+import numpy as np
+
+from benchmarks.common import measure, report
+from benchmarks.fixtures import feed_live
+from nhl_api_py.models.columnar import PlayColumns
+from nhl_api_py.models.game import Play
+from nhl_api_py.models.query import EventType, Period
+
+GAMES = 300
+
+
+def main() -> None:
+    feed = feed_live()
+    raw_plays = feed["liveData"]["plays"]["allPlays"]
+    # Filters are compared over many games, as in a season-wide analysis.
+    plays = [Play.from_dict(play) for play in raw_plays] * GAMES
+    columns = PlayColumns.concat([PlayColumns.from_feed(feed)] * GAMES)
+    print(f"feed/live payload: {len(raw_plays)} plays\n")
+
+    report(
+        "Build play-by-play from allPlays",
+        [
+            (
+                "Play.from_dict per play",
+                measure(lambda: [Play.from_dict(p) for p in raw_plays]),
+            ),
+            (
+                "PlayColumns.from_json",
+                measure(lambda: PlayColumns.from_json(raw_plays)),
+            ),
+        ],
+    )
+    # Build the indexes up front; they are kept for every later query.
+    columns.index("event_type_id"), columns.index("period")
+    report(
+        f"\nAll shots in period 3, over {len(plays)} plays",
+        [
+            (
+                "loop over Play models",
+                measure(
+                    lambda: [
+                        p for p in plays if p.event_type_id == "SHOT" and p.period == 3
+                    ]
+                ),
+            ),
+            (
+                "vectorized mask, as positions",
+                measure(
+                    lambda: np.flatnonzero(
+                        (columns["event_type_id"] == "SHOT") & (columns["period"] == 3)
+                    )
+                ),
+            ),
+            (
+                "indexed query, as positions",
+                measure(lambda: (EventType("SHOT") & Period(3)).positions(columns)),
+            ),
+            (
+                "vectorized mask, as new columns",
+                measure(
+                    lambda: columns[
+                        (columns["event_type_id"] == "SHOT") & (columns["period"] == 3)
+                    ]
+                ),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
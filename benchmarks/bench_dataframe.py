@@ -0,0 +1,36 @@
+"""
+Benchmarks building a DataFrame from many models.
+
+Run with `python -m benchmarks.bench_dataframe`.
+"""
+import pandas as pd
+
+from benchmarks.common import measure, report
+from benchmarks.fixtures import feed_live
+from nhl_api_py.models.base import to_dataframe
+from nhl_api_py.models.game import Game
+
+GAMES = 10
+
+
+def main() -> None:
+    plays = Game.from_dict(feed_live()).all_plays * GAMES
+    print(f"{len(plays)} plays\n")
+
+    report(
+        "Plays to DataFrame",
+        [
+            (
+                "concat of to_series",
+                measure(
+                    lambda: pd.concat([p.to_series() for p in plays], axis=1).T,
+                    repeat=3,
+                ),
+            ),
+            ("to_dataframe", measure(lambda: to_dataframe(plays), repeat=3)),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
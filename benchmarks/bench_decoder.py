@@ -0,0 +1,35 @@
+"""
+Benchmarks decoding a multi-megabyte `feed/live` body with each JSON library.
+
+Run with `python -m benchmarks.bench_decoder`.
+"""
+import json
+
+from benchmarks.common import measure, report
+from benchmarks.fixtures import feed_live
+
+
+def main() -> None:
+    # A long game (e.g. a multiple overtime playoff game) with ~1,200 plays.
+    body = json.dumps(feed_live(plays_per_period=400)).encode()
+    print(f"feed/live body: {len(body) / 1e6:.1f} MB\n")
+
+    rows = [("json.loads", measure(lambda: json.loads(body)))]
+    try:
+        import orjson
+
+        rows.append(("orjson.loads", measure(lambda: orjson.loads(body))))
+    except ImportError:
+        print("orjson is not installed")
+    try:
+        import msgspec
+
+        decoder = msgspec.json.Decoder()
+        rows.append(("msgspec Decoder.decode", measure(lambda: decoder.decode(body))))
+    except ImportError:
+        print("msgspec is not installed")
+    report("Decode feed/live", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Measures the memory used by each model instance, slotted versus a regular
+dataclass with a per-instance `__dict__`.
+
+Run with `python -m benchmarks.bench_memory`.
+"""
+import gc
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+
+from benchmarks.fixtures import feed_live
+from nhl_api_py.models.game import Game, Play
+from nhl_api_py.models.team import Team
+
+# Roughly the number of plays in a full regular season.
+SEASON_PLAYS = 400_000
+
+
+def _unslotted(cls) -> type:
+    return make_dataclass(
+        f"Unslotted{cls.__name__}",
+        [(f.name, f.type, field(default=None)) for f in fields(cls)],
+    )
+
+
+def bytes_per_instance(cls, models: list) -> float:
+    """
+    Measures the memory used by the instances themselves: the attribute values
+    are shared with `models`, so only the per-instance overhead is counted.
+
+    :param cls: the class we want to create instances of
+    :param models: the models whose attribute values are reused
+    :return: the average number of bytes allocated per instance
+    """
+    # Positional arguments, so no temporary kwargs dictionaries are measured.
+    args = [tuple(getattr(m, f.name) for f in fields(m)) for m in models]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(*values) for values in args]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't count the list holding the instances.
+    list_size = instances.__sizeof__()
+    return (after - before - list_size) / len(instances)
+
+
+def main() -> None:
+    game = Game.from_dict(feed_live())
+    plays = game.all_plays * 30
+    teams = [play.team for play in plays if play.team is not None]
+    print(f"{len(plays)} plays\n")
+    for cls, models in [(Play, plays), (Team, teams), (Game, [game] * 10_000)]:
+        unslotted = bytes_per_instance(_unslotted(cls), models)
+        slotted = bytes_per_instance(cls, models)
+        print(cls.__name__)
+        print(f"  {'__dict__ dataclass':<24} {unslotted:>8.1f} bytes / instance")
+        print(f"  {'slotted dataclass':<24} {slotted:>8.1f} bytes / instance")
+        if cls is Play:
+            saved = (unslotted - slotted) * SEASON_PLAYS / 2**20
+            print(f"  saves {saved:.1f} MiB over a season of {SEASON_PLAYS} plays")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmarks building models from a full `feed/live` payload.
+
+Run with `python -m benchmarks.bench_models`.
+"""
+import json
+from contextlib import ExitStack
+from dataclasses import fields
+from unittest.mock import patch
+
+from benchmarks.common import measure, report
+from benchmarks.fixtures import feed_live
+from nhl_api_py.core.decoder import decode
+from nhl_api_py.models.game import Boxscore, Game, LazyGame, Play
+
+
+def _introspecting_field_only_keys(data: dict, cls) -> dict:
+    # The original implementation, kept as the baseline.
+    return {k: v for k, v in data.items() if k in (field.name for field in fields(cls))}
+
+
+def _with_introspecting_filter() -> ExitStack:
+    stack = ExitStack()
+    for module in ("game", "team", "schedule"):
+        stack.enter_context(
+            patch(
+                f"nhl_api_py.models.{module}._field_only_keys",
+                _introspecting_field_only_keys,
+            )
+        )
+    return stack
+
+
+def main() -> None:
+    feed = feed_live()
+    plays = feed["liveData"]["plays"]["allPlays"]
+    boxscore = feed["liveData"]["boxscore"]
+    print(f"feed/live payload: {len(plays)} plays\n")
+
+    for title, build in [
+        ("Game.from_dict", lambda: Game.from_dict(feed)),
+        ("Play.from_dict on every play", lambda: [Play.from_dict(p) for p in plays]),
+        ("Boxscore.from_dict", lambda: Boxscore.from_dict(boxscore)),
+    ]:
+        with _with_introspecting_filter():
+            baseline = measure(build)
+        report(
+            title,
+            [
+                ("fields() on every key", baseline),
+                ("cached field name set", measure(build)),
+            ],
+        )
+        print()
+
+    # Both include decoding the JSON body.
+    for title, cls, payload in [
+        ("Game from a feed/live body", Game, feed),
+        ("Boxscore from a boxscore body", Boxscore, boxscore),
+    ]:
+        body = json.dumps(payload).encode()
+        report(
+            title,
+            [
+                ("decode + from_dict", measure(lambda: cls.from_dict(decode(body)))),
+                ("from_json (msgspec schema)", measure(lambda: cls.from_json(body))),
+            ],
+        )
+        print()
+
+    # A scoreboard only reads each game's state and teams.
+    scoreboard = [feed_live(game_id=2022020001 + i) for i in range(15)]
+    report(
+        f"Scoreboard of {len(scoreboard)} games (detailed_state only)",
+        [
+            (
+                "Game.from_dict",
+                measure(lambda: [Game.from_dict(f).detailed_state for f in scoreboard]),
+            ),
+            (
+                "LazyGame.from_dict",
+                measure(
+                    lambda: [LazyGame.from_dict(f).detailed_state for f in scoreboard]
+                ),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Measures the peak memory and time of going through every play of a large
+`feed/live` body, decoding it whole versus streaming its plays.
+
+Run with `python -m benchmarks.bench_streaming`.
+"""
+import gc
+import io
+import json
+import time
+import tracemalloc
+from typing import Callable
+
+from requests import Response as RequestResponse
+
+from benchmarks.fixtures import feed_live
+from nhl_api_py.core.decoder import decode
+from nhl_api_py.core.streaming import iter_items
+from nhl_api_py.models.game import Game, Play
+
+
+def _response(body: bytes) -> RequestResponse:
+    response = RequestResponse()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def _decoded(body: bytes) -> int:
+    # What `NhlApi.plays` does: decode, build the game, then go through its plays.
+    return sum(1 for _ in Game.from_dict(decode(body)).all_plays)
+
+
+def _streamed(body: bytes) -> int:
+    plays = iter_items(_response(body), "liveData.plays.allPlays")
+    return sum(1 for _ in map(Play.from_dict, plays))
+
+
+def peak(func: Callable[[bytes], int], body: bytes) -> tuple[float, float]:
+    """
+    :param func: goes through every play of the body
+    :param body: the raw JSON body
+    :return: the peak memory allocated while running, in MB, and the time taken,
+        in seconds
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(body)
+    seconds = time.perf_counter() - start
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak_bytes / 1e6, seconds
+
+
+def main() -> None:
+    body = json.dumps(feed_live(plays_per_period=1000)).encode()
+    print(f"feed/live body: {len(body) / 1e6:.1f} MB\n")
+    print("Go through every play (tracemalloc makes the timings slower)")
+    for label, func in [("decode whole feed", _decoded), ("stream plays", _streamed)]:
+        megabytes, seconds = peak(func, body)
+        print(f"  {label:<40} {megabytes:>8.1f} MB peak {seconds * 1e3:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmarks the key translation in `nhl_api_py.core.utils` on a full
+`feed/live` payload.
+
+Run with `python -m benchmarks.bench_utils`.
+"""
+import re
+from unittest.mock import patch
+
+from benchmarks.common import measure, report
+from benchmarks.fixtures import feed_live
+from nhl_api_py.core.utils import camel_to_snake_case, convert_keys_to_snake_case
+
+
+def _uncompiled_camel_to_snake_case(value: str) -> str:
+    # The original implementation, kept as the baseline.
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", value).lower()
+
+
+def _all_keys(data) -> list[str]:
+    keys, stack = [], [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            keys.extend(value)
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return keys
+
+
+def main() -> None:
+    feed = feed_live()
+    keys = _all_keys(feed)
+    print(f"feed/live payload: {len(keys)} keys, {len(set(keys))} distinct\n")
+
+    report(
+        "Translate every key of the payload",
+        [
+            (
+                "re.sub (uncompiled, no memo)",
+                measure(lambda: [_uncompiled_camel_to_snake_case(k) for k in keys]),
+            ),
+            (
+                "camel_to_snake_case (memoized)",
+                measure(lambda: [camel_to_snake_case(k) for k in keys]),
+            ),
+        ],
+    )
+    with patch(
+        "nhl_api_py.core.utils.camel_to_snake_case", _uncompiled_camel_to_snake_case
+    ):
+        baseline = measure(lambda: convert_keys_to_snake_case(feed))
+    report(
+        "\nconvert_keys_to_snake_case on the payload",
+        [
+            ("re.sub (uncompiled, no memo)", baseline),
+            (
+                "camel_to_snake_case (memoized)",
+                measure(lambda: convert_keys_to_snake_case(feed)),
+            ),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmarks writing games to a SQLite warehouse file one transaction per game
+versus in batches, and reading a game back from it versus parsing its
+`feed/live` body.
+
+Run with `python -m benchmarks.bench_warehouse`.
+"""
+import json
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import measure, report
+from benchmarks.fixtures import feed_live
+from nhl_api_py.core.decoder import decode
+from nhl_api_py.models.game import Game
+from nhl_api_py.warehouse.sqlite import SqliteWarehouse
+
+GAMES = 20
+
+
+def _write(games: list[Game], batch_size: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "nhl.sqlite3"
+        with SqliteWarehouse(path, batch_size=batch_size) as warehouse:
+            warehouse.write_games(games)
+
+
+def main() -> None:
+    games = [Game.from_dict(feed_live(2022020001 + number)) for number in range(GAMES)]
+    plays = sum(len(game.all_plays) for game in games)
+    print(f"{GAMES} games, {plays} plays\n")
+    report(
+        f"Write {GAMES} games to a new database file",
+        [
+            ("one transaction per game", measure(lambda: _write(games, 1), repeat=3)),
+            (f"batches of {GAMES} games", measure(lambda: _write(games, GAMES), 3)),
+        ],
+    )
+
+    body = json.dumps(feed_live()).encode()
+    warehouse = SqliteWarehouse()
+    warehouse.write_games(games)
+    print()
+    report(
+        "Get one game with its plays",
+        [
+            ("decode + Game.from_dict", measure(lambda: Game.from_dict(decode(body)))),
+            ("SqliteWarehouse.game", measure(lambda: warehouse.game(2022020001))),
+        ],
+    )
+    warehouse.close()
+
+
+if __name__ == "__main__":
+    main()
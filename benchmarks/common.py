@@ -0,0 +1,61 @@
+"""
+Timing helpers shared by the benchmark scripts.
+"""
+from __future__ import annotations
+
+import statistics
+import timeit
+from typing import Callable
+
+
+def measure(func: Callable[[], object], repeat: int = 5, number: int = None) -> float:
+    """
+    Times a function, taking the best of several runs to limit the noise.
+
+    :param func: the function we want to time, called without arguments
+    :param repeat: the number of runs we take the best of
+    :param number: the number of calls per run, picked automatically if not given
+    :return: the time of a single call, in seconds
+    """
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure_stats(
+    func: Callable[[], object], repeat: int = 5, number: int = None
+) -> dict:
+    """
+    Times a function like `measure`, but keeps the statistics of all runs.
+
+    :param func: the function we want to time, called without arguments
+    :param repeat: the number of runs
+    :param number: the number of calls per run, picked automatically if not given
+    :return: the best, mean and standard deviation of the time of a single call,
+        in seconds, along with the number of runs and calls per run
+    """
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "best": min(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "rounds": repeat,
+        "number": number,
+    }
+
+
+def report(title: str, rows: list[tuple[str, float]]) -> None:
+    """
+    Prints the timings of a benchmark, relative to the first row.
+
+    :param title: what the benchmark measures
+    :param rows: a label and the time of a single call, in seconds, for each case
+    """
+    print(title)
+    baseline = rows[0][1]
+    for label, seconds in rows:
+        print(f"  {label:<40} {seconds * 1e3:>10.3f} ms  {baseline / seconds:>6.2f}x")
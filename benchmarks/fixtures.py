@@ -0,0 +1,505 @@
+"""
+Generates realistic, deterministic NHL API payloads for the benchmarks.
+
+The payloads follow the structure and size of the real responses (e.g. a
+regular season `game/{id}/feed/live` has a few hundred plays and ~40 players),
+so the benchmarks do not depend on the network or the API being available.
+"""
+from __future__ import annotations
+
+import random
+from functools import lru_cache
+
+EVENTS = [
+    ("Faceoff", "FACEOFF", 0.14),
+    ("Shot", "SHOT", 0.18),
+    ("Missed Shot", "MISSED_SHOT", 0.09),
+    ("Blocked Shot", "BLOCKED_SHOT", 0.10),
+    ("Hit", "HIT", 0.2),
+    ("Giveaway", "GIVEAWAY", 0.06),
+    ("Takeaway", "TAKEAWAY", 0.05),
+    ("Stoppage", "STOP", 0.12),
+    ("Penalty", "PENALTY", 0.03),
+    ("Goal", "GOAL", 0.03),
+]
+STRENGTHS = [("EVEN", "Even"), ("PPG", "Power Play"), ("SHG", "Short Handed")]
+
+
+def _team(rng: random.Random, team_id: int) -> dict:
+    name = f"Team {team_id}"
+    return {
+        "id": team_id,
+        "name": name,
+        "link": f"/api/v1/teams/{team_id}",
+        "venue": {
+            "id": 5000 + team_id,
+            "name": f"Arena {team_id}",
+            "link": f"/api/v1/venues/{5000 + team_id}",
+            "city": f"City {team_id}",
+            "timeZone": {"id": "America/New_York", "offset": -4, "tz": "EDT"},
+        },
+        "abbreviation": f"T{team_id:02d}",
+        "triCode": f"T{team_id:02d}",
+        "teamName": name,
+        "locationName": f"City {team_id}",
+        "firstYearOfPlay": str(rng.randint(1917, 2017)),
+        "division": {
+            "id": 15 + team_id % 4,
+            "name": "Metropolitan",
+            "nameShort": "Metro",
+            "link": f"/api/v1/divisions/{15 + team_id % 4}",
+            "abbreviation": "M",
+        },
+        "conference": {
+            "id": 6 + team_id % 2,
+            "name": "Eastern",
+            "link": f"/api/v1/conferences/{6 + team_id % 2}",
+        },
+        "franchise": {
+            "franchiseId": 20 + team_id,
+            "teamName": name,
+            "link": f"/api/v1/franchises/{20 + team_id}",
+        },
+        "shortName": f"City {team_id}",
+        "officialSiteUrl": f"http://www.team{team_id}.com/",
+        "franchiseId": 20 + team_id,
+        "active": True,
+    }
+
+
+def _person(player_id: int, team: dict) -> dict:
+    return {
+        "id": player_id,
+        "fullName": f"Player {player_id}",
+        "link": f"/api/v1/people/{player_id}",
+        "firstName": "Player",
+        "lastName": str(player_id),
+        "primaryNumber": str(player_id % 99),
+        "birthDate": "1995-01-01",
+        "currentAge": 27,
+        "birthCity": "Toronto",
+        "birthStateProvince": "ON",
+        "birthCountry": "CAN",
+        "nationality": "CAN",
+        "height": "6' 1\"",
+        "weight": 200,
+        "active": True,
+        "alternateCaptain": False,
+        "captain": False,
+        "rookie": False,
+        "shootsCatches": "L",
+        "rosterStatus": "Y",
+        "currentTeam": {
+            "id": team["id"],
+            "name": team["name"],
+            "link": team["link"],
+            "triCode": team["triCode"],
+        },
+        "primaryPosition": {
+            "code": "C",
+            "name": "Center",
+            "type": "Forward",
+            "abbreviation": "C",
+        },
+    }
+
+
+def _skater_stats(rng: random.Random) -> dict:
+    return {
+        "skaterStats": {
+            "timeOnIce": f"{rng.randint(8, 25)}:{rng.randint(0, 59):02d}",
+            "assists": rng.randint(0, 2),
+            "goals": rng.randint(0, 1),
+            "shots": rng.randint(0, 6),
+            "hits": rng.randint(0, 5),
+            "powerPlayGoals": 0,
+            "powerPlayAssists": 0,
+            "penaltyMinutes": rng.choice([0, 0, 0, 2]),
+            "faceOffWins": rng.randint(0, 10),
+            "faceoffTaken": rng.randint(0, 20),
+            "takeaways": rng.randint(0, 3),
+            "giveaways": rng.randint(0, 3),
+            "shortHandedGoals": 0,
+            "shortHandedAssists": 0,
+            "blocked": rng.randint(0, 4),
+            "plusMinus": rng.randint(-2, 2),
+            "evenTimeOnIce": "12:00",
+            "powerPlayTimeOnIce": "1:30",
+            "shortHandedTimeOnIce": "0:45",
+        }
+    }
+
+
+def _boxscore_team(rng: random.Random, team: dict, player_ids: list[int]) -> dict:
+    return {
+        "team": {
+            "id": team["id"],
+            "name": team["name"],
+            "link": team["link"],
+            "abbreviation": team["abbreviation"],
+            "triCode": team["triCode"],
+        },
+        "teamStats": {
+            "teamSkaterStats": {
+                "goals": rng.randint(0, 6),
+                "pim": rng.randint(0, 20),
+                "shots": rng.randint(20, 45),
+                "powerPlayPercentage": "25.0",
+                "powerPlayGoals": 1.0,
+                "powerPlayOpportunities": 4.0,
+                "faceOffWinPercentage": "50.0",
+                "blocked": rng.randint(5, 20),
+                "takeaways": rng.randint(2, 12),
+                "giveaways": rng.randint(2, 12),
+                "hits": rng.randint(10, 40),
+            }
+        },
+        "players": {
+            f"ID{player_id}": {
+                "person": {
+                    "id": player_id,
+                    "fullName": f"Player {player_id}",
+                    "link": f"/api/v1/people/{player_id}",
+                    "shootsCatches": "L",
+                    "rosterStatus": "Y",
+                },
+                "jerseyNumber": str(player_id % 99),
+                "position": {
+                    "code": "C",
+                    "name": "Center",
+                    "type": "Forward",
+                    "abbreviation": "C",
+                },
+                "stats": _skater_stats(rng),
+            }
+            for player_id in player_ids
+        },
+        "goalies": player_ids[:1],
+        "skaters": player_ids[1:],
+        "onIce": player_ids[:6],
+        "onIcePlus": [
+            {"playerId": player_id, "shiftDuration": 30, "stamina": 100}
+            for player_id in player_ids[:6]
+        ],
+        "scratches": [],
+        "penaltyBox": [],
+        "coaches": [
+            {
+                "person": {"fullName": f"Coach {team['id']}", "link": "/api/v1/people"},
+                "position": {
+                    "code": "HC",
+                    "name": "Head Coach",
+                    "type": "Head Coach",
+                    "abbreviation": "Head Coach",
+                },
+            }
+        ],
+    }
+
+
+def _period_time(seconds: int) -> str:
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+def _play(
+    rng: random.Random,
+    index: int,
+    period: int,
+    seconds: int,
+    goals: dict,
+    teams: list[dict],
+    player_ids: list[int],
+) -> dict:
+    names, weights = zip(*(((e[0], e[1]), e[2]) for e in EVENTS))
+    event, event_type_id = rng.choices(names, weights)[0]
+    team = rng.choice(teams)
+    result = {
+        "event": event,
+        "eventCode": f"EDM{index}",
+        "eventTypeId": event_type_id,
+        "description": f"Player {rng.choice(player_ids)} {event.lower()}",
+    }
+    play = {
+        "result": result,
+        "about": {
+            "eventIdx": index,
+            "eventId": index + 1,
+            "period": period,
+            "periodType": "REGULAR",
+            "ordinalNum": ["1st", "2nd", "3rd"][period - 1],
+            "periodTime": _period_time(seconds),
+            "periodTimeRemaining": _period_time(1200 - seconds),
+            "dateTime": f"2022-10-12T23:{index % 60:02d}:00Z",
+            "goals": dict(goals),
+        },
+        "coordinates": {},
+    }
+    if event_type_id in ("GAME_SCHEDULED", "PERIOD_START", "STOP"):
+        return play
+    play["players"] = [
+        {
+            "player": {
+                "id": player_id,
+                "fullName": f"Player {player_id}",
+                "link": f"/api/v1/people/{player_id}",
+            },
+            "playerType": player_type,
+        }
+        for player_id, player_type in zip(
+            rng.sample(player_ids, 2), ["Shooter", "Goalie"]
+        )
+    ]
+    play["coordinates"] = {
+        "x": float(rng.randint(-99, 99)),
+        "y": float(rng.randint(-42, 42)),
+    }
+    play["team"] = {
+        "id": team["id"],
+        "name": team["name"],
+        "link": team["link"],
+        "triCode": team["triCode"],
+    }
+    if event_type_id in ("SHOT", "GOAL", "MISSED_SHOT"):
+        result["secondaryType"] = rng.choice(["Wrist Shot", "Slap Shot", "Snap Shot"])
+    if event_type_id == "GOAL":
+        side = "home" if team is teams[1] else "away"
+        goals[side] += 1
+        play["about"]["goals"] = dict(goals)
+        code, name = rng.choice(STRENGTHS)
+        result["strength"] = {"code": code, "name": name}
+        result["gameWinningGoal"] = False
+        result["emptyNet"] = False
+    if event_type_id == "PENALTY":
+        result["secondaryType"] = "Tripping"
+        result["penaltySeverity"] = "Minor"
+        result["penaltyMinutes"] = 2
+    return play
+
+
+@lru_cache(maxsize=None)
+def _feed_live(game_id: int, plays_per_period: int, state: str) -> dict:
+    rng = random.Random(game_id)
+    away, home = _team(rng, 1), _team(rng, 2)
+    away_ids = list(range(8470000, 8470022))
+    home_ids = list(range(8480000, 8480022))
+    player_ids = away_ids + home_ids
+    players = {
+        f"ID{player_id}": _person(player_id, away if player_id in away_ids else home)
+        for player_id in player_ids
+    }
+    goals = {"away": 0, "home": 0}
+    all_plays = []
+    for period in range(1, 4):
+        for seconds in sorted(rng.sample(range(1200), plays_per_period)):
+            all_plays.append(
+                _play(
+                    rng,
+                    len(all_plays),
+                    period,
+                    seconds,
+                    goals,
+                    [away, home],
+                    player_ids,
+                )
+            )
+    by_type = {}
+    for index, play in enumerate(all_plays):
+        by_type.setdefault(play["result"]["eventTypeId"], []).append(index)
+    return {
+        "copyright": "NHL and the NHL Shield are registered trademarks.",
+        "gamePk": game_id,
+        "link": f"/api/v1/game/{game_id}/feed/live",
+        "metaData": {"wait": 10, "timeStamp": "20221013_030512"},
+        "gameData": {
+            "game": {"pk": game_id, "season": "20222023", "type": "R"},
+            "datetime": {
+                "dateTime": "2022-10-12T23:00:00Z",
+                "endDateTime": "2022-10-13T01:35:00Z",
+            },
+            "status": {
+                "abstractGameState": state,
+                "codedGameState": "7" if state == "Final" else "3",
+                "detailedState": state,
+                "statusCode": "7" if state == "Final" else "3",
+                "startTimeTBD": False,
+            },
+            "teams": {"away": away, "home": home},
+            "players": players,
+            "venue": away["venue"],
+        },
+        "liveData": {
+            "plays": {
+                "allPlays": all_plays,
+                "scoringPlays": by_type.get("GOAL", []),
+                "penaltyPlays": by_type.get("PENALTY", []),
+                "playsByPeriod": [
+                    {
+                        "startIndex": period * plays_per_period,
+                        "plays": list(
+                            range(
+                                period * plays_per_period,
+                                (period + 1) * plays_per_period,
+                            )
+                        ),
+                        "endIndex": (period + 1) * plays_per_period - 1,
+                    }
+                    for period in range(3)
+                ],
+                "currentPlay": all_plays[-1],
+            },
+            "boxscore": {
+                "teams": {
+                    "away": _boxscore_team(rng, away, away_ids),
+                    "home": _boxscore_team(rng, home, home_ids),
+                },
+                "officials": [],
+            },
+            "decisions": {},
+        },
+    }
+
+
+def feed_live(
+    game_id: int = 2022020001, plays_per_period: int = 110, state: str = "Final"
+) -> dict:
+    """
+    Builds a `game/{id}/feed/live` payload.
+
+    :param game_id: the game's ID, which also seeds the generated data
+    :param plays_per_period: the number of plays in each of the three periods
+    :param state: the game's abstract state (e.g. "Final" or "Live")
+    :return: the decoded JSON payload; callers must not mutate it
+    """
+    return _feed_live(game_id, plays_per_period, state)
+
+
+def boxscore(game_id: int = 2022020001) -> dict:
+    """
+    Builds a `game/{id}/boxscore` payload.
+
+    :param game_id: the game's ID, which also seeds the generated data
+    :return: the decoded JSON payload; callers must not mutate it
+    """
+    return feed_live(game_id)["liveData"]["boxscore"]
+
+
+def _roster_entry(player_id: int) -> dict:
+    return {
+        "person": {
+            "id": player_id,
+            "fullName": f"Player {player_id}",
+            "link": f"/api/v1/people/{player_id}",
+        },
+        "jerseyNumber": str(player_id % 99),
+        "position": {
+            "code": "C",
+            "name": "Center",
+            "type": "Forward",
+            "abbreviation": "C",
+        },
+    }
+
+
+@lru_cache(maxsize=None)
+def teams_with_roster(team_count: int = 32, roster_size: int = 26) -> dict:
+    """
+    Builds a `teams?expand=team.roster` payload.
+
+    :param team_count: the number of teams in the league
+    :param roster_size: the number of players on each team's roster
+    :return: the decoded JSON payload; callers must not mutate it
+    """
+    rng = random.Random(team_count)
+    teams = []
+    for team_id in range(1, team_count + 1):
+        team = _team(rng, team_id)
+        first_id = 8470000 + team_id * 100
+        team["roster"] = {
+            "roster": [
+                _roster_entry(player_id)
+                for player_id in range(first_id, first_id + roster_size)
+            ],
+            "link": f"/api/v1/teams/{team_id}/roster",
+        }
+        teams.append(team)
+    return {
+        "copyright": "NHL and the NHL Shield are registered trademarks.",
+        "teams": teams,
+    }
+
+
+def _schedule_team(rng: random.Random, team_id: int) -> dict:
+    wins, losses = rng.randint(0, 40), rng.randint(0, 40)
+    return {
+        "leagueRecord": {"wins": wins, "losses": losses, "ot": 3, "type": "league"},
+        "score": rng.randint(0, 6),
+        "team": {
+            "id": team_id,
+            "name": f"Team {team_id}",
+            "link": f"/api/v1/teams/{team_id}",
+        },
+    }
+
+
+@lru_cache(maxsize=None)
+def schedule_month(days: int = 30, games_per_day: int = 8) -> dict:
+    """
+    Builds a `schedule` payload covering a month of the regular season.
+
+    :param days: the number of days in the schedule
+    :param games_per_day: the number of games played each day
+    :return: the decoded JSON payload; callers must not mutate it
+    """
+    rng = random.Random(days)
+    dates = []
+    game_pk = 2022020001
+    for day in range(1, days + 1):
+        date = f"2022-11-{day:02d}"
+        games = []
+        for _ in range(games_per_day):
+            away, home = rng.sample(range(1, 33), 2)
+            games.append(
+                {
+                    "gamePk": game_pk,
+                    "link": f"/api/v1/game/{game_pk}/feed/live",
+                    "gameType": "R",
+                    "season": "20222023",
+                    "gameDate": f"{date}T00:00:00Z",
+                    "status": {
+                        "abstractGameState": "Final",
+                        "codedGameState": "7",
+                        "detailedState": "Final",
+                        "statusCode": "7",
+                        "startTimeTBD": False,
+                    },
+                    "teams": {
+                        "away": _schedule_team(rng, away),
+                        "home": _schedule_team(rng, home),
+                    },
+                    "venue": {"id": 5000 + home, "name": f"Arena {home}"},
+                    "content": {"link": f"/api/v1/game/{game_pk}/content"},
+                }
+            )
+            game_pk += 1
+        dates.append(
+            {
+                "date": date,
+                "totalItems": games_per_day,
+                "totalEvents": 0,
+                "totalGames": games_per_day,
+                "totalMatches": 0,
+                "games": games,
+                "events": [],
+                "matches": [],
+            }
+        )
+    total = days * games_per_day
+    return {
+        "copyright": "NHL and the NHL Shield are registered trademarks.",
+        "totalItems": total,
+        "totalEvents": 0,
+        "totalGames": total,
+        "totalMatches": 0,
+        "wait": 10,
+        "dates": dates,
+    }
@@ -0,0 +1,169 @@
+"""
+Load tests the live game streams of `nhl_web_app`: many clients follow the same
+game over Server-Sent Events, through the Django ASGI application, while a local
+stub stands in for the NHL API and counts the requests it gets.
+
+The game gains plays on every request and ends after `--polls` requests, so
+every client should receive every play, while the stub should only be polled
+`--polls` times whatever the number of clients.
+
+Run with `python -m benchmarks.load_live --clients 1 100 1000`.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+from benchmarks.fixtures import feed_live
+from benchmarks.server import mock_api
+from nhl_api_py.core.api import NhlApi
+
+GAME_ID = 2022020001
+PATH = f"/api/games/{GAME_ID}/live/"
+
+
+class StubGame:
+    """
+    Serves the feed of a game which gains plays on every request, and is final
+    after `polls` requests.
+    """
+
+    def __init__(self, polls: int):
+        self.bodies = [
+            json.dumps(
+                feed_live(
+                    GAME_ID,
+                    plays_per_period=5 * (poll + 1),
+                    state="Final" if poll == polls - 1 else "Live",
+                )
+            ).encode()
+            for poll in range(polls)
+        ]
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> bytes:
+        with self._lock:
+            body = self.bodies[min(self.requests, len(self.bodies) - 1)]
+            self.requests += 1
+        return body
+
+
+async def _client(application) -> tuple[int, int]:
+    """
+    Follows the game until its stream ends, like a browser's `EventSource`.
+
+    :param application: the ASGI application of the project
+    :return: the number of bytes and of events received
+    """
+    done = asyncio.Event()
+    request = {"type": "http.request", "body": b"", "more_body": False}
+    messages = iter([request])
+    received = [0, 0]
+
+    async def receive() -> dict:
+        message = next(messages, None)
+        if message is None:
+            await done.wait()
+            message = {"type": "http.disconnect"}
+        return message
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            received[0] += len(body)
+            received[1] += body.count(b"event: ")
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": PATH,
+        "raw_path": PATH.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"localhost"), (b"accept", b"text/event-stream")],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    await application(scope, receive, send)
+    done.set()
+    return received[0], received[1]
+
+
+async def _follow(application, live, clients: int) -> tuple[list, int]:
+    """
+    :return: what each client received, and the memory traced once they were all
+        connected
+    """
+    tasks = [asyncio.create_task(_client(application)) for _ in range(clients)]
+    feed = None
+    while not any(task.done() for task in tasks):
+        feed = feed or live.feeds.get(GAME_ID)
+        if feed is not None and len(feed) == clients:
+            break
+        await asyncio.sleep(0.001)
+    memory = tracemalloc.get_traced_memory()[0]
+    return await asyncio.gather(*tasks), memory
+
+
+def run(clients: int, polls: int, interval: float) -> None:
+    from api import views
+    from api.live import LiveGames
+
+    from nhl_web_app.asgi import application
+
+    stub = StubGame(polls)
+    feed_path = f"/api/v1/game/{GAME_ID}/feed/live"
+    routes = {feed_path: stub, f"{feed_path}/diffPatch": stub}
+    with mock_api(routes) as url, NhlApi() as api:
+        api.url = f"{url}/api/v1"
+        live = LiveGames(api, interval=interval)
+        views.live_games = lambda: live
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = perf_counter()
+        results, connected = asyncio.run(_follow(application, live, clients))
+        elapsed = perf_counter() - start
+        tracemalloc.stop()
+
+    sizes, events = zip(*results)
+    print(f"{clients} clients following one game of {polls} polls")
+    print(f"  {'upstream requests':<32} {stub.requests:>10}")
+    print(f"  {'upstream requests per client':<32} {stub.requests / clients:>10.3f}")
+    print(f"  {'events per client (min / max)':<32} {min(events):>4} / {max(events)}")
+    print(f"  {'bytes per client':<32} {sum(sizes) / clients:>10.0f}")
+    print(
+        f"  {'memory per connection':<32} {(connected - baseline) / clients:>10.0f} B"
+    )
+    print(f"  {'duration':<32} {elapsed:>10.2f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", nargs="+", type=int, default=[1, 100, 1000])
+    parser.add_argument("--polls", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.1)
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(Path(__file__).parents[1] / "nhl_web_app"))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "nhl_web_app.settings")
+    import django
+
+    django.setup()
+    for clients in args.clients:
+        run(clients, args.polls, args.interval)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+A local HTTP server standing in for the NHL API, so end-to-end benchmarks do not
+depend on the network.
+"""
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator, Union
+
+Body = Union[bytes, Callable[[], bytes]]
+
+
+def _handler(routes: dict[str, Body]) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are sent separately; without this, small responses
+        # wait on delayed ACKs for ~40 ms.
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            body = routes.get(self.path.split("?")[0])
+            if body is None:
+                self.send_error(404)
+                return
+            if callable(body):
+                body = body()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    return Handler
+
+
+@contextmanager
+def mock_api(routes: dict[str, Body]) -> Iterator[str]:
+    """
+    Serves JSON bodies on localhost, ignoring query strings.
+
+    :param routes: the body served for each path, e.g. `"/api/v1/teams"`, or a
+        function building the body of each request to that path
+    :return: the base URL of the server, e.g. `"http://127.0.0.1:8000"`
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(routes))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
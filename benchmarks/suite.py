@@ -0,0 +1,117 @@
+"""
+The benchmarks tracked over time by `python -m benchmarks`, covering the model
+layer and the client end to end.
+"""
+from __future__ import annotations
+
+import json
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Callable
+
+from benchmarks import fixtures
+from benchmarks.server import mock_api
+from nhl_api_py.core.api import NhlApi
+from nhl_api_py.core.utils import convert_keys_to_snake_case
+from nhl_api_py.models.base import _field_only_keys, to_dataframe
+from nhl_api_py.models.game import Boxscore, Game, LazyGame
+from nhl_api_py.models.schedule import ScheduleDate
+from nhl_api_py.models.team import Team
+
+GAME_ID = 2022020001
+
+
+@dataclass
+class Benchmark:
+    """
+    A single benchmark: a function timed without arguments.
+    """
+
+    group: str
+    name: str
+    func: Callable[[], object]
+
+    @property
+    def id(self) -> str:
+        return f"{self.group}/{self.name}"
+
+
+def _model_benchmarks() -> list[Benchmark]:
+    feed = fixtures.feed_live(GAME_ID)
+    feed_body = json.dumps(feed).encode()
+    boxscore = fixtures.boxscore(GAME_ID)
+    teams = fixtures.teams_with_roster()["teams"]
+    dates = fixtures.schedule_month()["dates"]
+    converted_teams = [convert_keys_to_snake_case(team) for team in teams]
+    game = Game.from_dict(feed)
+    return [
+        Benchmark("models", "Game.from_dict", lambda: Game.from_dict(feed)),
+        Benchmark("models", "Game.from_json", lambda: Game.from_json(feed_body)),
+        Benchmark(
+            "models",
+            "LazyGame.from_dict",
+            lambda: LazyGame.from_dict(feed).detailed_state,
+        ),
+        Benchmark("models", "Boxscore.from_dict", lambda: Boxscore.from_dict(boxscore)),
+        Benchmark(
+            "models",
+            "Team.from_dict (32 teams with roster)",
+            lambda: [Team.from_dict(team) for team in teams],
+        ),
+        Benchmark(
+            "models",
+            "ScheduleDate.from_dict (a month)",
+            lambda: [ScheduleDate.from_dict(date) for date in dates],
+        ),
+        Benchmark(
+            "utils",
+            "convert_keys_to_snake_case (feed/live)",
+            lambda: convert_keys_to_snake_case(feed),
+        ),
+        Benchmark(
+            "utils",
+            "_field_only_keys (32 teams)",
+            lambda: [_field_only_keys(team, Team) for team in converted_teams],
+        ),
+        Benchmark("pandas", "Game.to_series", lambda: game.to_series()),
+        Benchmark(
+            "pandas",
+            "Play.to_series (every play)",
+            lambda: [play.to_series() for play in game.all_plays],
+        ),
+        Benchmark(
+            "pandas",
+            "to_dataframe (every play)",
+            lambda: to_dataframe(game.all_plays),
+        ),
+    ]
+
+
+def _client_benchmarks(api: NhlApi) -> list[Benchmark]:
+    return [
+        Benchmark("client", "NhlApi.game", lambda: api.game(GAME_ID)),
+        Benchmark("client", "NhlApi.boxscore", lambda: api.boxscore(GAME_ID)),
+        Benchmark("client", "NhlApi.teams (roster)", lambda: api.teams(roster=True)),
+        Benchmark("client", "NhlApi.schedule (a month)", lambda: api.schedule()),
+    ]
+
+
+def collect(stack: ExitStack) -> list[Benchmark]:
+    """
+    Builds every benchmark, starting the local mock API they need.
+
+    :param stack: keeps the mock API running until it is closed
+    :return: all benchmarks
+    """
+    routes = {
+        f"/api/v1/game/{GAME_ID}/feed/live": fixtures.feed_live(GAME_ID),
+        f"/api/v1/game/{GAME_ID}/boxscore": fixtures.boxscore(GAME_ID),
+        "/api/v1/teams": fixtures.teams_with_roster(),
+        "/api/v1/schedule": fixtures.schedule_month(),
+    }
+    base_url = stack.enter_context(
+        mock_api({path: json.dumps(body).encode() for path, body in routes.items()})
+    )
+    api = stack.enter_context(NhlApi())
+    api.url = f"{base_url}/api/v1"
+    return _model_benchmarks() + _client_benchmarks(api)
@@ -1,68 +1,360 @@
 """
 NHL API client.
 """
+from __future__ import annotations
+
+import inspect
 import logging
-from typing import Iterable
+from functools import partial, wraps
+from itertools import count
+from time import perf_counter_ns, sleep
+from typing import Callable, ContextManager, Iterable, Iterator, Optional, TypeVar
 
-from requests import request
+import pandas as pd
+from requests import Response as RequestsResponse
+from requests import Session
 
+from nhl_api_py.core.batch import BatchResult, fan_out
+from nhl_api_py.core.cache import Cache, TtlPolicy, default_ttl_policy
+from nhl_api_py.core.decoder import Decoder
 from nhl_api_py.core.decorators import timing
 from nhl_api_py.core.error_exceptions import ResponseError
+from nhl_api_py.core.metrics import MetricsSink, NullSink, endpoint_name, timer
 from nhl_api_py.core.response import Response
-from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.core.session import create_session
+from nhl_api_py.core.singleflight import SingleFlight
+from nhl_api_py.core.streaming import iter_items
+from nhl_api_py.core.throttle import AdaptiveConcurrency, RetryPolicy, TokenBucket
+from nhl_api_py.models.base import to_dataframe
+from nhl_api_py.models.columnar import PlayColumns
+from nhl_api_py.models.game import Boxscore, Game, LazyGame, Play
+from nhl_api_py.models.query import PlayFilter
 from nhl_api_py.models.schedule import ScheduleDate
 from nhl_api_py.models.team import Team
 
 logger = logging.getLogger(__name__)
 
 
+def _raise_for_status(response: RequestsResponse) -> None:
+    """
+    Raises an error if the NHL API answered with a client or server error.
+
+    :param response: the response object from the `requests` package
+    """
+    if response.status_code // 100 in [4, 5]:
+        raise ResponseError(
+            f"{response.request.method} method returns HTTP status code "
+            + f"{response.status_code} on {response.url}",
+            status_code=response.status_code,
+        )
+
+
+T = TypeVar("T")
+
+
+def _shared(method: Callable[..., T]) -> Callable[..., T]:
+    """
+    Lets concurrent calls of a model method with the same arguments share the one
+    model built, if the client was created with `share_models=True`.
+
+    :param method: the model method of `NhlApi`
+    :return: the method, coalescing identical calls in flight
+    """
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapper(self: NhlApi, *args, **kwargs) -> T:
+        if self._model_flights is None:
+            return method(self, *args, **kwargs)
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        key = (method.__name__, repr(list(arguments.arguments.values())[1:]))
+        return self._model_flights.do(key, partial(method, self, *args, **kwargs))
+
+    return wrapper
+
+
 class NhlApi:
     """
     Class representing the NHL API.
+
+    All requests go through a single pooled, keep-alive session which is owned by
+    the instance. Use it as a context manager (or call `close`) to release the
+    underlying connections once you are done with it.
+
+    Requests can be throttled with a rate limiter and an adaptive concurrency
+    limit (see `nhl_api_py.core.throttle`). Both apply to every call, including
+    batch calls and the calls of an `AsyncNhlApi` built on this instance, and
+    can be shared by several instances to limit them together.
     """
 
     _base_url: str = "https://statsapi.web.nhl.com/api"
 
-    def __init__(self, api_version: int = 1):
+    def __init__(
+        self,
+        api_version: int = 1,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: float = 60,
+        session: Session = None,
+        cache: Cache = None,
+        ttl_policy: TtlPolicy = default_ttl_policy,
+        decoder: Decoder = None,
+        metrics: MetricsSink = None,
+        rate_limiter: TokenBucket = None,
+        concurrency: AdaptiveConcurrency = None,
+        retry: RetryPolicy = None,
+        single_flight: bool = True,
+        share_models: bool = False,
+        decode_models: bool = False,
+    ):
+        """
+        :param api_version: the version of the NHL API to use
+        :param pool_connections: the number of hosts to keep connection pools for
+        :param pool_maxsize: the maximum number of connections kept open per host
+        :param pool_block: whether to wait for a free connection once a host has
+            `pool_maxsize` connections in use
+        :param max_retries: how many times a request is retried on connection
+            errors and retryable status codes
+        :param backoff_factor: the exponential backoff factor between retries
+        :param timeout: the number of seconds to wait for the server to respond
+        :param session: an existing session to use instead of creating one; it is
+            not closed by `close`
+        :param cache: where successful responses are cached, if at all
+        :param ttl_policy: decides how many seconds a cached response stays fresh
+            for, given its endpoint and the response itself
+        :param decoder: decodes the JSON bodies of responses, defaults to the
+            fastest installed JSON library (see `nhl_api_py.core.decoder`)
+        :param metrics: where the timings, sizes and counts of requests are
+            recorded (see `nhl_api_py.core.metrics`), if anywhere
+        :param rate_limiter: limits the number of requests sent per second, if set
+        :param concurrency: limits the number of requests in flight, adapting the
+            limit to the latency and errors of the responses, if set
+        :param retry: decides which responses are retried and how long to wait
+            first, defaults to jittered exponential backoff honoring `Retry-After`
+            with `max_retries` and `backoff_factor`. If an existing `session` is
+            given, it may retry these status codes at the transport level too.
+        :param single_flight: whether concurrent `get` calls of the same endpoint
+            share the one request in flight, and its `Response`
+        :param share_models: whether concurrent identical calls of the model
+            methods (e.g. `game`) share the one model built, which callers must
+            then not modify
+        :param decode_models: whether the model methods decode response bodies
+            straight into models (see `Model.from_json`), rather than into
+            dictionaries first; responses then keep their raw body, and only
+            decode `data` when it is read (e.g. by a TTL policy)
+        """
         self.url: str = f"{NhlApi._base_url}/v{api_version}"
+        self.timeout = timeout
+        self.max_workers = pool_maxsize
+        self.cache = cache
+        self.ttl_policy = ttl_policy
+        self.decoder = decoder
+        self.metrics: MetricsSink = metrics or NullSink()
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.retry = retry or RetryPolicy(max_retries, backoff_factor)
+        self.single_flight = single_flight
+        self.share_models = share_models
+        self.decode_models = decode_models
+        self._flights: Optional[SingleFlight[Response]] = (
+            SingleFlight() if single_flight else None
+        )
+        self._model_flights: Optional[SingleFlight] = (
+            SingleFlight() if share_models else None
+        )
+        self._owns_session = session is None
+        # Status codes are retried by `_request`, where retries go through the
+        # rate and concurrency limits; the transport only retries connections.
+        self.session: Session = session or create_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            retry_status_codes=(),
+        )
+
+    def __enter__(self) -> NhlApi:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the pooled connections held by the session, if the session was
+        created by this instance.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def _throttle(self, tags: dict) -> None:
+        """
+        Waits until the rate limiter lets one more request through, if one is set.
+
+        :param tags: the labels of the request's series
+        """
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire()
+            if waited > 0:
+                self.metrics.observe("throttle_seconds", waited, tags)
+
+    def _send(
+        self, http_method: str, url: str, headers: dict, tags: dict
+    ) -> RequestsResponse:
+        """
+        Sends an HTTP request once, within the rate and concurrency limits.
+
+        :param http_method: the request method used
+        :param url: the full URL of the request
+        :param headers: any extra headers to send with the request
+        :param tags: the labels of the request's series
+        :return: the response object from the `requests` package
+        """
+        self._throttle(tags)
+        if self.concurrency is not None:
+            self.concurrency.acquire()
+        status_code = None
+        start = perf_counter_ns()
+        try:
+            data = self.session.request(
+                http_method, url, headers=headers, timeout=self.timeout
+            )
+            status_code = data.status_code
+        finally:
+            seconds = (perf_counter_ns() - start) / 1e9
+            if self.concurrency is not None:
+                self.concurrency.release(seconds, status_code)
+        status_tags = {**tags, "status": str(status_code)}
+        self.metrics.observe("request_seconds", seconds, status_tags)
+        self.metrics.increment("responses", tags=status_tags)
+        return data
 
     @timing
-    def _request(self, http_method: str, endpoint: str) -> Response:
+    def _request(
+        self, http_method: str, endpoint: str, headers: dict = None
+    ) -> Response:
         """
-        Sends an HTTP request to the NHL API.
+        Sends an HTTP request to the NHL API, and sends it again while the
+        response is retryable (see `RetryPolicy`).
 
         :param http_method: the request method used
         :param endpoint: where we want to connect to with the API
+        :param headers: any extra headers to send with the request
         :return: the data / response returned by the API
         """
         url = f"{self.url}/{endpoint}"
         logger.debug(f"{http_method} request sent to: {url}")
-        data = request(http_method, url, timeout=60)
-
-        if data.status_code // 100 in [4, 5]:
-            raise ResponseError(
-                f"{data.request.method} method returns HTTP status code "
-                + f"{data.status_code} on {data.url}"
+        tags = {"endpoint": endpoint_name(endpoint)}
+        for attempt in count():
+            data = self._send(http_method, url, headers, tags)
+            delay = self.retry.backoff(
+                attempt, data.status_code, data.headers.get("Retry-After")
+            )
+            if delay is None:
+                break
+            logger.info(
+                f"{url} returned HTTP status code {data.status_code}, "
+                + f"retrying in {delay:.2f} seconds"
+            )
+            self.metrics.increment(
+                "retries", tags={**tags, "status": str(data.status_code)}
+            )
+            sleep(delay)
+        self.metrics.observe("response_bytes", len(data.content), tags)
+        _raise_for_status(data)
+        with timer(self.metrics, "decode_seconds", tags):
+            return Response.from_requests(
+                data, decoder=self.decoder, lazy=self.decode_models
             )
-        else:
-            return Response.from_requests(data)
 
-    def get(self, endpoint: str) -> Response:
+    def _content(self, response: Response) -> Optional[bytes]:
+        """
+        :param response: the response models are built from
+        :return: the raw body to decode the models from, or None if they are built
+            from the decoded data
+        """
+        return response.content if self.decode_models else None
+
+    def _parsing(self, model: str) -> ContextManager[None]:
+        """
+        Records how long building models from a response takes.
+
+        :param model: the name of the model being built
+        """
+        return timer(self.metrics, "parse_seconds", {"model": model})
+
+    def get(self, endpoint: str, use_cache: bool = True) -> Response:
         """
         Sends a GET request to a specific endpoint to the NHL API.
 
+        If a cache is set, a fresh cached response is returned instead of sending
+        the request, and successful responses are cached for as long as the TTL
+        policy allows. A cached response which is no longer fresh is revalidated
+        with the `ETag` / `Last-Modified` the server sent with it; if the server
+        answers 304 Not Modified, the cached response is reused.
+
+        Unless the client was created with `single_flight=False`, a call made
+        while a request to the same endpoint is in flight (e.g. from another
+        thread) waits for that request and returns the same `Response`. Only
+        calls with the same `use_cache` are coalesced, so a call bypassing the
+        cache never gets a response served from it.
+
+        :param endpoint: where we want to connect to with the API
+        :param use_cache: whether the cache is used for this request, if one is set
+        :return: the data / response returned by the API
+        """
+        if self._flights is None:
+            return self._get(endpoint, use_cache)
+        response, shared = self._flights.call(
+            (endpoint, use_cache), partial(self._get, endpoint, use_cache)
+        )
+        if shared:
+            tags = {"endpoint": endpoint_name(endpoint)}
+            self.metrics.increment("coalesced", tags=tags)
+        return response
+
+    def _get(self, endpoint: str, use_cache: bool) -> Response:
+        """
+        Sends a GET request, going through the cache if one is set.
+
         :param endpoint: where we want to connect to with the API
+        :param use_cache: whether the cache is used for this request, if one is set
         :return: the data / response returned by the API
         """
-        return self._request("GET", endpoint)
+        if self.cache is None or not use_cache:
+            return self._request("GET", endpoint)
+        tags = {"endpoint": endpoint_name(endpoint)}
+        entry = self.cache.get(endpoint)
+        if entry is not None and entry.fresh:
+            logger.debug(f"Cache hit for {endpoint}")
+            self.metrics.increment("cache", tags={**tags, "result": "hit"})
+            return entry.response
+        headers = entry.response.conditional_headers() if entry is not None else None
+        response = self._request("GET", endpoint, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"{endpoint} was not modified, reusing cached response")
+            self.metrics.increment("cache", tags={**tags, "result": "revalidated"})
+            response = entry.response
+        else:
+            self.metrics.increment("cache", tags={**tags, "result": "miss"})
+        if response.status_code == 200:
+            self.cache.set(endpoint, response, self.ttl_policy(endpoint, response))
+        return response
 
+    @_shared
     def teams(
         self,
         team_ids: list[int] | int = None,
         season: int = None,
         roster: bool = None,
         stats: bool = None,
-    ) -> Response:
+        as_dataframe: bool = False,
+    ) -> list[Team] | pd.DataFrame:
         """
         Sends a GET request to retrieve team data from the NHL API.
 
@@ -83,6 +375,8 @@ class NhlApi:
         :param season: the start year of the season
         :param roster: whether the teams entire roster should be included
         :param stats: whether the teams season stats will be included
+        :param as_dataframe: whether the teams should be returned as a pandas
+            DataFrame, one row per team
         :return: data on all NHL teams
         """
         logger.debug((team_ids, season, roster, stats))
@@ -99,31 +393,48 @@ class NhlApi:
         if stats:
             teams_endpoint += "expand=team.stats&"
         response = self.get(teams_endpoint)
-        data = response.data.get("teams", [])
-        if len(data) == 0:
+        content = self._content(response)
+        with self._parsing("Team"):
+            if content is not None:
+                teams = Team.list_from_json(content, "teams")
+            else:
+                teams = [
+                    Team.from_dict(entry) for entry in response.data.get("teams", [])
+                ]
+        if len(teams) == 0:
             logger.warning(
                 "Response Data did not have proper team data. "
                 + "Either the `teams` key was missing or no data exists."
             )
             logger.debug(response.data)
-        return [Team.from_dict(team_entry) for team_entry in data]
+        return to_dataframe(teams) if as_dataframe else teams
 
+    @_shared
     def game(
         self,
         game_id: int,
+        lazy: bool = False,
     ) -> Game:
         """
         Sends a GET request to retrieve game data from the NHL API.
 
         :param game_id: the ID of the specific game for which we want to see data.
+        :param lazy: whether the game's players, plays and boxscore are only parsed
+            once they are first read (see `LazyGame`).
         :return: Game model.
         """
         logger.debug(game_id)
 
         games_endpoint = "game/" + str(game_id) + "/feed/live"
         response = self.get(games_endpoint)
-        return Game.from_dict(response.data)
+        cls = LazyGame if lazy else Game
+        content = self._content(response)
+        with self._parsing(cls.__name__):
+            if content is not None and not lazy:
+                return cls.from_json(content)
+            return cls.from_dict(response.data)
 
+    @_shared
     def boxscore(
         self,
         game_id: int,
@@ -138,20 +449,28 @@ class NhlApi:
 
         games_endpoint = "game/" + str(game_id) + "/boxscore"
         response = self.get(games_endpoint)
-        return Boxscore.from_dict(response.data)
+        content = self._content(response)
+        with self._parsing("Boxscore"):
+            if content is not None:
+                return Boxscore.from_json(content)
+            return Boxscore.from_dict(response.data)
 
+    @_shared
     def plays(
         self,
         game_id: int,
         scoring_plays_only: bool = False,
         penalty_plays_only: bool = False,
-    ) -> list[Play]:
+        as_dataframe: bool = False,
+    ) -> list[Play] | pd.DataFrame:
         """
         Sends a GET request to retrieve plays data from the NHL API.
 
         :param game_id: the ID of the specific game for which we want to see data.
         :param scoring_plays_only: whether the response contains scoring plays.
         :param penalty_plays_only: whether the response contains penalty plays.
+        :param as_dataframe: whether the plays should be returned as a pandas
+            DataFrame, one row per play.
         :return: list of Play model.
         """
         response = self.game(game_id=game_id)
@@ -162,22 +481,164 @@ class NhlApi:
                 + "Either the `game_id` was invalid or no data exists."
             )
             logger.debug(response)
-            return []
+            return to_dataframe([]) if as_dataframe else []
         plays_to_return = []
         plays_to_return += response.scoring_plays if scoring_plays_only else []
         plays_to_return += response.penalty_plays if penalty_plays_only else []
-        if len(plays_to_return) == 0:
-            return data
-        else:
-            return [data[play_index] for play_index in plays_to_return]
+        if len(plays_to_return) > 0:
+            data = [data[play_index] for play_index in plays_to_return]
+        return to_dataframe(data) if as_dataframe else data
+
+    def stream_plays(self, game_id: int) -> Iterator[Play]:
+        """
+        Sends a GET request to retrieve plays data from the NHL API, and parses
+        the plays one by one as the response is downloaded (see
+        `nhl_api_py.core.streaming`), rather than decoding the whole feed first.
+
+        Only one play is held in memory at a time, so this suits exporting the
+        plays of many games. The response is never cached, nor retried. The
+        request is only sent once the generator is first iterated, and counts
+        towards the rate limit and the concurrency limit, whose slot it holds
+        until the generator ends.
+
+        :param game_id: the ID of the specific game for which we want to see data.
+        :return: a generator of Play models, in the order of the game.
+        """
+        url = f"{self.url}/game/{game_id}/feed/live"
+        logger.debug(f"GET request streamed from: {url}")
+        tags = {"endpoint": endpoint_name(f"game/{game_id}/feed/live")}
+        self._throttle(tags)
+        if self.concurrency is not None:
+            self.concurrency.acquire()
+        status_code = latency = None
+        start = perf_counter_ns()
+        try:
+            # Closing the response releases its connection: it goes back to the
+            # pool once the body was read to the end, and is discarded if the
+            # generator is closed before that.
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                latency = (perf_counter_ns() - start) / 1e9
+                status_code = response.status_code
+                self.metrics.increment(
+                    "responses", tags={**tags, "status": str(status_code)}
+                )
+                _raise_for_status(response)
+                for play in iter_items(
+                    response, "liveData.plays.allPlays", decoder=self.decoder
+                ):
+                    yield Play.from_dict(play)
+        finally:
+            if self.concurrency is not None:
+                # The limit adapts to the time until the response started, not to
+                # how long the body took to be read.
+                if latency is None:
+                    latency = (perf_counter_ns() - start) / 1e9
+                self.concurrency.release(latency, status_code)
+
+    def play_columns(self, game_id: int, query: PlayFilter = None) -> PlayColumns:
+        """
+        Sends a GET request to retrieve plays data from the NHL API, and keeps it
+        as typed columns rather than as `Play` models.
+
+        :param game_id: the ID of the specific game for which we want to see data.
+        :param query: if given, only the plays matching this filter are kept
+            (see `nhl_api_py.models.query`).
+        :return: the game's plays as columns.
+        """
+        logger.debug(game_id)
+
+        games_endpoint = "game/" + str(game_id) + "/feed/live"
+        response = self.get(games_endpoint)
+        with self._parsing("PlayColumns"):
+            columns = PlayColumns.from_feed(response.data)
+        return query.select(columns) if query is not None else columns
+
+    def games(
+        self,
+        game_ids: Iterable[int],
+        max_workers: int = None,
+        ordered: bool = False,
+        lazy: bool = False,
+    ) -> Iterator[BatchResult[Game]]:
+        """
+        Retrieves game data for many games at once, fanning the requests out across
+        a thread pool. A game that fails to be retrieved does not stop the batch;
+        its error is kept on its result instead.
+
+        :param game_ids: the IDs of the games for which we want to see data.
+        :param max_workers: the number of requests sent at once, defaults to the
+            session's maximum pool size
+        :param ordered: whether results are yielded in the order of `game_ids`,
+            rather than as soon as each one completes
+        :param lazy: whether each game is parsed lazily (see `NhlApi.game`)
+        :return: a generator of results, each holding a Game model or an error.
+        """
+        return fan_out(
+            partial(self.game, lazy=lazy),
+            game_ids,
+            max_workers or self.max_workers,
+            ordered=ordered,
+        )
+
+    def boxscores(
+        self,
+        game_ids: Iterable[int],
+        max_workers: int = None,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult[Boxscore]]:
+        """
+        Retrieves boxscore data for many games at once. See `games`.
+
+        :param game_ids: the IDs of the games for which we want to see data.
+        :param max_workers: the number of requests sent at once, defaults to the
+            session's maximum pool size
+        :param ordered: whether results are yielded in the order of `game_ids`,
+            rather than as soon as each one completes
+        :return: a generator of results, each holding a Boxscore model or an error.
+        """
+        return fan_out(
+            self.boxscore, game_ids, max_workers or self.max_workers, ordered=ordered
+        )
+
+    def plays_many(
+        self,
+        game_ids: Iterable[int],
+        scoring_plays_only: bool = False,
+        penalty_plays_only: bool = False,
+        max_workers: int = None,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult[list[Play]]]:
+        """
+        Retrieves plays data for many games at once. See `games` and `plays`.
+
+        :param game_ids: the IDs of the games for which we want to see data.
+        :param scoring_plays_only: whether the response contains scoring plays.
+        :param penalty_plays_only: whether the response contains penalty plays.
+        :param max_workers: the number of requests sent at once, defaults to the
+            session's maximum pool size
+        :param ordered: whether results are yielded in the order of `game_ids`,
+            rather than as soon as each one completes
+        :return: a generator of results, each holding a list of Play models or an
+            error.
+        """
+        plays = partial(
+            self.plays,
+            scoring_plays_only=scoring_plays_only,
+            penalty_plays_only=penalty_plays_only,
+        )
+        return fan_out(
+            plays, game_ids, max_workers or self.max_workers, ordered=ordered
+        )
 
+    @_shared
     def schedule(
         self,
         team_ids: list[int] | int = None,
         season_start_year: int = None,
         game_type: str = None,
         date_range: Iterable[str] = None,
-    ) -> list[ScheduleDate]:
+        as_dataframe: bool = False,
+    ) -> list[ScheduleDate] | pd.DataFrame:
         """
         Sends a GET request to retrieve a schedule of games/events for a
         specified date range.
@@ -190,6 +651,8 @@ class NhlApi:
             regular season games ("R")
         :param date_range: searches for games specified within a specific
             range of dates
+        :param as_dataframe: whether the dates should be returned as a pandas
+            DataFrame, one row per date
         :return: a list of dates which keep info about the games played on a day
         """
         schedule_endpoint = "schedule?"
@@ -204,5 +667,11 @@ class NhlApi:
         if date_range:
             schedule_endpoint += f"startDate={game_type[0]}&endDate={date_range[1]}&"
         response = self.get(schedule_endpoint)
-        all_dates = response.data.get("dates", [])
-        return [ScheduleDate.from_dict(date) for date in all_dates]
+        content = self._content(response)
+        with self._parsing("ScheduleDate"):
+            if content is not None:
+                dates = ScheduleDate.list_from_json(content, "dates")
+            else:
+                all_dates = response.data.get("dates", [])
+                dates = [ScheduleDate.from_dict(date) for date in all_dates]
+        return to_dataframe(dates) if as_dataframe else dates
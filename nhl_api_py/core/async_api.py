@@ -0,0 +1,259 @@
+"""
+Asynchronous NHL API client.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Hashable, Iterable, TypeVar
+
+from nhl_api_py.core.api import NhlApi
+from nhl_api_py.core.response import Response
+from nhl_api_py.core.throttle import AdaptiveConcurrency, TokenBucket
+from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.models.schedule import ScheduleDate
+from nhl_api_py.models.team import Team
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncNhlApi:
+    """
+    Class representing the NHL API for use with `asyncio`.
+
+    It has the same surface as `NhlApi` and returns the same models.
+    Every call (the HTTP request and the model parsing) runs on a dedicated
+    thread pool sharing one pooled `NhlApi` session, so the event loop is never
+    blocked. At most `max_concurrency` calls are in flight at any time; any
+    further calls wait for a free slot, which makes it safe to `asyncio.gather`
+    thousands of them at once. The rate limiter and adaptive concurrency limit
+    of the synchronous client apply on top of that.
+
+    Identical calls made while one is in flight await that call instead of
+    taking a slot of their own: `get` calls of the same endpoint always do
+    (unless the synchronous client was created with `single_flight=False`), and
+    model calls with the same arguments do if models are shared.
+    """
+
+    def __init__(
+        self,
+        api_version: int = 1,
+        max_concurrency: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: float = 60,
+        api: NhlApi = None,
+        rate_limiter: TokenBucket = None,
+        concurrency: AdaptiveConcurrency = None,
+        share_models: bool = False,
+        decode_models: bool = False,
+    ):
+        """
+        :param api_version: the version of the NHL API to use
+        :param max_concurrency: the maximum number of requests in flight at once
+        :param max_retries: how many times a request is retried on connection
+            errors and retryable status codes
+        :param backoff_factor: the exponential backoff factor between retries
+        :param timeout: the number of seconds to wait for the server to respond
+        :param api: an existing synchronous client to send the requests with; it
+            is not closed by `close`
+        :param rate_limiter: limits the number of requests sent per second, if
+            set; ignored if `api` is given
+        :param concurrency: limits the number of requests in flight, adapting the
+            limit to the latency and errors of the responses, if set; ignored if
+            `api` is given
+        :param share_models: whether identical model calls in flight share the one
+            model built, which callers must then not modify; ignored if `api` is
+            given
+        :param decode_models: whether models are decoded straight from response
+            bodies (see `NhlApi`); ignored if `api` is given
+        """
+        self.max_concurrency = max_concurrency
+        self._owns_api = api is None
+        self.api: NhlApi = api or NhlApi(
+            api_version=api_version,
+            pool_maxsize=max_concurrency,
+            pool_block=True,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            concurrency=concurrency,
+            share_models=share_models,
+            decode_models=decode_models,
+        )
+        self._flights: dict[Hashable, asyncio.Future] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="nhl-api"
+        )
+
+    async def __aenter__(self) -> AsyncNhlApi:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Waits for the worker threads to finish and closes the pooled connections,
+        if the synchronous client was created by this instance.
+        """
+        await asyncio.get_running_loop().run_in_executor(
+            None, partial(self._executor.shutdown, wait=True)
+        )
+        if self._owns_api:
+            self.api.close()
+
+    async def _run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Runs one of the synchronous client's methods on the worker threads once a
+        concurrency slot is free.
+
+        :param func: the method we want to run
+        :return: whatever the method returns
+        """
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, partial(func, *args, **kwargs)
+            )
+
+    async def _coalesced(self, key: Hashable, func: Callable[..., T], **kwargs) -> T:
+        """
+        Runs one of the synchronous client's methods like `_run`, unless an
+        identical call is in flight, whose result is awaited instead.
+
+        :param key: identifies the calls which are duplicates of each other
+        :param func: the method we want to run
+        :return: whatever the method returns
+        """
+        future = self._flights.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run(func, **kwargs))
+            self._flights[key] = future
+            future.add_done_callback(partial(self._forget, key))
+        # A cancelled caller must not cancel the call the others are awaiting.
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._flights.get(key) is future:
+            del self._flights[key]
+        if not future.cancelled():
+            # Retrieves the error, in case every caller was cancelled.
+            future.exception()
+
+    async def _model(self, func: Callable[..., T], **kwargs) -> T:
+        """
+        Runs one of the synchronous client's model methods, sharing identical
+        calls in flight if the client shares models.
+
+        :param func: the model method we want to run
+        :return: the model(s) the method builds
+        """
+        if not self.api.share_models:
+            return await self._run(func, **kwargs)
+        return await self._coalesced((func.__name__, repr(kwargs)), func, **kwargs)
+
+    async def get(self, endpoint: str) -> Response:
+        """
+        Sends a GET request to a specific endpoint to the NHL API.
+
+        :param endpoint: where we want to connect to with the API
+        :return: the data / response returned by the API
+        """
+        if not self.api.single_flight:
+            return await self._run(self.api.get, endpoint)
+        return await self._coalesced(("get", endpoint), self.api.get, endpoint=endpoint)
+
+    async def teams(
+        self,
+        team_ids: list[int] | int = None,
+        season: int = None,
+        roster: bool = None,
+        stats: bool = None,
+    ) -> list[Team]:
+        """
+        Retrieves team data from the NHL API. See `NhlApi.teams`.
+
+        :param team_ids: all the specific teams we want to see data for
+        :param season: the start year of the season
+        :param roster: whether the teams entire roster should be included
+        :param stats: whether the teams season stats will be included
+        :return: data on all NHL teams
+        """
+        return await self._model(
+            self.api.teams, team_ids=team_ids, season=season, roster=roster, stats=stats
+        )
+
+    async def game(self, game_id: int, lazy: bool = False) -> Game:
+        """
+        Retrieves game data from the NHL API. See `NhlApi.game`.
+
+        :param game_id: the ID of the specific game for which we want to see data.
+        :param lazy: whether the game's heaviest sections are parsed on first read
+        :return: Game model.
+        """
+        return await self._model(self.api.game, game_id=game_id, lazy=lazy)
+
+    async def boxscore(self, game_id: int) -> Boxscore:
+        """
+        Retrieves boxscore data from the NHL API. See `NhlApi.boxscore`.
+
+        :param game_id: the ID of the specific game for which we want to see data.
+        :return: Boxscore model.
+        """
+        return await self._model(self.api.boxscore, game_id=game_id)
+
+    async def plays(
+        self,
+        game_id: int,
+        scoring_plays_only: bool = False,
+        penalty_plays_only: bool = False,
+    ) -> list[Play]:
+        """
+        Retrieves plays data from the NHL API. See `NhlApi.plays`.
+
+        :param game_id: the ID of the specific game for which we want to see data.
+        :param scoring_plays_only: whether the response contains scoring plays.
+        :param penalty_plays_only: whether the response contains penalty plays.
+        :return: list of Play model.
+        """
+        return await self._model(
+            self.api.plays,
+            game_id=game_id,
+            scoring_plays_only=scoring_plays_only,
+            penalty_plays_only=penalty_plays_only,
+        )
+
+    async def schedule(
+        self,
+        team_ids: list[int] | int = None,
+        season_start_year: int = None,
+        game_type: str = None,
+        date_range: Iterable[str] = None,
+    ) -> list[ScheduleDate]:
+        """
+        Retrieves a schedule of games/events from the NHL API.
+        See `NhlApi.schedule`.
+
+        :param team_ids: limits the schedule to the specific team(s) inserted
+        :param season_start_year: the start year of the specific NHL Season you want
+            to look at
+        :param game_type: limits the schedule to specific type of games, such as
+            regular season games ("R")
+        :param date_range: searches for games specified within a specific
+            range of dates
+        :return: a list of dates which keep info about the games played on a day
+        """
+        return await self._model(
+            self.api.schedule,
+            team_ids=team_ids,
+            season_start_year=season_start_year,
+            game_type=game_type,
+            date_range=date_range,
+        )
@@ -0,0 +1,78 @@
+"""
+Helpers for fanning many NHL API calls out across a thread pool.
+"""
+from __future__ import annotations
+
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Iterable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """
+    The outcome of a single call in a batch: either its value or the error it
+    raised, along with the key (e.g. the game ID) it was called with.
+    """
+
+    key: Hashable
+    value: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def fan_out(
+    func: Callable[[Hashable], T],
+    keys: Iterable[Hashable],
+    max_workers: int,
+    ordered: bool = False,
+) -> Iterator[BatchResult[T]]:
+    """
+    Calls `func` once per key across a pool of threads and yields the results.
+
+    A call raising an exception does not stop the batch; the exception is
+    attached to that key's result instead. If the generator is closed early, any
+    calls that have not started yet are cancelled. Results are not kept once
+    they are yielded, so a large batch only holds the results not consumed yet.
+
+    :param func: the function to call with each key
+    :param keys: the keys we want to call the function with
+    :param max_workers: the number of threads used to make the calls
+    :param ordered: whether results are yielded in the same order as `keys`,
+        rather than as soon as each call completes
+    :return: a generator of results, one per key
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures: dict[Future, Hashable] = {
+            executor.submit(func, key): key for key in keys
+        }
+        done = _in_order(deque(futures)) if ordered else as_completed(futures)
+        for future in done:
+            key = futures.pop(future)
+            try:
+                yield BatchResult(key, value=future.result())
+            except Exception as error:
+                logger.warning(f"Batch call for {key} failed: {error}")
+                yield BatchResult(key, error=error)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _in_order(futures: deque[Future]) -> Iterator[Future]:
+    """
+    :param futures: the futures, in the order they were submitted
+    :return: the futures in that order, each one dropped from the queue once it
+        is yielded
+    """
+    while futures:
+        yield futures.popleft()
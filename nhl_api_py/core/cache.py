@@ -0,0 +1,309 @@
+"""
+Response caches used by `NhlApi.get`, and the policy deciding how long
+responses stay fresh.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from time import time
+from typing import Callable, NamedTuple, Optional
+
+from nhl_api_py.core.response import Response
+
+logger = logging.getLogger(__name__)
+
+LIVE_TTL = 10
+DEFAULT_TTL = 5 * 60
+TEAMS_TTL = 6 * 60 * 60
+
+# How long unused entries are kept, and how large a disk cache grows, by default.
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# The minimum number of seconds between two prunings of a disk cache.
+PRUNE_INTERVAL = 60
+
+TtlPolicy = Callable[[str, Response], Optional[float]]
+
+
+class CacheEntry(NamedTuple):
+    """
+    A cached response, along with the time at which it stops being fresh.
+    """
+
+    response: Response
+    expires_at: Optional[float] = None
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at is None or time() < self.expires_at
+
+
+class Cache(ABC):
+    """
+    Base class for all response caches. Responses are keyed on the endpoint they
+    were retrieved from, and stay fresh for a number of seconds.
+
+    Entries which are no longer fresh are still returned, so that they can be
+    revalidated with the server rather than downloaded again.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:  # pragma: no cover
+        """
+        Looks up a cached response.
+
+        :param key: the endpoint the response was retrieved from
+        :return: the cached entry, or None if it is missing
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(
+        self, key: str, response: Response, ttl: Optional[float]
+    ) -> None:  # pragma: no cover
+        """
+        Stores a response in the cache.
+
+        :param key: the endpoint the response was retrieved from
+        :param response: the response we want to cache
+        :param ttl: the number of seconds the response stays fresh for, or None if
+            it never expires
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:  # pragma: no cover
+        """
+        Removes a response from the cache, if it exists.
+
+        :param key: the endpoint the response was retrieved from
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:  # pragma: no cover
+        """
+        Removes all responses from the cache.
+        """
+        raise NotImplementedError
+
+
+def _expires_at(ttl: Optional[float]) -> Optional[float]:
+    return None if ttl is None else time() + ttl
+
+
+class MemoryCache(Cache):
+    """
+    An in-memory cache which evicts the least recently used response once it
+    holds `maxsize` responses, and responses which have not been used for
+    `max_age` seconds. It is safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int = 1024, max_age: Optional[float] = None):
+        """
+        :param maxsize: the maximum number of responses kept in memory
+        :param max_age: the number of seconds a response is kept without being
+            used, or None to keep it until it is the least recently used one
+        """
+        self.maxsize = maxsize
+        self.max_age = max_age
+        # Each entry along with the time it was last used, least recently used
+        # first.
+        self._entries: OrderedDict[str, tuple[CacheEntry, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            self._prune()
+            found = self._entries.get(key)
+            if found is None:
+                return None
+            self._entries[key] = found[0], time()
+            self._entries.move_to_end(key)
+            return found[0]
+
+    def set(self, key: str, response: Response, ttl: Optional[float]) -> None:
+        with self._lock:
+            self._entries[key] = CacheEntry(response, _expires_at(ttl)), time()
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self._prune()
+
+    def _prune(self) -> None:
+        if self.max_age is None:
+            return
+        unused_since = time() - self.max_age
+        while self._entries and next(iter(self._entries.values()))[1] < unused_since:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache(Cache):
+    """
+    A persistent cache which stores each response as a JSON file in a directory,
+    so cached responses survive restarts and can be shared between processes.
+
+    The directory is pruned when responses are stored, at most once every
+    `PRUNE_INTERVAL` seconds: responses which have not been used for `max_age`
+    seconds are removed, then the least recently used ones until the directory
+    holds at most `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_age: Optional[float] = DEFAULT_MAX_AGE,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+    ):
+        """
+        :param directory: the directory the responses are stored in; it is
+            created if it does not exist
+        :param max_age: the number of seconds a response is kept without being
+            used, or None to keep it regardless of its age
+        :param max_bytes: the maximum size of the stored responses, or None to
+            keep them regardless of their size
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._pruned_at: Optional[float] = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        try:
+            # Marks the entry as used, so pruning keeps it.
+            os.utime(path)
+        except OSError:
+            pass
+        # Entries written before headers were stored have none.
+        headers = entry.get("headers", {})
+        response = Response(entry["status_code"], entry["data"], headers)
+        return CacheEntry(response, entry["expires_at"])
+
+    def set(self, key: str, response: Response, ttl: Optional[float]) -> None:
+        entry = {
+            "key": key,
+            "expires_at": _expires_at(ttl),
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "data": response.data,
+        }
+        # Write to a temporary file first, so readers never see a partial entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(entry, file)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        if self._pruned_at is None or time() - self._pruned_at >= PRUNE_INTERVAL:
+            self.prune()
+
+    def prune(self) -> None:
+        """
+        Removes the responses which have not been used for `max_age` seconds,
+        then the least recently used ones until the directory holds at most
+        `max_bytes`.
+        """
+        self._pruned_at = now = time()
+        files = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        # Most recently used first.
+        files.sort(reverse=True)
+        total = 0
+        for used_at, size, path in files:
+            total += size
+            too_old = self.max_age is not None and now - used_at > self.max_age
+            too_large = self.max_bytes is not None and total > self.max_bytes
+            if too_old or too_large:
+                logger.debug(f"Evicting {path.name} from the cache")
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+_GAME_FEED = re.compile(r"^game/\d+/feed/live")
+# A game's ID starts with the year its season starts in.
+_GAME = re.compile(r"^game/(\d{4})\d+/")
+_TEAMS = re.compile(r"^teams(\?|$)")
+_SEASON = re.compile(r"season=\d{4}(\d{4})")
+
+
+def default_ttl_policy(endpoint: str, response: Response) -> Optional[float]:
+    """
+    Decides how long a response stays fresh, based on the data it holds:
+
+    - the feed of a final game never changes, so it never expires
+    - the data of a game from a past season never changes, so it never expires
+    - any other game data may change at any moment, so it expires in seconds
+    - the teams of a past season never change, so they never expire
+    - the current teams list expires in hours
+    - everything else expires in minutes
+
+    :param endpoint: the endpoint the response was retrieved from
+    :param response: the response we want to cache
+    :return: the number of seconds the response stays fresh, or None if it never
+        expires
+    """
+    if _GAME_FEED.match(endpoint):
+        status = response.data.get("gameData", {}).get("status", {})
+        return None if status.get("abstractGameState") == "Final" else LIVE_TTL
+    game = _GAME.match(endpoint)
+    if game:
+        return None if _is_past_season(int(game.group(1)) + 1) else LIVE_TTL
+    if _TEAMS.match(endpoint):
+        season = _SEASON.search(endpoint)
+        if season and _is_past_season(int(season.group(1))):
+            return None
+        return TEAMS_TTL
+    return DEFAULT_TTL
+
+
+def _is_past_season(end_year: int) -> bool:
+    """
+    :param end_year: the year a season ends in
+    :return: whether the season ended before this year, so its data is final
+    """
+    return end_year < date.today().year
@@ -0,0 +1,87 @@
+"""
+Decodes the JSON bodies of NHL API responses.
+
+The fastest available JSON library is used: `orjson` if it is installed, then
+`msgspec`, and otherwise the standard library's `json` module. A different
+decoder can be plugged in with `set_decoder`.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Takes the raw body of a response and returns the decoded JSON. It must raise a
+# ValueError if the body is not valid JSON.
+Decoder = Callable[[bytes], Any]
+
+
+def _default_decoder() -> tuple[str, Decoder]:
+    """
+    Finds the fastest installed JSON library.
+
+    :return: the name of the library, and its decoding function
+    """
+    try:
+        import orjson
+
+        return "orjson", orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        return "msgspec", msgspec.json.Decoder().decode
+    except ImportError:
+        pass
+    return "json", json.loads
+
+
+DEFAULT_DECODER_NAME, DEFAULT_DECODER = _default_decoder()
+_decoder: Decoder = DEFAULT_DECODER
+
+
+def get_decoder() -> Decoder:
+    """
+    :return: the decoder currently used for all responses
+    """
+    return _decoder
+
+
+def set_decoder(decoder: Optional[Decoder]) -> None:
+    """
+    Changes the decoder used for all responses.
+
+    :param decoder: the new decoder, or None to go back to the fastest installed
+        JSON library
+    """
+    global _decoder
+    _decoder = decoder or DEFAULT_DECODER
+    logger.debug(f"JSON decoder set to {_decoder}")
+
+
+def decode(content: bytes) -> Any:
+    """
+    Decodes a JSON body with the current decoder.
+
+    :param content: the raw body, as bytes (they are not decoded to text first)
+    :return: the decoded JSON
+    :raises ValueError: if the body is not valid JSON
+    """
+    return _decoder(content)
+
+
+def decode_or_empty(content: bytes, decoder: Decoder = None) -> Any:
+    """
+    Decodes a JSON body like `decode`, without failing on an invalid body.
+
+    :param content: the raw body, as bytes
+    :param decoder: decodes the body, defaults to the current decoder
+    :return: the decoded JSON, or an empty dictionary if the body is not valid JSON
+    """
+    try:
+        return (decoder or _decoder)(content)
+    except ValueError:
+        return {}
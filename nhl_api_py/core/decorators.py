@@ -1,6 +1,6 @@
 import logging
 from functools import wraps
-from time import time
+from time import perf_counter_ns
 from typing import Callable
 
 logger = logging.getLogger(__name__)
@@ -16,10 +16,9 @@ def timing(func: Callable):
 
     @wraps(func)
     def run_timer(*args, **kwargs):
-        current_time = time()
+        start = perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time()
-        time_to_run = round(end_time - current_time, 4)
+        time_to_run = round((perf_counter_ns() - start) / 1e9, 4)
         logger.info(f"{func.__name__} took {time_to_run} seconds to run")
         return result
 
@@ -1,4 +1,6 @@
 class ResponseError(Exception):
     """Raise for 4xx and 5xx HTTP status codes."""
 
-    pass
+    def __init__(self, *args, status_code: int = None):
+        super().__init__(*args)
+        self.status_code = status_code
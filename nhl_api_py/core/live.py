@@ -0,0 +1,233 @@
+"""
+Incrementally keeps a live game up to date.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from typing import Callable, Optional
+
+from nhl_api_py.core.api import NhlApi
+from nhl_api_py.core.error_exceptions import ResponseError
+from nhl_api_py.core.response import Response
+from nhl_api_py.core.utils import camel_to_snake_case
+from nhl_api_py.models.game import Game, Play
+
+logger = logging.getLogger(__name__)
+
+Subscriber = Callable[[list[Play]], None]
+
+# Array positions are indexes, or "-" to append.
+_PLAY_PATH = re.compile(r"^/liveData/plays/allPlays/(\d+|-)$")
+_PLAY_INDEX_PATH = re.compile(r"^/liveData/plays/(scoringPlays|penaltyPlays)/(\d+|-)$")
+_GAME_FIELD_PATH = re.compile(r"^/gameData/(?:status|datetime)/(\w+)$")
+_GAME_FIELDS = Game._field_names()
+
+
+class LiveGamePoller:
+    """
+    Polls a game's live feed and keeps a single `Game` model up to date.
+
+    After the first poll, only what changed since the last poll is requested
+    (through the feed's `diffPatch` endpoint), so each poll only parses the plays
+    that were added since. New plays are appended to the existing model in
+    place, and passed on to every subscriber.
+
+    Changes to plays which were already seen (e.g. a goal's assists being
+    corrected) are not applied; call `refresh` to rebuild the model from scratch.
+    """
+
+    def __init__(self, api: NhlApi, game_id: int, interval: float = 10):
+        """
+        :param api: the client used to send the requests
+        :param game_id: the ID of the game we want to follow
+        :param interval: the number of seconds between polls when running
+        """
+        self.api = api
+        self.game_id = game_id
+        self.interval = interval
+        self.game: Optional[Game] = None
+        self.timecode: Optional[str] = None
+        self._last_response: Optional[Response] = None
+        self._subscribers: list[Subscriber] = []
+
+    @property
+    def is_final(self) -> bool:
+        return self.game is not None and self.game.abstract_game_state == "Final"
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        """
+        Registers a callback which receives the newly added plays after each poll.
+
+        :param subscriber: the callback, which is passed a list of plays
+        """
+        self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """
+        Stops sending new plays to a callback.
+
+        :param subscriber: the callback which was previously subscribed
+        """
+        self._subscribers.remove(subscriber)
+
+    def refresh(self) -> list[Play]:
+        """
+        Rebuilds the game from its full live feed, and emits all of its plays.
+
+        :return: all plays of the game
+        """
+        response = self.api.get(f"game/{self.game_id}/feed/live")
+        self._last_response = response
+        self.game = Game.from_dict(response.data)
+        self.game.all_plays = self.game.all_plays or []
+        self.timecode = response.data.get("metaData", {}).get("timeStamp")
+        return self._emit(list(self.game.all_plays))
+
+    def poll(self) -> list[Play]:
+        """
+        Fetches whatever changed in the game since the last poll, and applies it
+        to the game.
+
+        :return: the plays which were added since the last poll
+        """
+        if self.game is None or self.timecode is None:
+            return self.refresh()
+        endpoint = (
+            f"game/{self.game_id}/feed/live/diffPatch?startTimecode={self.timecode}"
+        )
+        try:
+            response = self.api.get(endpoint, use_cache=False)
+        except ResponseError as error:
+            logger.warning(f"Falling back to the full feed, diffPatch failed: {error}")
+            return self._emit(self._apply_feed())
+        if isinstance(response.data, list):
+            return self._emit(self._apply_patches(response.data))
+        # The API answers with the whole feed when the timecode is too old.
+        return self._emit(self._apply_feed(response))
+
+    def run(self, stop: threading.Event = None) -> None:
+        """
+        Polls the game every `interval` seconds until it is final, or until `stop`
+        is set.
+
+        :param stop: an event which ends the polling loop once it is set
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.poll()
+            if self.is_final:
+                break
+            stop.wait(self.interval)
+
+    def _emit(self, plays: list[Play]) -> list[Play]:
+        if plays:
+            for subscriber in list(self._subscribers):
+                subscriber(plays)
+        return plays
+
+    def _apply_patches(self, patches: list[dict]) -> list[Play]:
+        """
+        Applies the JSON patches returned by the `diffPatch` endpoint.
+
+        If an operation targets a position past the end of a list, some changes
+        were missed: the rest of the patches is dropped, and the full feed is
+        applied instead.
+
+        :param patches: a list of objects, each holding a list of operations in
+            its `diff` key
+        :return: the plays which were added
+        """
+        new_plays = []
+        operations = (
+            operation for patch in patches for operation in patch.get("diff", [])
+        )
+        for operation in operations:
+            path, value = operation.get("path", ""), operation.get("value")
+            op = operation.get("op")
+            if op not in ("add", "replace"):
+                continue
+            if path == "/metaData/timeStamp":
+                self.timecode = value
+            elif match := _PLAY_PATH.match(path):
+                index = _position(match.group(1), len(self.game.all_plays))
+                if index is None:
+                    return self._fall_back(new_plays, path)
+                if index == len(self.game.all_plays):
+                    play = Play.from_dict(value)
+                    self.game.all_plays.append(play)
+                    new_plays.append(play)
+            elif match := _PLAY_INDEX_PATH.match(path):
+                name = camel_to_snake_case(match.group(1))
+                indexes = list(getattr(self.game, name) or [])
+                index = _position(match.group(2), len(indexes))
+                if index is None or (op == "replace" and index == len(indexes)):
+                    return self._fall_back(new_plays, path)
+                if op == "replace":
+                    indexes[index] = value
+                else:
+                    indexes.insert(index, value)
+                setattr(self.game, name, indexes)
+            elif match := _GAME_FIELD_PATH.match(path):
+                name = camel_to_snake_case(match.group(1))
+                if name in _GAME_FIELDS:
+                    setattr(self.game, name, value)
+        if new_plays:
+            self.game.current_play = new_plays[-1]
+        return new_plays
+
+    def _fall_back(self, new_plays: list[Play], path: str) -> list[Play]:
+        """
+        Applies the full feed after a patch which could not be applied.
+
+        :param new_plays: the plays the patches added so far
+        :param path: the path of the operation which could not be applied
+        :return: the plays which were added, by the patches and the feed
+        """
+        logger.warning(f"Falling back to the full feed, {path} is out of range")
+        if new_plays:
+            self.game.current_play = new_plays[-1]
+        return new_plays + self._apply_feed()
+
+    def _apply_feed(self, response: Response = None) -> list[Play]:
+        """
+        Applies the full live feed, only parsing the plays past the ones already
+        known.
+
+        :param response: the full feed, which is requested if not given
+        :return: the plays which were added
+        """
+        response = response or self.api.get(f"game/{self.game_id}/feed/live")
+        if response is self._last_response:
+            return []
+        self._last_response = response
+        data = response.data
+        self.timecode = data.get("metaData", {}).get("timeStamp", self.timecode)
+        status = data.get("gameData", {}).get("status", {})
+        for key, value in status.items():
+            name = camel_to_snake_case(key)
+            if name in _GAME_FIELDS:
+                setattr(self.game, name, value)
+        plays = data.get("liveData", {}).get("plays", {})
+        known = len(self.game.all_plays)
+        new_plays = [Play.from_dict(play) for play in plays.get("allPlays", [])[known:]]
+        self.game.all_plays.extend(new_plays)
+        self.game.scoring_plays = plays.get("scoringPlays", self.game.scoring_plays)
+        self.game.penalty_plays = plays.get("penaltyPlays", self.game.penalty_plays)
+        if new_plays:
+            self.game.current_play = new_plays[-1]
+        return new_plays
+
+
+def _position(index: str, length: int) -> Optional[int]:
+    """
+    :param index: the last part of a JSON patch path into a list
+    :param length: the length of the list
+    :return: the position the path points to, or None if it is past the end of
+        the list
+    """
+    if index == "-":
+        return length
+    position = int(index)
+    return position if position <= length else None
@@ -0,0 +1,321 @@
+"""
+Metrics recorded by `NhlApi`, and the sinks they can be sent to.
+
+Every request records, per endpoint (with IDs replaced by `{id}`):
+
+- `request_seconds`: the time spent on the network, tagged with the status code
+- `decode_seconds`: the time spent decoding the JSON body
+- `response_bytes`: the size of the body
+- `responses`: a count of responses, tagged with the status code
+- `cache`: a count of cache lookups, tagged with `hit`, `revalidated` or `miss`
+- `retries`: a count of retried requests, tagged with the status code
+- `throttle_seconds`: the time spent waiting for the rate limiter, if any
+- `coalesced`: a count of calls which shared a request already in flight
+
+and building models records `parse_seconds`, tagged with the model.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import re
+import socket
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Iterator, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+Tags = dict[str, str]
+
+_ID = re.compile(r"\d+")
+
+
+def endpoint_name(endpoint: str) -> str:
+    """
+    Groups endpoints which only differ by IDs or query parameters, so each
+    endpoint is one series rather than one per game.
+
+    :param endpoint: the endpoint a request was sent to
+    :return: the endpoint without its query, with every number replaced by `{id}`
+    """
+    return _ID.sub("{id}", endpoint.partition("?")[0])
+
+
+class MetricsSink(ABC):
+    """
+    Base class for all metrics sinks.
+    """
+
+    @abstractmethod
+    def observe(
+        self, name: str, value: float, tags: Tags = None
+    ) -> None:  # pragma: no cover
+        """
+        Records a value of a distribution, such as a duration or a size.
+
+        :param name: the name of the metric; durations end in `_seconds`
+        :param value: the value we want to record
+        :param tags: the labels of the series the value belongs to
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def increment(
+        self, name: str, value: int = 1, tags: Tags = None
+    ) -> None:  # pragma: no cover
+        """
+        Increments a counter.
+
+        :param name: the name of the counter
+        :param value: how much the counter is incremented by
+        :param tags: the labels of the series the counter belongs to
+        """
+        raise NotImplementedError
+
+
+class NullSink(MetricsSink):
+    """
+    Discards every metric. Used when no sink is set.
+    """
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        pass
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None) -> None:
+        pass
+
+
+class Summary(NamedTuple):
+    """
+    The summary of a distribution. The percentiles are computed from the most
+    recent values only, while `count` and `sum` cover every value.
+    """
+
+    count: int
+    sum: float
+    p50: float
+    p95: float
+    p99: float
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    # Nearest rank.
+    return ordered[max(0, math.ceil(len(ordered) * percent / 100) - 1)]
+
+
+class _Distribution:
+    __slots__ = ("count", "sum", "recent")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.sum = 0.0
+        self.recent: deque[float] = deque(maxlen=window)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+    def summary(self) -> Summary:
+        ordered = sorted(self.recent)
+        if not ordered:
+            return Summary(self.count, self.sum, 0.0, 0.0, 0.0)
+        return Summary(
+            self.count,
+            self.sum,
+            _percentile(ordered, 50),
+            _percentile(ordered, 95),
+            _percentile(ordered, 99),
+        )
+
+
+SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def _key(name: str, tags: Optional[Tags]) -> SeriesKey:
+    return name, tuple(sorted((tags or {}).items()))
+
+
+class InMemorySink(MetricsSink):
+    """
+    Keeps every metric in memory, as histograms and counters which can be
+    summarized at any time. It is safe to share between threads.
+    """
+
+    def __init__(self, window: int = 10_000):
+        """
+        :param window: the number of most recent values of each series the
+            percentiles are computed from
+        """
+        self.window = window
+        self._distributions: dict[SeriesKey, _Distribution] = {}
+        self._counters: dict[SeriesKey, int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        key = _key(name, tags)
+        with self._lock:
+            distribution = self._distributions.get(key)
+            if distribution is None:
+                distribution = self._distributions[key] = _Distribution(self.window)
+            distribution.add(value)
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None) -> None:
+        key = _key(name, tags)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def summary(self, name: str, **tags: str) -> Optional[Summary]:
+        """
+        :param name: the name of the metric
+        :param tags: the labels of the series
+        :return: the summary of the series, or None if nothing was recorded
+        """
+        with self._lock:
+            distribution = self._distributions.get(_key(name, tags))
+            return distribution.summary() if distribution is not None else None
+
+    def count(self, name: str, **tags: str) -> int:
+        """
+        :param name: the name of the counter
+        :param tags: the labels of the series
+        :return: the value of the counter
+        """
+        with self._lock:
+            return self._counters.get(_key(name, tags), 0)
+
+    def summaries(self) -> dict[SeriesKey, Summary]:
+        """
+        :return: the summary of every distribution, by name and labels
+        """
+        with self._lock:
+            return {key: d.summary() for key, d in self._distributions.items()}
+
+    def counters(self) -> dict[SeriesKey, int]:
+        """
+        :return: the value of every counter, by name and labels
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._distributions.clear()
+            self._counters.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels) + "}"
+
+
+class PrometheusSink(InMemorySink):
+    """
+    Keeps every metric in memory, and renders them in the Prometheus text
+    exposition format (e.g. to be served on a `/metrics` endpoint).
+    Distributions are exposed as summaries, and counters as `_total` counters.
+    """
+
+    def __init__(self, prefix: str = "nhl_api", window: int = 10_000):
+        """
+        :param prefix: prepended to the name of every metric
+        :param window: the number of most recent values of each series the
+            quantiles are computed from
+        """
+        super().__init__(window=window)
+        self.prefix = prefix
+
+    def _name(self, name: str) -> str:
+        return re.sub(r"[^a-zA-Z0-9_]", "_", f"{self.prefix}_{name}")
+
+    def render(self) -> str:
+        """
+        :return: every metric, in the Prometheus text exposition format
+        """
+        lines = []
+        typed = set()
+        for (name, labels), summary in sorted(self.summaries().items()):
+            metric = self._name(name)
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} summary")
+            for quantile, value in (
+                ("0.5", summary.p50),
+                ("0.95", summary.p95),
+                ("0.99", summary.p99),
+            ):
+                quantile_labels = _labels(labels + (("quantile", quantile),))
+                lines.append(f"{metric}{quantile_labels} {value}")
+            lines.append(f"{metric}_sum{_labels(labels)} {summary.sum}")
+            lines.append(f"{metric}_count{_labels(labels)} {summary.count}")
+        for (name, labels), value in sorted(self.counters().items()):
+            metric = f"{self._name(name)}_total"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class StatsdSink(MetricsSink):
+    """
+    Sends every metric over UDP to a StatsD-compatible agent, with tags in the
+    DogStatsD format. Durations are sent as timers in milliseconds, other
+    distributions as histograms. Sending never blocks nor raises.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8125, prefix="nhl_api"):
+        """
+        :param host: the host the agent listens on
+        :param port: the UDP port the agent listens on
+        :param prefix: prepended to the name of every metric
+        """
+        self.address = (host, port)
+        self.prefix = prefix
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def _send(self, name: str, value: float, kind: str, tags: Optional[Tags]) -> None:
+        line = f"{self.prefix}.{name}:{value:g}|{kind}"
+        if tags:
+            line += "|#" + ",".join(f"{k}:{v}" for k, v in sorted(tags.items()))
+        try:
+            self._socket.sendto(line.encode(), self.address)
+        except OSError as error:
+            logger.debug(f"Could not send metric {name}: {error}")
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        if name.endswith("_seconds"):
+            self._send(name.removesuffix("_seconds"), value * 1e3, "ms", tags)
+        else:
+            self._send(name, value, "h", tags)
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None) -> None:
+        self._send(name, value, "c", tags)
+
+    def close(self) -> None:
+        self._socket.close()
+
+
+@contextmanager
+def timer(sink: MetricsSink, name: str, tags: Tags = None) -> Iterator[None]:
+    """
+    Records how long the body of a `with` statement takes, using a monotonic,
+    high resolution clock. Nothing is recorded if the body raises.
+
+    :param sink: where the duration is recorded
+    :param name: the name of the metric, which should end in `_seconds`
+    :param tags: the labels of the series
+    """
+    start = perf_counter_ns()
+    yield
+    sink.observe(name, (perf_counter_ns() - start) / 1e9, tags)
@@ -3,8 +3,10 @@ Represents a simple Response received from the NHL API.
 """
 from __future__ import annotations
 
-from requests import JSONDecodeError
 from requests import Response as RequestResponse
+from requests.structures import CaseInsensitiveDict
+
+from nhl_api_py.core.decoder import Decoder, decode, decode_or_empty
 
 
 class Response:
@@ -14,22 +16,81 @@ class Response:
     This limits the responses to only contain the important information.
     """
 
-    def __init__(self, status_code: int, data: dict):
+    def __init__(
+        self,
+        status_code: int,
+        data: dict,
+        headers: dict = None,
+        content: bytes = None,
+    ):
+        """
+        :param status_code: the HTTP status code of the response
+        :param data: the decoded body
+        :param headers: the HTTP headers of the response
+        :param content: the raw body, if it is kept (see `from_requests`)
+        """
         self.status_code = status_code
-        self.data = data
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.content = content
+        self._data = data
+        self._decoder: Decoder | None = None
+
+    @property
+    def data(self) -> dict:
+        if self._decoder is not None:
+            self._data = decode_or_empty(self.content, self._decoder)
+            self._decoder = None
+        return self._data
+
+    @data.setter
+    def data(self, data: dict) -> None:
+        self._data = data
+        self._decoder = None
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("Last-Modified")
+
+    def conditional_headers(self) -> dict:
+        """
+        Builds the headers which ask the server to only send the data again if it
+        changed since this response, using the validators the server sent.
+
+        :return: the `If-None-Match` / `If-Modified-Since` headers that apply
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
 
     @classmethod
-    def from_requests(cls, response: RequestResponse) -> Response:
+    def from_requests(
+        cls, response: RequestResponse, decoder: Decoder = None, lazy: bool = False
+    ) -> Response:
         """
         Utility method to create a response object from the `requests` Response
         object.
 
+        The raw body is decoded straight from bytes, with the fastest installed
+        JSON library unless a decoder is given (see `nhl_api_py.core.decoder`).
+
         :param response: the response object from the `requests` package
+        :param decoder: decodes the raw body, defaults to the current decoder
+        :param lazy: whether the raw body is kept as `content`, and only decoded
+            once `data` is first read
         :return: NHL API Response Object
         """
         assert isinstance(response, RequestResponse), f"{response} not of proper type."
-        try:
-            json = response.json()
-        except JSONDecodeError:
-            json = {}
-        return cls(response.status_code, json)
+        if lazy:
+            result = cls(response.status_code, {}, dict(response.headers))
+            result.content = response.content
+            result._decoder = decoder or decode
+            return result
+        json = decode_or_empty(response.content, decoder)
+        return cls(response.status_code, json, dict(response.headers))
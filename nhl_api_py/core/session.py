@@ -0,0 +1,62 @@
+"""
+Builds the pooled HTTP session used to talk to the NHL API.
+"""
+import logging
+from typing import Iterable
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    max_retries: int = 3,
+    backoff_factor: float = 0.5,
+    retry_status_codes: Iterable[int] = RETRY_STATUS_CODES,
+) -> Session:
+    """
+    Creates a `requests` Session which keeps connections alive and reuses them
+    across requests, instead of opening a new TCP / TLS connection per call.
+
+    :param pool_connections: the number of hosts to keep connection pools for
+    :param pool_maxsize: the maximum number of connections kept open per host
+    :param pool_block: whether to wait for a free connection once a host has
+        `pool_maxsize` connections in use, rather than opening a throwaway one
+    :param max_retries: how many times a failed connection or a retryable status
+        code is retried at the transport level
+    :param backoff_factor: the exponential backoff factor between retries, in
+        seconds
+    :param retry_status_codes: the status codes retried at the transport level,
+        429, 502, 503 and 504 by default
+    :return: a session with the pooled adapter mounted for HTTP and HTTPS
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=tuple(retry_status_codes),
+        # Otherwise urllib3 retries any 413, 429 or 503 with a Retry-After header.
+        respect_retry_after_header=bool(retry_status_codes),
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=retry,
+    )
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    logger.debug(
+        f"Created session with {pool_connections} pools of {pool_maxsize} connections"
+    )
+    return session
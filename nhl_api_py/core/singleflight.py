@@ -0,0 +1,90 @@
+"""
+Coalesces duplicate calls which are in flight at the same time, so that a burst
+of callers asking for the same thing only does the work once.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """
+    A call in flight, which the callers of the same key wait on.
+    """
+
+    __slots__ = ("done", "value", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+    def result(self) -> T:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class SingleFlight(Generic[T]):
+    """
+    Runs at most one call per key at a time. Callers asking for a key while its
+    call is in flight wait for that call and share its result, or its error,
+    instead of running their own.
+
+    Results are not kept once the call returns: caching them is up to the
+    caller. It is safe to share between threads.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call[T]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """
+        :param key: identifies the calls which are duplicates of each other
+        :param function: does the work, if no call of the same key is in flight
+        :return: the result of the call in flight, or of `function`
+        """
+        return self.call(key, function)[0]
+
+    def call(self, key: Hashable, function: Callable[[], T]) -> tuple[T, bool]:
+        """
+        Like `do`, but also tells whether the result came from another call.
+
+        :param key: identifies the calls which are duplicates of each other
+        :param function: does the work, if no call of the same key is in flight
+        :return: the result, and whether it was shared by the call in flight
+            rather than computed by `function`
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+        if not leader:
+            return call.result(), True
+        try:
+            call.value = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.waiters:
+                logger.debug(f"Shared the call of {key} with {call.waiters} waiters")
+            call.done.set()
+        return call.value, False
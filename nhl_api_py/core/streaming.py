@@ -0,0 +1,48 @@
+"""
+Parses large JSON responses incrementally, rather than decoding them whole.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterator
+
+from requests import Response as RequestResponse
+
+from nhl_api_py.core.decoder import Decoder, decode
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+
+def iter_items(
+    response: RequestResponse, path: str, decoder: Decoder = None
+) -> Iterator[Any]:
+    """
+    Yields the items of an array nested in a JSON response one by one, e.g. the
+    plays in `liveData.plays.allPlays` of a game feed.
+
+    If `ijson` is installed, the body is parsed as it is read from the response
+    stream (send the request with `stream=True`), so only one item is held in
+    memory at a time. Otherwise, the whole body is decoded first.
+
+    :param response: the response object from the `requests` package
+    :param path: the keys leading to the array, separated by dots
+    :param decoder: decodes the whole body when `ijson` is not installed,
+        defaults to the current decoder
+    :return: a generator of the decoded items; nothing is yielded if the array
+        does not exist
+    """
+    if ijson is not None:
+        # Let urllib3 undo any gzip / deflate encoding while reading.
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, f"{path}.item", use_float=True)
+        return
+    logger.debug("ijson is not installed, decoding the whole response instead")
+    data = (decoder or decode)(response.content)
+    for key in path.split("."):
+        data = data.get(key) if isinstance(data, dict) else None
+    yield from data if isinstance(data, list) else []
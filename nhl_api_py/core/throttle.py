@@ -0,0 +1,239 @@
+"""
+Keeps the request rate of `NhlApi` within what the NHL API tolerates.
+
+- `TokenBucket` caps the number of requests sent per second, with bursts
+- `AdaptiveConcurrency` caps the number of requests in flight, and adapts the cap
+  to the observed latency and errors (additive increase, multiplicative decrease)
+- `RetryPolicy` decides whether and when a throttled or failed request is sent
+  again, with jittered exponential backoff which honors `Retry-After`
+
+A single instance of each can be shared by many clients (including the threads
+of batch calls and `AsyncNhlApi`), so that they are limited together.
+"""
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic, sleep
+from typing import Iterable, Optional
+
+from nhl_api_py.core.session import RETRY_STATUS_CODES
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Limits the rate of requests to `rate` per second on average, while letting
+    up to `burst` requests through at once after a quiet period. It is safe to
+    share between threads.
+
+    Tokens are reserved in arrival order: a caller that finds the bucket empty
+    takes a token ahead of time and sleeps until it would have been refilled, so
+    waiting callers are released one by one at the target rate.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param rate: the number of requests allowed per second
+        :param burst: the number of requests which can be sent at once
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("The rate must be positive and the burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token, possibly ahead of time.
+
+        :return: how many seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> float:
+        """
+        Waits until a request can be sent.
+
+        :return: how many seconds were spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            sleep(wait)
+        return wait
+
+
+class AdaptiveConcurrency:
+    """
+    Limits the number of requests in flight, and adapts that limit to how the
+    NHL API copes (AIMD): every successful response raises the limit by
+    `1 / limit` (so by about one per round trip at full concurrency), while a
+    throttled (429) or failed (5xx, connection error) response, or one slower
+    than `latency_target`, multiplies it by `decrease_ratio`. The limit is only
+    decreased once per round trip, so a burst of errors from requests that were
+    already in flight counts as one.
+
+    It is safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        initial: int = 10,
+        minimum: int = 1,
+        maximum: int = 100,
+        latency_target: float = None,
+        decrease_ratio: float = 0.5,
+    ):
+        """
+        :param initial: the number of requests allowed in flight at first
+        :param minimum: the lowest the limit can go
+        :param maximum: the highest the limit can go
+        :param latency_target: the number of seconds above which a response is
+            considered a sign of overload, if any
+        :param decrease_ratio: what the limit is multiplied by on overload
+        """
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Expected 1 <= minimum <= initial <= maximum")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.decrease_ratio = decrease_ratio
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """
+        :return: the number of requests currently allowed in flight
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        :return: the number of requests currently in flight
+        """
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """
+        Waits until one more request can be in flight, and counts it.
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def _overloaded(self, latency: float, status_code: Optional[int]) -> bool:
+        if status_code is None or status_code == 429 or status_code >= 500:
+            return True
+        return self.latency_target is not None and latency > self.latency_target
+
+    def release(self, latency: float, status_code: Optional[int]) -> None:
+        """
+        Marks a request as done, and adapts the limit to its outcome.
+
+        :param latency: how many seconds the request took
+        :param status_code: the status code of the response, or None if no
+            response was received
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if self._overloaded(latency, status_code):
+                now = monotonic()
+                if now - self._last_decrease >= latency:
+                    self._last_decrease = now
+                    self._limit = max(self.minimum, self._limit * self.decrease_ratio)
+                    logger.info(f"Concurrency limit decreased to {self.limit}")
+            elif status_code < 400:
+                self._limit = min(self.maximum, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    :param value: the value of a `Retry-After` header, either a number of
+        seconds or an HTTP date
+    :return: the number of seconds to wait, or None if the value is missing or
+        invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Decides whether a response is worth sending the request again for, and how
+    long to wait first.
+
+    The wait follows exponential backoff with full jitter (a random wait between
+    0 and `backoff_factor * 2 ** attempt` seconds), so that clients throttled at
+    the same time do not retry at the same time. If the server sent a
+    `Retry-After` header, it is waited for instead, plus some jitter.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60,
+        status_codes: Iterable[int] = RETRY_STATUS_CODES,
+    ):
+        """
+        :param max_retries: how many times a request is sent again at most
+        :param backoff_factor: the exponential backoff factor between retries, in
+            seconds
+        :param max_backoff: the longest wait between retries, in seconds; a
+            request is not retried if `Retry-After` asks to wait longer
+        :param status_codes: the status codes of the responses which are retried
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_codes = frozenset(status_codes)
+
+    def backoff(
+        self, attempt: int, status_code: int, retry_after: str = None
+    ) -> Optional[float]:
+        """
+        :param attempt: how many times the request was retried already
+        :param status_code: the status code of the latest response
+        :param retry_after: the `Retry-After` header of the latest response
+        :return: how many seconds to wait before retrying, or None if the
+            request should not be retried
+        """
+        if attempt >= self.max_retries or status_code not in self.status_codes:
+            return None
+        jitter = random.uniform(0, self.backoff_factor * 2**attempt)
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            return min(self.max_backoff, jitter)
+        if delay > self.max_backoff:
+            logger.warning(f"Not retrying, the server asked to wait {delay} seconds")
+            return None
+        return delay + min(self.backoff_factor, jitter)
@@ -1,24 +1,64 @@
 import re
+from functools import lru_cache
 
+_CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
 
+
+# The NHL API uses a small, fixed vocabulary of keys, so nearly every call is a
+# cache hit. The bound keeps per-entity keys (e.g. player IDs) from growing it.
+@lru_cache(maxsize=4096)
 def camel_to_snake_case(value: str) -> str:
-    r_string = r"(?<!^)(?=[A-Z])"
-    return re.sub(r_string, "_", value).lower()
+    return _CAMEL_CASE_BOUNDARY.sub("_", value).lower()
+
+
+class SnakeCaseDict(dict):
+    """
+    A dictionary whose keys, and the keys of every dictionary nested in it, were
+    already converted to snake case.
+    """
 
 
-def convert_keys_to_snake_case(d: dict) -> dict:
+def _converted_container(value, pending: list):
+    """
+    Creates the empty container a dictionary or list is converted into, and
+    queues it to be filled.
+
+    :param value: the value we want to convert
+    :param pending: the (source, target) pairs which still need to be filled
+    :return: the new container, or the value itself if it needs no conversion
+    """
+    if isinstance(value, SnakeCaseDict):
+        return value
+    if isinstance(value, dict):
+        target = SnakeCaseDict()
+    elif isinstance(value, list):
+        target = []
+    else:
+        return value
+    pending.append((value, target))
+    return target
+
+
+def convert_keys_to_snake_case(d: dict) -> SnakeCaseDict:
     """
     Converts all the keys in a given dictionary to snake case.
-    It will traverse through nested dictionaries as well.
+    It will traverse through nested dictionaries and lists as well.
+
+    The conversion is done in a single, iterative pass (so deeply nested data
+    cannot hit the recursion limit) into a copy of the data. The copy is marked
+    as a `SnakeCaseDict`, so converting it, or any dictionary nested in it, again
+    returns it as is.
 
     :param d: the dictionary we want to convert keys for
     :return: the same dictionary with converted keys
     """
-    new_data = {}
-    for k, v in d.items():
-        new_key = camel_to_snake_case(k)
-        if isinstance(v, dict):
-            new_data[new_key] = convert_keys_to_snake_case(v)
+    pending = []
+    result = _converted_container(d, pending)
+    while pending:
+        source, target = pending.pop()
+        if isinstance(target, list):
+            target.extend(_converted_container(value, pending) for value in source)
         else:
-            new_data[new_key] = v
-    return new_data
+            for key, value in source.items():
+                target[camel_to_snake_case(key)] = _converted_container(value, pending)
+    return result
@@ -3,10 +3,14 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, fields
-from typing import Type
+from functools import cache
+from typing import Iterable, Type
 
 import pandas as pd
 
+from nhl_api_py.core.decoder import decode_or_empty
+from nhl_api_py.core.utils import SnakeCaseDict
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,8 +18,14 @@ logger = logging.getLogger(__name__)
 class Model(ABC):
     """
     Base class that all Models from the NHL API are based off of.
+
+    Models are declared with `@dataclass(slots=True)`, so their instances store
+    their attributes in slots rather than in a per-instance `__dict__`. This
+    matters once hundreds of thousands of plays are held in memory.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def from_dict(cls, data: dict):  # pragma: no cover
         """
@@ -34,6 +44,61 @@ class Model(ABC):
         """
         raise NotImplementedError
 
+    @classmethod
+    def from_json(cls, content: bytes):
+        """
+        Builds the model straight from a raw JSON body.
+
+        If `msgspec` is installed, the body is decoded directly into the model
+        following the schema in `nhl_api_py.models.schema`, skipping every key
+        the model does not use. Otherwise, or if the body does not follow the
+        schema, it is decoded and passed to `from_dict`. Both give the same model.
+        A body which is not valid JSON gives an empty model, as it gives an empty
+        `Response.data`.
+
+        :param content: the raw JSON body (e.g. of a response)
+        :return: an instance of the model
+        """
+        schema = _schema()
+        if schema is not None and schema.supports(cls):
+            try:
+                return schema.decode(content, cls)
+            except ValueError as error:
+                logger.debug(f"Falling back to from_dict for {cls.__name__}: {error}")
+        return cls.from_dict(decode_or_empty(content))
+
+    @classmethod
+    def list_from_json(cls, content: bytes, key: str) -> list:
+        """
+        Builds the models listed under a key of a raw JSON body (e.g. the `teams`
+        of a teams response), like `from_json`.
+
+        :param content: the raw JSON body (e.g. of a response)
+        :param key: the key of the list in the body
+        :return: instances of the model, none if the key is missing
+        """
+        schema = _schema()
+        if schema is not None and schema.supports(cls):
+            try:
+                return schema.decode_list(content, cls, key)
+            except ValueError as error:
+                logger.debug(f"Falling back to from_dict for {cls.__name__}: {error}")
+        return [cls.from_dict(item) for item in decode_or_empty(content).get(key) or []]
+
+    @classmethod
+    def _field_names(cls) -> frozenset[str]:
+        """
+        The names of all fields of the model, computed once per Model subclass.
+
+        :return: the field names
+        """
+        # Look in the class' own namespace, so subclasses get their own set.
+        names = cls.__dict__.get("_field_name_set")
+        if names is None:
+            names = frozenset(field.name for field in fields(cls))
+            cls._field_name_set = names
+        return names
+
     def to_series(self, remove_missing_values: bool = True) -> pd.Series:
         """
         Convenience method which generates a pandas Series from the dataclass.
@@ -42,12 +107,135 @@ class Model(ABC):
             kept in the series, defaults to True
         :return: all attributes ordered in a pandas Series
         """
-        column = pd.Series(self.__dict__)
+        column = pd.Series({f.name: getattr(self, f.name) for f in fields(self)})
         if remove_missing_values:
             column.dropna(inplace=True)
         return column
 
 
+@cache
+def _schema():
+    """
+    Imports the schema used by `Model.from_json`, once.
+
+    :return: the `nhl_api_py.models.schema` module, or None if `msgspec` is not
+        installed
+    """
+    try:
+        from nhl_api_py.models import schema
+    except ImportError:
+        logger.debug("msgspec is not installed, models are built with from_dict")
+        return None
+    return schema
+
+
+@cache
+def _is_nested(cls: type) -> bool:
+    """
+    Whether values of a type are flattened into several columns by
+    `to_dataframe`. Cached per type, since `isinstance` checks against the
+    abstract Model class are slow over hundreds of thousands of values.
+
+    :param cls: the type of a value
+    :return: whether it is a Model or a dictionary
+    """
+    return issubclass(cls, (Model, dict))
+
+
+def _flatten_into(row: dict, prefix: str, value: Model | dict) -> None:
+    """
+    Helper function which adds the attributes of a nested model, or the keys of
+    a nested dictionary, to a row as `<prefix>_<name>` columns.
+
+    :param row: the row we want to add columns to
+    :param prefix: the name of the column holding the nested value
+    :param value: the nested model or dictionary
+    """
+    if isinstance(value, dict):
+        items = value.items()
+    else:
+        items = ((name, getattr(value, name)) for name in value.__dataclass_fields__)
+    for key, item in items:
+        if item is None:
+            continue
+        column = f"{prefix}_{key}"
+        if _is_nested(type(item)) and item:
+            _flatten_into(row, column, item)
+        else:
+            row[column] = item
+
+
+# The nullable pandas dtype used for each kind of column, as inferred by pandas.
+_NULLABLE_DTYPES = {
+    "integer": "Int64",
+    "floating": "Float64",
+    "mixed-integer-float": "Float64",
+    "boolean": "boolean",
+    "string": "string",
+}
+
+
+def _column(values: list) -> pd.Series | pd.api.extensions.ExtensionArray:
+    """
+    Helper function which turns the values of a column into an array with the
+    most fitting nullable dtype, or an object column for anything else (e.g.
+    lists).
+
+    :param values: the column's values, with None for missing values
+    :return: the column
+    """
+    dtype = _NULLABLE_DTYPES.get(pd.api.types.infer_dtype(values, skipna=True))
+    if dtype is None:
+        return pd.Series(values, dtype=object)
+    return pd.array(values, dtype=dtype)
+
+
+def to_dataframe(
+    models: Iterable[Model], remove_missing_values: bool = True
+) -> pd.DataFrame:
+    """
+    Generates a pandas DataFrame with one row per model, in a single pass.
+    This is much faster than concatenating the models' `to_series`.
+
+    Nested models and dictionaries (e.g. a play's `team` and `coordinates`) are
+    flattened into `<field>_<name>` columns, such as `team_id` or
+    `coordinates_x`. Lists are kept as they are. Columns use pandas' nullable
+    dtypes, so integer columns stay integers even with missing values.
+
+    :param models: the models we want in the DataFrame, usually all of one type
+    :param remove_missing_values: whether columns without any values should be
+        dropped, defaults to True
+    :return: all models' attributes, one row per model
+    """
+    rows = []
+    flattened = set()
+    for model in models:
+        row = {}
+        for name in model.__dataclass_fields__:
+            value = getattr(model, name)
+            if _is_nested(type(value)):
+                if value:
+                    flattened.add(name)
+                    _flatten_into(row, name, value)
+                else:
+                    row[name] = None
+            else:
+                row[name] = value
+        rows.append(row)
+    columns = {}
+    for name in dict.fromkeys(column for row in rows for column in row):
+        values = [row.get(name) for row in rows]
+        # A field flattened in other rows is replaced by its columns, unless some
+        # rows hold a plain value in it.
+        if name in flattened and all(value is None for value in values):
+            continue
+        column = _column(values)
+        if remove_missing_values and column.isna().all():
+            continue
+        columns[name] = column
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(rows)))
+
+
 def _field_only_keys(data: dict, cls: Type[Model]) -> dict:
     """
     Helper function that extracts only the keys from a dictionary that is a
@@ -55,9 +243,12 @@ def _field_only_keys(data: dict, cls: Type[Model]) -> dict:
 
     :param data: the dictionary we want to observe
     :param cls: the Model we want to consider
-    :return: the same dictionary with only the model's fields
+    :return: the same dictionary with only the model's fields, of the same type as
+        `data` (so converted data stays marked as such)
     """
-    return {k: v for k, v in data.items() if k in (field.name for field in fields(cls))}
+    names = cls._field_names()
+    filtered = {k: v for k, v in data.items() if k in names}
+    return SnakeCaseDict(filtered) if isinstance(data, SnakeCaseDict) else filtered
 
 
 def _append_string_to_keys(text: str, d: dict) -> dict:
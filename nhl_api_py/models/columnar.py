@@ -0,0 +1,206 @@
+"""
+Columnar (struct-of-arrays) representation of play-by-play data.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Column name -> dtype. String columns are sized to their longest value, so
+# nothing is truncated.
+COLUMNS: dict[str, str] = {
+    "game_pk": "int64",
+    "event_idx": "int32",
+    "event_type_id": "str",
+    "secondary_type": "str",
+    "period": "int8",
+    "period_type": "str",
+    "period_time": "int16",
+    "period_time_remaining": "int16",
+    "date_time": "datetime64[s]",
+    "team_id": "int32",
+    "x": "float64",
+    "y": "float64",
+    "goals_away": "int16",
+    "goals_home": "int16",
+    "strength_code": "str",
+    "penalty_minutes": "int16",
+    "game_winning_goal": "bool",
+    "empty_net": "bool",
+}
+
+
+def _seconds(period_time: Optional[str]) -> int:
+    """
+    Converts a "MM:SS" period time into a number of seconds.
+
+    :param period_time: the time, as it appears in the NHL API
+    :return: the number of seconds, or -1 if the time is missing
+    """
+    if not period_time:
+        return -1
+    minutes, _, seconds = period_time.partition(":")
+    return int(minutes) * 60 + int(seconds)
+
+
+class PlayColumns:
+    """
+    Holds the plays of one or more games as one typed NumPy array per column,
+    rather than as a list of `Play` models.
+
+    Columns are read by name (`columns["period"]`), and indexing with a boolean
+    mask or an array of positions returns the matching plays, so filters are
+    vectorized, e.g. all shots in the third period:
+
+        columns[(columns["event_type_id"] == "SHOT") & (columns["period"] == 3)]
+
+    Period times are stored as a number of seconds. Missing values are stored as
+    -1 for `event_idx`, `team_id` and the period times, NaN / NaT for the
+    coordinates and `date_time`, an empty string for text, and 0 / False for
+    everything else.
+    """
+
+    __slots__ = ("columns", "_indexes")
+
+    def __init__(self, columns: dict[str, np.ndarray]):
+        """
+        :param columns: one array per column in `COLUMNS`, all of the same length
+        """
+        self.columns = columns
+        self._indexes: dict[str, dict] = {}
+
+    @classmethod
+    def from_json(cls, all_plays: Iterable[dict], game_pk: int = 0) -> PlayColumns:
+        """
+        Builds the columns straight from the `liveData.plays.allPlays` JSON of a
+        game, without creating a model per play.
+
+        :param all_plays: the plays, as returned by the NHL API
+        :param game_pk: the ID of the game the plays belong to
+        :return: the plays as columns
+        """
+        values: dict[str, list] = {name: [] for name in COLUMNS}
+        append = {name: values[name].append for name in COLUMNS}
+        for play in all_plays:
+            result = play.get("result") or {}
+            about = play.get("about") or {}
+            goals = about.get("goals") or {}
+            coordinates = play.get("coordinates") or {}
+            team = play.get("team") or {}
+            strength = result.get("strength") or {}
+            date_time = about.get("dateTime")
+            append["game_pk"](game_pk)
+            append["event_idx"](about.get("eventIdx", -1))
+            append["event_type_id"](result.get("eventTypeId") or "")
+            append["secondary_type"](result.get("secondaryType") or "")
+            append["period"](about.get("period") or 0)
+            append["period_type"](about.get("periodType") or "")
+            append["period_time"](_seconds(about.get("periodTime")))
+            append["period_time_remaining"](_seconds(about.get("periodTimeRemaining")))
+            append["date_time"](date_time.rstrip("Z") if date_time else "NaT")
+            append["team_id"](team.get("id", -1))
+            append["x"](coordinates.get("x", np.nan))
+            append["y"](coordinates.get("y", np.nan))
+            append["goals_away"](goals.get("away", 0))
+            append["goals_home"](goals.get("home", 0))
+            append["strength_code"](strength.get("code") or "")
+            append["penalty_minutes"](result.get("penaltyMinutes") or 0)
+            append["game_winning_goal"](bool(result.get("gameWinningGoal")))
+            append["empty_net"](bool(result.get("emptyNet")))
+        return cls(
+            {
+                name: np.array(values[name], dtype=dtype)
+                for name, dtype in COLUMNS.items()
+            }
+        )
+
+    @classmethod
+    def from_feed(cls, data: dict) -> PlayColumns:
+        """
+        Builds the columns from a game's full `feed/live` JSON.
+
+        :param data: the game feed, as returned by the NHL API
+        :return: the plays of the game as columns
+        """
+        all_plays = data.get("liveData", {}).get("plays", {}).get("allPlays", [])
+        game = data.get("gameData", {}).get("game", {})
+        game_pk = data.get("gamePk") or game.get("pk") or 0
+        return cls.from_json(all_plays, game_pk=game_pk)
+
+    @classmethod
+    def concat(cls, many: Iterable[PlayColumns]) -> PlayColumns:
+        """
+        Joins the plays of many games into one set of columns.
+
+        :param many: the columns we want to join
+        :return: all plays, in the order they were given
+        """
+        many = list(many)
+        if not many:
+            return cls.from_json([])
+        return cls(
+            {
+                name: np.concatenate([columns.columns[name] for columns in many])
+                for name in COLUMNS
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.columns["event_idx"])
+
+    def __getitem__(self, key: str | np.ndarray | slice) -> np.ndarray | PlayColumns:
+        """
+        :param key: a column name, or a boolean mask / array of positions / slice
+            selecting plays
+        :return: the column's array, or the selected plays
+        """
+        if isinstance(key, str):
+            return self.columns[key]
+        return PlayColumns({name: array[key] for name, array in self.columns.items()})
+
+    def index(self, name: str) -> dict[object, slice | np.ndarray]:
+        """
+        Groups the plays by the values of a column, e.g. the positions of all
+        plays of each event type. The index is built on first use and kept.
+
+        Plays are ordered within a game, so some groups (e.g. a period of a
+        single game) are one contiguous run of plays; those are given as a
+        slice rather than as an array of positions.
+
+        :param name: the column we want to group the plays by
+        :return: each value of the column, and the positions of the plays which
+            have it
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            values = self.columns[name]
+            order = np.argsort(values, kind="stable")
+            keys, starts = np.unique(values[order], return_index=True)
+            index = {}
+            for key, positions in zip(keys.tolist(), np.split(order, starts[1:])):
+                first, last = positions[0], positions[-1]
+                if last - first + 1 == len(positions):
+                    index[key] = slice(int(first), int(last) + 1)
+                else:
+                    # Shared with every caller, so it must not be changed.
+                    positions.flags.writeable = False
+                    index[key] = positions
+            self._indexes[name] = index
+        return index
+
+    def __repr__(self) -> str:
+        return f"PlayColumns({len(self)} plays)"
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Convenience method which generates a pandas DataFrame from the columns,
+        without copying them.
+
+        :return: one row per play, one column per column
+        """
+        return pd.DataFrame(self.columns, copy=False)
@@ -11,7 +11,7 @@ from nhl_api_py.models.team import Team
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Play(Model):
     """
     Represents and contains all data for a single play from an NHL game.
@@ -56,7 +56,7 @@ class Play(Model):
         return cls(**final_data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Game(Model):
     """
     Represents and contains all data for a given game, returned from the NHL API.
@@ -99,7 +99,7 @@ class Game(Model):
         home_data = _field_only_keys(teams_data.get("home", dict()), Team)
         home_data = Team.from_dict(home_data) if len(home_data) != 0 else None
         play_data = live_data.get("plays", dict())
-        play_data_kwargs = play_data.pop("all_plays", dict())
+        play_data_kwargs = play_data.get("all_plays", list())
         all_plays = [
             Play.from_dict(play) if play_data_kwargs is not None else None
             for play in play_data_kwargs
@@ -122,7 +122,7 @@ class Game(Model):
         return cls(**final_data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Boxscore(Model):
     """
     Represents and contains boxscore data for a given game, returned from the NHL API.
@@ -155,12 +155,17 @@ class Boxscore(Model):
         converted_data = convert_keys_to_snake_case(data)
         top_level_data = _field_only_keys(converted_data, cls)
         teams_data = converted_data.get("teams", dict())
-        away_data = teams_data.get("away", dict())
-        home_data = teams_data.get("home", dict())
+        # Copy the team data, since its keys are changed below.
+        away_data = dict(teams_data.get("away", dict()))
+        home_data = dict(teams_data.get("home", dict()))
         away_data_kwargs = away_data.pop("team", dict())
         home_data_kwargs = home_data.pop("team", dict())
-        away_team = Team(**away_data_kwargs) if away_data_kwargs != dict() else None
-        home_team = Team(**home_data_kwargs) if home_data_kwargs != dict() else None
+        away_team = (
+            Team.from_dict(away_data_kwargs) if away_data_kwargs != dict() else None
+        )
+        home_team = (
+            Team.from_dict(home_data_kwargs) if home_data_kwargs != dict() else None
+        )
         away_data = _append_string_to_keys("away_", away_data)
         home_data = _append_string_to_keys("home_", home_data)
         away_data = _field_only_keys(away_data, cls)
@@ -173,3 +178,101 @@ class Boxscore(Model):
             "home_team": home_team,
         }
         return cls(**final_data)
+
+
+def _parse_plays(all_plays: list) -> Optional[list[Play]]:
+    return [Play.from_dict(play) for play in all_plays] or None
+
+
+def _parse_play(play: dict) -> Optional[Play]:
+    return Play.from_dict(play) if play else None
+
+
+def _parse_boxscore(boxscore: dict) -> Optional[Boxscore]:
+    return Boxscore.from_dict(boxscore) if boxscore else None
+
+
+def _lazy_section(name: str, parse) -> property:
+    """
+    Helper function which creates a property for a field of `Game`, which parses
+    the field's raw JSON the first time it is read.
+
+    :param name: the name of the field
+    :param parse: converts the field's raw JSON into its value
+    :return: the property
+    """
+    # The slot of the field on Game, which holds the value once it is parsed.
+    slot = Game.__dict__[name]
+
+    def fget(self: LazyGame):
+        pending = self._pending
+        if name in pending:
+            slot.__set__(self, parse(pending[name]))
+            pending.pop(name, None)
+        return slot.__get__(self, type(self))
+
+    def fset(self: LazyGame, value) -> None:
+        self._pending.pop(name, None)
+        slot.__set__(self, value)
+
+    return property(fget, fset)
+
+
+class LazyGame(Game):
+    """
+    A `Game` which keeps the raw JSON of its heaviest sections (`players`,
+    `all_plays`, `current_play` and the live boxscore), and only parses a section
+    the first time it is read.
+
+    Reading the game's state or teams only costs parsing those few keys, which
+    makes polling many games (e.g. for a scoreboard) much cheaper. Other than
+    when the parsing happens, it behaves exactly like `Game`, and compares equal
+    to a `Game` holding the same data.
+    """
+
+    __slots__ = ("_pending", "_boxscore")
+
+    players = _lazy_section("players", convert_keys_to_snake_case)
+    all_plays = _lazy_section("all_plays", _parse_plays)
+    current_play = _lazy_section("current_play", _parse_play)
+
+    def __init__(self, *args, **kwargs):
+        self._pending: dict[str, object] = {}
+        self._boxscore: Optional[Boxscore] = None
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        game_data = dict(data.get("gameData", dict()))
+        live_data = dict(data.get("liveData", dict()))
+        play_data = dict(live_data.get("plays", dict()))
+        pending = {
+            "players": game_data.pop("players", None),
+            "all_plays": play_data.pop("allPlays", None),
+            "current_play": play_data.pop("currentPlay", None),
+            "boxscore": live_data.pop("boxscore", None),
+        }
+        live_data["plays"] = play_data
+        game = super().from_dict({**data, "gameData": game_data, "liveData": live_data})
+        game._pending.update(
+            (name, raw) for name, raw in pending.items() if raw is not None
+        )
+        return game
+
+    @property
+    def boxscore(self) -> Optional[Boxscore]:
+        """
+        The game's boxscore, as found in its live feed.
+        """
+        if "boxscore" in self._pending:
+            self._boxscore = _parse_boxscore(self._pending["boxscore"])
+            self._pending.pop("boxscore", None)
+        return self._boxscore
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Game):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__dataclass_fields__
+        )
@@ -0,0 +1,220 @@
+"""
+Vectorized filters over play-by-play data held in `PlayColumns`.
+
+Filters are combined with `&` (and), `|` (or) and `~` (not), e.g. all power play
+goals and all shots in the last five minutes of the third period:
+
+    query = (EventType("GOAL") & Strength("PPG")) | (
+        EventType("SHOT") & Period(3) & TimeWindow("15:00", "20:00")
+    )
+    positions = query.positions(columns)
+    plays = columns[positions]
+
+Filters never copy the plays; they return boolean masks or arrays of positions,
+which can index any column (or the `PlayColumns` itself). They work the same on
+the plays of one game and on the plays of many games joined with
+`PlayColumns.concat`.
+"""
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from nhl_api_py.models.columnar import PlayColumns, _seconds
+
+logger = logging.getLogger(__name__)
+
+
+class PlayFilter(ABC):
+    """
+    Base class for all play filters.
+    """
+
+    @abstractmethod
+    def mask(self, columns: PlayColumns) -> np.ndarray:  # pragma: no cover
+        """
+        Evaluates the filter on every play.
+
+        :param columns: the plays we want to filter
+        :return: a boolean array, True for every play which matches
+        """
+        raise NotImplementedError
+
+    def positions(self, columns: PlayColumns) -> np.ndarray:
+        """
+        :param columns: the plays we want to filter
+        :return: the positions of the plays which match, in ascending order
+        """
+        return np.flatnonzero(self.mask(columns))
+
+    def select(self, columns: PlayColumns) -> PlayColumns:
+        """
+        :param columns: the plays we want to filter
+        :return: only the plays which match
+        """
+        return columns[self.positions(columns)]
+
+    def __and__(self, other: PlayFilter) -> PlayFilter:
+        return _And(self, other)
+
+    def __or__(self, other: PlayFilter) -> PlayFilter:
+        return _Or(self, other)
+
+    def __invert__(self) -> PlayFilter:
+        return _Not(self)
+
+
+class _And(PlayFilter):
+    def __init__(self, left: PlayFilter, right: PlayFilter):
+        self.left = left
+        self.right = right
+
+    def mask(self, columns: PlayColumns) -> np.ndarray:
+        return self.left.mask(columns) & self.right.mask(columns)
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} & {self.right!r})"
+
+
+class _Or(PlayFilter):
+    def __init__(self, left: PlayFilter, right: PlayFilter):
+        self.left = left
+        self.right = right
+
+    def mask(self, columns: PlayColumns) -> np.ndarray:
+        return self.left.mask(columns) | self.right.mask(columns)
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} | {self.right!r})"
+
+
+class _Not(PlayFilter):
+    def __init__(self, inner: PlayFilter):
+        self.inner = inner
+
+    def mask(self, columns: PlayColumns) -> np.ndarray:
+        return ~self.inner.mask(columns)
+
+    def __repr__(self) -> str:
+        return f"~{self.inner!r}"
+
+
+class ColumnIn(PlayFilter):
+    """
+    Matches the plays whose value in a column is one of the given values.
+
+    It is answered from the column's index (see `PlayColumns.index`), so only
+    the matching plays are touched, rather than comparing every play.
+    """
+
+    def __init__(self, column: str, *values):
+        """
+        :param column: the name of the column we want to look at
+        :param values: the values we want to keep; repeated values are only
+            kept once, so each play matches at most once
+        """
+        self.column = column
+        self.values = tuple(dict.fromkeys(values))
+
+    def _groups(self, columns: PlayColumns) -> list[slice | np.ndarray]:
+        index = columns.index(self.column)
+        return [index[value] for value in self.values if value in index]
+
+    def mask(self, columns: PlayColumns) -> np.ndarray:
+        mask = np.zeros(len(columns), dtype=bool)
+        for group in self._groups(columns):
+            mask[group] = True
+        return mask
+
+    def positions(self, columns: PlayColumns) -> np.ndarray:
+        groups = self._groups(columns)
+        if len(groups) == 1 and not isinstance(groups[0], slice):
+            return groups[0]
+        positions = [
+            np.arange(group.start, group.stop) if isinstance(group, slice) else group
+            for group in groups
+        ]
+        if not positions:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(positions))
+
+    def __repr__(self) -> str:
+        values = [repr(value) for value in self.values]
+        if type(self) is ColumnIn:
+            values.insert(0, repr(self.column))
+        return f"{type(self).__name__}({', '.join(values)})"
+
+
+class EventType(ColumnIn):
+    """
+    Matches the plays of the given event types, e.g. `EventType("SHOT", "GOAL")`.
+    """
+
+    def __init__(self, *event_type_ids: str):
+        super().__init__("event_type_id", *event_type_ids)
+
+
+class Period(ColumnIn):
+    """
+    Matches the plays of the given periods, e.g. `Period(3)`.
+    """
+
+    def __init__(self, *periods: int):
+        super().__init__("period", *periods)
+
+
+class TeamId(ColumnIn):
+    """
+    Matches the plays made by the given teams, by team ID.
+    """
+
+    def __init__(self, *team_ids: int):
+        super().__init__("team_id", *team_ids)
+
+
+class Strength(ColumnIn):
+    """
+    Matches the goals scored at the given strengths, e.g. `Strength("PPG")`.
+    """
+
+    def __init__(self, *strength_codes: str):
+        super().__init__("strength_code", *strength_codes)
+
+
+class GamePk(ColumnIn):
+    """
+    Matches the plays of the given games, when the plays of many games are
+    held together.
+    """
+
+    def __init__(self, *game_pks: int):
+        super().__init__("game_pk", *game_pks)
+
+
+class TimeWindow(PlayFilter):
+    """
+    Matches the plays made within a window of period time, start included and
+    end excluded, e.g. `TimeWindow("15:00", "20:00")` for the last five minutes
+    of a regular period. Combine it with `Period` to look at a single period.
+    """
+
+    def __init__(self, start: str | int = 0, end: str | int = None):
+        """
+        :param start: the start of the window, as "MM:SS" or a number of seconds
+        :param end: the end of the window, as "MM:SS" or a number of seconds;
+            there is no end if it is not given
+        """
+        self.start = _seconds(start) if isinstance(start, str) else start
+        self.end = _seconds(end) if isinstance(end, str) else end
+
+    def mask(self, columns: PlayColumns) -> np.ndarray:
+        period_time = columns["period_time"]
+        mask = period_time >= self.start
+        if self.end is not None:
+            mask &= period_time < self.end
+        return mask
+
+    def __repr__(self) -> str:
+        return f"TimeWindow({self.start}, {self.end})"
@@ -7,11 +7,36 @@ from typing import Optional
 from nhl_api_py.core.utils import convert_keys_to_snake_case
 from nhl_api_py.models.base import Model, _field_only_keys
 from nhl_api_py.models.game import Game
+from nhl_api_py.models.team import Team
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _parse_game(game: dict) -> Game:
+    """
+    Helper function which builds a game from one of the games of a schedule.
+    A schedule only holds a summary of each game (its status and teams), laid out
+    differently from the game's live feed.
+
+    :param game: the game, with its keys already converted to snake_case
+    :return: the game, without any plays
+    """
+    teams = game.get("teams", dict())
+    away = teams.get("away", dict()).get("team")
+    home = teams.get("home", dict()).get("team")
+    return Game(
+        pk=game.get("game_pk"),
+        season=game.get("season"),
+        type=game.get("game_type"),
+        date_time=game.get("game_date"),
+        **_field_only_keys(game.get("status", dict()), Game),
+        away=Team.from_dict(away) if away else None,
+        home=Team.from_dict(home) if home else None,
+        venue=game.get("venue"),
+    )
+
+
+@dataclass(slots=True)
 class ScheduleDate(Model):
     date: Optional[str] = None
     total_items: int = 0
@@ -25,8 +50,7 @@ class ScheduleDate(Model):
     @classmethod
     def from_dict(cls, data: dict):
         converted_data = convert_keys_to_snake_case(data)
-        games: list = converted_data.pop("games", [])
+        games: list = converted_data.get("games", [])
         top_level_data = _field_only_keys(converted_data, cls)
-        final_data = {**top_level_data, "games": [Game(game) for game in games]}
-        print(final_data)
+        final_data = {**top_level_data, "games": [_parse_game(game) for game in games]}
         return cls(**final_data)
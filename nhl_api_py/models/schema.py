@@ -0,0 +1,367 @@
+"""
+The schema of the NHL API payloads, declared as `msgspec` Structs, used to decode
+JSON bodies straight into models (see `Model.from_json`).
+
+Each Struct follows the nesting of the JSON, with its snake_case fields renamed
+to the camelCase keys of the API, so the parser fills the fields directly and
+skips every key that is not part of the schema. The Structs are then moved into
+the models field by field, without any intermediate dictionaries.
+
+Free-form sections (e.g. a team's `venue`, or a game's `players`) are not part of
+the schema; they are decoded as they are and have their keys converted, exactly
+as `from_dict` does. The models built here are equal to the ones built by
+`from_dict` for the same payload.
+
+This module requires `msgspec`.
+"""
+from __future__ import annotations
+
+import logging
+from functools import cache
+from typing import Any, Optional, Type, Union
+
+import msgspec
+
+from nhl_api_py.core.utils import convert_keys_to_snake_case
+from nhl_api_py.models.base import Model
+from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.models.schedule import ScheduleDate, _parse_game
+from nhl_api_py.models.team import Team
+
+logger = logging.getLogger(__name__)
+
+
+class _Schema(msgspec.Struct, rename="camel"):
+    pass
+
+
+class TeamSchema(_Schema):
+    id: Optional[int] = None
+    name: Optional[str] = None
+    link: Optional[str] = None
+    venue: Any = None
+    abbreviation: Optional[str] = None
+    team_name: Optional[str] = None
+    location_name: Optional[str] = None
+    first_year_of_play: Union[int, str, None] = None
+    division: Any = None
+    conference: Any = None
+    franchise: Any = None
+    team_stats: Any = None
+    roster: Any = None
+    short_name: Optional[str] = None
+    official_site_url: Optional[str] = None
+    franchise_id: Optional[int] = None
+    active: Optional[bool] = None
+
+
+class PlayResultSchema(_Schema):
+    event: Optional[str] = None
+    event_type_id: Optional[str] = None
+    description: Optional[str] = None
+    secondary_type: Optional[str] = None
+    game_winning_goal: Optional[bool] = None
+    empty_net: Optional[bool] = None
+    penalty_severity: Optional[str] = None
+    penalty_minutes: Union[int, str, None] = None
+
+
+class PlayAboutSchema(_Schema):
+    period: Optional[int] = None
+    period_type: Optional[str] = None
+    ordinal_num: Optional[str] = None
+    period_time: Optional[str] = None
+    period_time_remaining: Optional[str] = None
+    date_time: Optional[str] = None
+
+
+class PlaySchema(_Schema):
+    result: PlayResultSchema = msgspec.field(default_factory=PlayResultSchema)
+    about: PlayAboutSchema = msgspec.field(default_factory=PlayAboutSchema)
+    players: Any = None
+    coordinates: Any = None
+    team: Optional[TeamSchema] = None
+
+
+class GameInfoSchema(_Schema):
+    pk: Optional[int] = None
+    season: Optional[str] = None
+    type: Optional[str] = None
+
+
+class GameDatetimeSchema(_Schema):
+    date_time: Optional[str] = None
+    end_date_time: Optional[str] = None
+
+
+class GameStatusSchema(_Schema):
+    abstract_game_state: Optional[str] = None
+    coded_game_state: Optional[str] = None
+    detailed_state: Optional[str] = None
+    status_code: Optional[str] = None
+    start_time_tbd: Optional[bool] = None
+
+
+class GameTeamsSchema(_Schema):
+    away: Optional[TeamSchema] = None
+    home: Optional[TeamSchema] = None
+
+
+class GameDataSchema(_Schema):
+    game: GameInfoSchema = msgspec.field(default_factory=GameInfoSchema)
+    datetime: GameDatetimeSchema = msgspec.field(default_factory=GameDatetimeSchema)
+    status: GameStatusSchema = msgspec.field(default_factory=GameStatusSchema)
+    teams: GameTeamsSchema = msgspec.field(default_factory=GameTeamsSchema)
+    players: Any = None
+    venue: Any = None
+
+
+class PlaysSchema(_Schema):
+    all_plays: list[PlaySchema] = msgspec.field(default_factory=list)
+    scoring_plays: Any = None
+    penalty_plays: Any = None
+    plays_by_period: Any = None
+    current_play: Optional[PlaySchema] = None
+
+
+class LiveDataSchema(_Schema):
+    plays: PlaysSchema = msgspec.field(default_factory=PlaysSchema)
+    decisions: Any = None
+
+
+class GameSchema(_Schema):
+    game_data: GameDataSchema = msgspec.field(default_factory=GameDataSchema)
+    live_data: LiveDataSchema = msgspec.field(default_factory=LiveDataSchema)
+
+
+class BoxscoreTeamSchema(_Schema):
+    team: Optional[TeamSchema] = None
+    team_stats: Any = None
+    players: Any = None
+    goalies: Any = None
+    skaters: Any = None
+    on_ice: Any = None
+    on_ice_plus: Any = None
+    scratchers: Any = None
+    penalty_box: Any = None
+    coaches: Any = None
+
+
+class BoxscoreTeamsSchema(_Schema):
+    away: BoxscoreTeamSchema = msgspec.field(default_factory=BoxscoreTeamSchema)
+    home: BoxscoreTeamSchema = msgspec.field(default_factory=BoxscoreTeamSchema)
+
+
+class BoxscoreSchema(_Schema):
+    teams: BoxscoreTeamsSchema = msgspec.field(default_factory=BoxscoreTeamsSchema)
+    officials: Any = None
+
+
+class ScheduleDateSchema(_Schema):
+    date: Optional[str] = None
+    total_items: int = 0
+    total_events: int = 0
+    total_games: int = 0
+    total_matches: int = 0
+    games: Any = msgspec.field(default_factory=list)
+    events: Any = msgspec.field(default_factory=list)
+    matches: Any = msgspec.field(default_factory=list)
+
+
+def _snake(value: Any) -> Any:
+    """
+    Converts the keys of a free-form section, as `from_dict` does.
+
+    :param value: the decoded section
+    :return: the section with snake_case keys
+    """
+    if isinstance(value, (dict, list)):
+        return convert_keys_to_snake_case(value)
+    return value
+
+
+def _team(team: Optional[TeamSchema]) -> Optional[Team]:
+    # An empty team object becomes no team at all, as in `from_dict`.
+    if team is None or all(value is None for value in msgspec.structs.astuple(team)):
+        return None
+    return Team(
+        team.id,
+        team.name,
+        team.link,
+        _snake(team.venue),
+        team.abbreviation,
+        team.team_name,
+        team.location_name,
+        team.first_year_of_play,
+        _snake(team.division),
+        _snake(team.conference),
+        _snake(team.franchise),
+        _snake(team.team_stats),
+        _snake(team.roster),
+        team.short_name,
+        team.official_site_url,
+        team.franchise_id,
+        team.active,
+    )
+
+
+def _play(play: PlaySchema) -> Play:
+    result, about = play.result, play.about
+    return Play(
+        players=_snake(play.players),
+        event=result.event,
+        event_type_id=result.event_type_id,
+        description=result.description,
+        secondary_type=result.secondary_type,
+        game_winning_goal=result.game_winning_goal,
+        empty_net=result.empty_net,
+        penalty_severity=result.penalty_severity,
+        penalty_minutes=result.penalty_minutes,
+        period=about.period,
+        period_type=about.period_type,
+        ordinal_num=about.ordinal_num,
+        period_time=about.period_time,
+        period_time_remaining=about.period_time_remaining,
+        date_time=about.date_time,
+        coordinates=_snake(play.coordinates),
+        team=_team(play.team),
+    )
+
+
+def _game(game: GameSchema) -> Game:
+    game_data, live_data = game.game_data, game.live_data
+    plays = live_data.plays
+    current_play = plays.current_play
+    # An empty current play becomes no play at all, as in `from_dict`.
+    if current_play is not None and current_play == PlaySchema():
+        current_play = None
+    return Game(
+        pk=game_data.game.pk,
+        season=game_data.game.season,
+        type=game_data.game.type,
+        date_time=game_data.datetime.date_time,
+        end_date_time=game_data.datetime.end_date_time,
+        abstract_game_state=game_data.status.abstract_game_state,
+        coded_game_state=game_data.status.coded_game_state,
+        detailed_state=game_data.status.detailed_state,
+        status_code=game_data.status.status_code,
+        start_time_tbd=game_data.status.start_time_tbd,
+        away=_team(game_data.teams.away),
+        home=_team(game_data.teams.home),
+        players=_snake(game_data.players),
+        venue=_snake(game_data.venue),
+        all_plays=[_play(play) for play in plays.all_plays] or None,
+        scoring_plays=plays.scoring_plays,
+        penalty_plays=plays.penalty_plays,
+        plays_by_period=_snake(plays.plays_by_period),
+        current_play=_play(current_play) if current_play is not None else None,
+        decisions=_snake(live_data.decisions),
+    )
+
+
+def _boxscore(boxscore: BoxscoreSchema) -> Boxscore:
+    away, home = boxscore.teams.away, boxscore.teams.home
+    return Boxscore(
+        _team(away.team),
+        _snake(away.team_stats),
+        _snake(away.players),
+        away.goalies,
+        away.skaters,
+        away.on_ice,
+        _snake(away.on_ice_plus),
+        _snake(away.scratchers),
+        _snake(away.penalty_box),
+        _snake(away.coaches),
+        _team(home.team),
+        _snake(home.team_stats),
+        _snake(home.players),
+        home.goalies,
+        home.skaters,
+        home.on_ice,
+        _snake(home.on_ice_plus),
+        _snake(home.scratchers),
+        _snake(home.penalty_box),
+        _snake(home.coaches),
+        _snake(boxscore.officials),
+    )
+
+
+def _schedule_date(date: ScheduleDateSchema) -> ScheduleDate:
+    return ScheduleDate(
+        date.date,
+        date.total_items,
+        date.total_events,
+        date.total_games,
+        date.total_matches,
+        # Only a summary of each game, built as `from_dict` does.
+        [_parse_game(game) for game in _snake(date.games)],
+        _snake(date.events),
+        _snake(date.matches),
+    )
+
+
+# The schema of each model, and how a decoded Struct is moved into the model.
+_SCHEMAS = {
+    Team: (TeamSchema, lambda team: _team(team) or Team()),
+    Play: (PlaySchema, _play),
+    Game: (GameSchema, _game),
+    Boxscore: (BoxscoreSchema, _boxscore),
+    ScheduleDate: (ScheduleDateSchema, _schedule_date),
+}
+_DECODERS = {
+    cls: (msgspec.json.Decoder(schema), build)
+    for cls, (schema, build) in _SCHEMAS.items()
+}
+
+
+def supports(cls: Type[Model]) -> bool:
+    """
+    :param cls: a model
+    :return: whether the model has a schema
+    """
+    return cls in _SCHEMAS
+
+
+def decode(content: bytes, cls: Type[Model]) -> Model:
+    """
+    Decodes a JSON body straight into a model, following the schema above.
+
+    :param content: the raw JSON body
+    :param cls: the model the body holds
+    :return: an instance of the model
+    :raises KeyError: if the model has no schema
+    :raises msgspec.ValidationError: if the body does not follow the schema
+    """
+    decoder, build = _DECODERS[cls]
+    return build(decoder.decode(content))
+
+
+@cache
+def _list_decoder(cls: Type[Model], key: str) -> msgspec.json.Decoder:
+    """
+    :return: a decoder of bodies holding a list of models under a key, created
+        once per model and key
+    """
+    schema = _SCHEMAS[cls][0]
+    wrapper = msgspec.defstruct(
+        f"{schema.__name__}List",
+        [(key, Optional[list[schema]], None)],
+    )
+    return msgspec.json.Decoder(wrapper)
+
+
+def decode_list(content: bytes, cls: Type[Model], key: str) -> list[Model]:
+    """
+    Decodes a JSON body holding a list of models under a key (e.g. the `teams` of
+    a teams response) straight into the models.
+
+    :param content: the raw JSON body
+    :param cls: the model the list holds
+    :param key: the key of the list
+    :return: the models, none if the key is missing
+    :raises KeyError: if the model has no schema
+    :raises msgspec.ValidationError: if the body does not follow the schema
+    """
+    build = _SCHEMAS[cls][1]
+    items = getattr(_list_decoder(cls, key).decode(content), key)
+    return [build(item) for item in items or []]
@@ -10,7 +10,7 @@ from nhl_api_py.models.base import Model, _field_only_keys
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Team(Model):
     """
     Represents and contains all data for a single team, returned from the NHL API.
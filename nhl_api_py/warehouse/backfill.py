@@ -0,0 +1,226 @@
+"""
+Backfills the games of whole seasons into a warehouse, and picks up where it
+left off when run again.
+
+The games of each season are listed from `NhlApi.schedule`, then their feeds and
+boxscores are fetched in parallel and written in batches. Each written game is
+checkpointed (its pk, its detailed state and a hash of its content) in the same
+batch, so on a rerun only the games which are missing, or were not final yet,
+are fetched again, and only the ones whose content changed are written again.
+
+Run with e.g. `python -m nhl_api_py.warehouse.backfill 2021 2022 --database
+nhl.sqlite3`.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+from nhl_api_py.core.api import NhlApi
+from nhl_api_py.core.batch import BatchResult, fan_out
+from nhl_api_py.core.throttle import TokenBucket
+from nhl_api_py.models.game import Boxscore, Game
+from nhl_api_py.warehouse.base import Warehouse
+from nhl_api_py.warehouse.sqlite import SqliteWarehouse
+from nhl_api_py.warehouse.tables import Checkpoint
+
+logger = logging.getLogger(__name__)
+
+# The detailed state of a game whose data will not change anymore.
+FINAL_STATE = "Final"
+# The abstract state of a game which has not started yet.
+PREVIEW_STATE = "Preview"
+
+
+def content_hash(*payloads: dict) -> str:
+    """
+    Hashes the payloads a game is built from, rather than the models, so the
+    checkpoints stay valid when the models change.
+
+    :param payloads: the data of the game's responses, e.g. its feed and boxscore
+    :return: a hash of everything retrieved about the game
+    """
+    canonical = json.dumps(payloads, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass
+class BackfillReport:
+    """
+    What a backfill did with the games of the schedule.
+    """
+
+    scheduled: int = 0
+    up_to_date: int = 0
+    not_started: int = 0
+    fetched: int = 0
+    written: int = 0
+    failed: dict[int, Exception] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.scheduled} games scheduled: {self.up_to_date} up to date, "
+            + f"{self.not_started} not started, {self.fetched} fetched, "
+            + f"{self.written} written, {len(self.failed)} failed"
+        )
+
+
+class Backfill:
+    """
+    Syncs the games of whole seasons from the NHL API into a warehouse.
+    """
+
+    def __init__(
+        self,
+        api: NhlApi,
+        warehouse: Warehouse,
+        max_workers: int = None,
+        boxscores: bool = True,
+    ):
+        """
+        :param api: the client the games are fetched with; its rate limiter and
+            concurrency limit, if any, apply to the backfill
+        :param warehouse: where the games are written
+        :param max_workers: the number of games fetched at once, defaults to the
+            client's maximum pool size
+        :param boxscores: whether the boxscore of each game is fetched too
+        """
+        self.api = api
+        self.warehouse = warehouse
+        self.max_workers = max_workers or api.max_workers
+        self.boxscores = boxscores
+
+    def _fetch(self, game_pk: int) -> tuple[Game, Optional[Boxscore], str]:
+        """
+        :param game_pk: the ID of the game
+        :return: the game, its boxscore if boxscores are fetched, and the hash of
+            their payloads
+        """
+        feed = self.api.get(f"game/{game_pk}/feed/live").data
+        payloads = [feed]
+        game, boxscore = Game.from_dict(feed), None
+        if self.boxscores:
+            payloads.append(self.api.get(f"game/{game_pk}/boxscore").data)
+            boxscore = Boxscore.from_dict(payloads[-1])
+        return game, boxscore, content_hash(*payloads)
+
+    def _changed(
+        self,
+        results: Iterable[BatchResult[tuple[Game, Optional[Boxscore], str]]],
+        checkpoints: dict[int, Checkpoint],
+        report: BackfillReport,
+    ) -> Iterator[tuple[Game, Optional[Boxscore], Checkpoint]]:
+        """
+        Keeps the fetched games whose content changed since their checkpoint.
+
+        :param results: the fetched games and boxscores, by game ID
+        :param checkpoints: the stored checkpoints, by game ID
+        :param report: where failures and fetched games are counted
+        :return: a generator of each changed game, its boxscore and its new
+            checkpoint
+        """
+        for result in results:
+            if not result.ok:
+                logger.warning(f"Could not fetch game {result.key}: {result.error}")
+                report.failed[result.key] = result.error
+                continue
+            report.fetched += 1
+            game, boxscore, payload_hash = result.value
+            checkpoint = Checkpoint(result.key, game.detailed_state, payload_hash)
+            previous = checkpoints.get(result.key)
+            if previous is None or previous.content_hash != checkpoint.content_hash:
+                yield game, boxscore, checkpoint
+
+    def season(
+        self, season_start_year: int, game_type: str = None, report=None
+    ) -> BackfillReport:
+        """
+        Syncs the games of one season.
+
+        :param season_start_year: the start year of the season (e.g. 2022 for the
+            2022 - 2023 season)
+        :param game_type: only the games of this type (e.g. "R"), if given
+        :param report: the report the games are counted in, a new one if not
+            given
+        :return: the report
+        """
+        report = report if report is not None else BackfillReport()
+        dates = self.api.schedule(
+            season_start_year=season_start_year, game_type=game_type
+        )
+        self.warehouse.write_schedule(dates)
+        games = {game.pk: game for date in dates for game in date.games}
+        games.pop(None, None)
+        report.scheduled += len(games)
+        checkpoints = self.warehouse.checkpoints(games)
+        pending = []
+        for game_pk, summary in games.items():
+            checkpoint = checkpoints.get(game_pk)
+            if checkpoint is not None and checkpoint.detailed_state == FINAL_STATE:
+                report.up_to_date += 1
+            elif summary.abstract_game_state == PREVIEW_STATE:
+                report.not_started += 1
+            else:
+                pending.append(game_pk)
+        logger.info(
+            f"Season {season_start_year}: fetching {len(pending)} of {len(games)} "
+            + "games"
+        )
+        results = fan_out(self._fetch, pending, self.max_workers)
+        report.written += self.warehouse.write_checkpointed(
+            self._changed(results, checkpoints, report)
+        )
+        return report
+
+    def run(self, seasons: Iterable[int], game_type: str = None) -> BackfillReport:
+        """
+        Syncs the games of many seasons, one after the other.
+
+        :param seasons: the start years of the seasons
+        :param game_type: only the games of this type (e.g. "R"), if given
+        :return: what was done with the games of all seasons
+        """
+        report = BackfillReport()
+        for season in seasons:
+            self.season(season, game_type=game_type, report=report)
+            logger.info(f"Backfilled season {season}: {report}")
+        return report
+
+
+def main(argv: list[str] = None) -> BackfillReport:
+    parser = argparse.ArgumentParser(
+        description="Backfills the games of NHL seasons into a local warehouse."
+    )
+    parser.add_argument("seasons", nargs="+", type=int, help="e.g. 2022")
+    parser.add_argument("--database", default="nhl.sqlite3", help="SQLite file")
+    parser.add_argument(
+        "--parquet", help="write a Parquet dataset to this directory instead"
+    )
+    parser.add_argument("--game-type", help='e.g. "R" for regular season games')
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--rate", type=float, help="maximum requests per second")
+    parser.add_argument("--no-boxscores", action="store_true")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    if args.parquet:
+        from nhl_api_py.warehouse.parquet import ParquetWarehouse
+
+        warehouse = ParquetWarehouse(args.parquet)
+    else:
+        warehouse = SqliteWarehouse(args.database)
+    rate_limiter = TokenBucket(args.rate, burst=args.workers) if args.rate else None
+    with NhlApi(pool_maxsize=args.workers, rate_limiter=rate_limiter) as api:
+        with warehouse:
+            backfill = Backfill(api, warehouse, boxscores=not args.no_boxscores)
+            report = backfill.run(args.seasons, game_type=args.game_type)
+    print(report)
+    return report
+
+
+if __name__ == "__main__":
+    main()
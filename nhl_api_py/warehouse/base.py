@@ -0,0 +1,192 @@
+"""
+The base class of the warehouses, which store the models retrieved by `NhlApi` in
+local tables, so they can be read again without sending any request.
+"""
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Optional, TypeVar
+
+from nhl_api_py.core.batch import BatchResult
+from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.models.schedule import ScheduleDate
+from nhl_api_py.models.team import Team
+from nhl_api_py.warehouse.tables import Checkpoint, Rows
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Warehouse(ABC):
+    """
+    Base class for all warehouses.
+
+    Models are split into the rows of normalized tables (see
+    `nhl_api_py.warehouse.tables`), and written in batches of `batch_size`
+    models. Writing a row whose key is already stored updates it (an upsert), so
+    the same data can be ingested again safely.
+    """
+
+    def __init__(self, batch_size: int = 1000):
+        """
+        :param batch_size: the number of models written together
+        """
+        self.batch_size = batch_size
+
+    @abstractmethod
+    def _write(self, rows: Rows) -> None:  # pragma: no cover
+        """
+        Writes a batch of rows at once.
+
+        :param rows: the rows of each table, and the number of plays of each game
+            whose plays were written
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def checkpoints(
+        self, game_pks: Iterable[int]
+    ) -> dict[int, Checkpoint]:  # pragma: no cover
+        """
+        :param game_pks: the IDs of the games we want the checkpoints of
+        :return: the stored checkpoints of those games, by game ID; games which
+            were never checkpointed are missing
+        """
+        raise NotImplementedError
+
+    def _write_batches(
+        self, items: Iterable[T], add: Callable[[Rows, T], object]
+    ) -> int:
+        """
+        Splits items into rows, writing them once a batch is full.
+
+        :param items: the items we want to write
+        :param add: adds the rows of one item
+        :return: the number of items written
+        """
+        rows, pending, written = Rows(), 0, 0
+        for item in items:
+            add(rows, item)
+            pending += 1
+            if pending >= self.batch_size:
+                self._write(rows)
+                rows, written, pending = Rows(), written + pending, 0
+        if pending:
+            self._write(rows)
+        return written + pending
+
+    def write_teams(self, teams: Iterable[Team]) -> int:
+        """
+        :param teams: the teams we want to store
+        :return: the number of teams written
+        """
+        return self._write_batches(teams, Rows.add_team)
+
+    def write_games(self, games: Iterable[Game]) -> int:
+        """
+        :param games: the games we want to store, along with their teams and
+            plays; the plays replace any stored plays of the same games
+        :return: the number of games written
+        """
+        return self._write_batches(games, Rows.add_game)
+
+    def write_plays(self, game_pk: int, plays: Iterable[Play]) -> int:
+        """
+        :param game_pk: the ID of the game the plays were made in
+        :param plays: all the plays of the game, in order; they replace any
+            stored plays of the game
+        :return: the number of plays written
+        """
+        rows = Rows()
+        rows.add_plays(game_pk, plays)
+        self._write(rows)
+        return rows.play_counts[game_pk]
+
+    def write_boxscores(self, boxscores: Iterable[tuple[int, Boxscore]]) -> int:
+        """
+        :param boxscores: pairs of a game ID and the boxscore of that game
+        :return: the number of boxscores written
+        """
+        return self._write_batches(
+            boxscores, lambda rows, pair: rows.add_boxscore(*pair)
+        )
+
+    def write_schedule(self, dates: Iterable[ScheduleDate]) -> int:
+        """
+        :param dates: the dates we want to store, along with a summary of their
+            games
+        :return: the number of dates written
+        """
+        return self._write_batches(dates, Rows.add_schedule_date)
+
+    def write_checkpointed(
+        self, items: Iterable[tuple[Game, Optional[Boxscore], Checkpoint]]
+    ) -> int:
+        """
+        Writes games along with their boxscore and their checkpoint. A game and
+        its checkpoint are always in the same batch, so a game is never
+        checkpointed unless it was written too.
+
+        :param items: each game, its boxscore if any, and its checkpoint
+        :return: the number of games written
+        """
+
+        def add(rows: Rows, item: tuple[Game, Optional[Boxscore], Checkpoint]):
+            game, boxscore, checkpoint = item
+            rows.add_game(game)
+            if boxscore is not None:
+                rows.add_boxscore(game.pk, boxscore)
+            rows.add_checkpoint(checkpoint)
+
+        return self._write_batches(items, add)
+
+    def ingest(self, results: Iterable[BatchResult]) -> int:
+        """
+        Stores the results of a batch call of `NhlApi` (e.g. `NhlApi.games` or
+        `boxscores`) as they come in. The key of each result is taken as its game
+        ID. Results holding an error are skipped.
+
+        Lists of plays (from `plays_many`) are rejected: they may only hold the
+        scoring or penalty plays of a game, which cannot be told apart from all
+        of its plays, and would replace its stored plays. Ingest the results of
+        `games` instead, or write all the plays of a game with `write_plays`.
+
+        :param results: the results of the batch call
+        :return: the number of results written
+        :raises TypeError: if a result holds something which cannot be stored
+        """
+
+        def add(rows: Rows, result: BatchResult) -> None:
+            value = result.value
+            if isinstance(value, Game):
+                rows.add_game(value)
+            elif isinstance(value, Boxscore):
+                rows.add_boxscore(result.key, value)
+            elif isinstance(value, Team):
+                rows.add_team(value)
+            elif isinstance(value, ScheduleDate):
+                rows.add_schedule_date(value)
+            else:
+                raise TypeError(f"Cannot store {type(value).__name__} results")
+
+        def successful(results: Iterable[BatchResult]) -> Iterable[BatchResult]:
+            for result in results:
+                if result.ok:
+                    yield result
+                else:
+                    logger.warning(f"Skipping {result.key}: {result.error}")
+
+        return self._write_batches(successful(results), add)
+
+    def close(self) -> None:
+        """
+        Releases any resource held by the warehouse.
+        """
+
+    def __enter__(self) -> Warehouse:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,241 @@
+"""
+A warehouse stored as a partitioned Parquet dataset, one directory per table.
+
+Tables of games are partitioned by season, and plays by season and game, in the
+Hive layout (e.g. `plays/season=20222023/game_pk=2022020001/part-0.parquet`),
+so readers such as pandas, pyarrow, DuckDB or Spark only open the files of the
+seasons and games they filter on. Partition columns are not repeated inside the
+files.
+
+This module requires `pyarrow`.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from nhl_api_py.warehouse.base import Warehouse
+from nhl_api_py.warehouse.tables import (
+    BOXSCORES,
+    CHECKPOINTS,
+    GAMES,
+    PLAYS,
+    SCHEDULE,
+    TABLES,
+    TEAMS,
+    Checkpoint,
+    Row,
+    Rows,
+    Table,
+    merge,
+    season_of,
+)
+
+logger = logging.getLogger(__name__)
+
+_ARROW_TYPES = {
+    "INTEGER": pa.int64(),
+    "REAL": pa.float64(),
+    "BOOLEAN": pa.bool_(),
+    "TEXT": pa.string(),
+    "JSON": pa.string(),
+}
+
+# The column holding the game ID of each table's rows, which picks its season.
+_GAME_COLUMNS = {
+    GAMES: "pk",
+    PLAYS: "game_pk",
+    BOXSCORES: "game_pk",
+    SCHEDULE: "game_pk",
+    CHECKPOINTS: "game_pk",
+}
+_PARTITIONS = {
+    TEAMS: (),
+    GAMES: ("season",),
+    PLAYS: ("season", "game_pk"),
+    BOXSCORES: ("season",),
+    SCHEDULE: ("season",),
+    CHECKPOINTS: ("season",),
+}
+
+Partition = tuple[tuple[str, object], ...]
+
+
+def _partition(table: Table, row: Row) -> Partition:
+    """
+    :param table: the table the row belongs to
+    :param row: the row we want to write
+    :return: the name and value of each partition column of the row
+    """
+    if not _PARTITIONS[table]:
+        return ()
+    game_pk = row[list(table.columns).index(_GAME_COLUMNS[table])]
+    values = {"season": season_of(game_pk), "game_pk": game_pk}
+    return tuple((name, values[name]) for name in _PARTITIONS[table])
+
+
+def _schema(table: Table, names: list[str]) -> pa.Schema:
+    # Seasons are the only partition column which may not be a column.
+    return pa.schema(
+        [(name, _ARROW_TYPES[table.columns.get(name, "TEXT")]) for name in names]
+    )
+
+
+def _sort_key(key: tuple) -> tuple:
+    """
+    :param key: the key of a row, whose values may be None
+    :return: what the key is sorted on: its values in order, None last
+    """
+    return tuple((value is None, value) for value in key)
+
+
+class ParquetWarehouse(Warehouse):
+    """
+    Stores NHL data as a Parquet dataset in a directory.
+
+    Each partition is a single file, rewritten whole (and atomically) whenever
+    one of its rows is written: stored rows are merged with the new ones on
+    their key, and the plays of a game replace its stored plays.
+    """
+
+    def __init__(self, root: str | Path, batch_size: int = 1000):
+        """
+        :param root: the directory of the dataset, created if missing
+        :param batch_size: the number of models written together; the larger it
+            is, the fewer times each partition is rewritten
+        """
+        super().__init__(batch_size=batch_size)
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, table: Table, partition: Partition) -> Path:
+        directory = self.root / table.name
+        for name, value in partition:
+            directory /= f"{name}={value}"
+        return directory / "part-0.parquet"
+
+    def _write(self, rows: Rows) -> None:
+        for table in TABLES:
+            partitions: dict[Partition, list[Row]] = defaultdict(list)
+            for row in rows.tables[table].values():
+                partitions[_partition(table, row)].append(row)
+            for partition, partition_rows in partitions.items():
+                self._write_partition(table, partition, partition_rows)
+        for game_pk, count in rows.play_counts.items():
+            if count == 0:
+                path = self._path(PLAYS, _partition(PLAYS, (game_pk,)))
+                path.unlink(missing_ok=True)
+
+    def _read_partition(self, table: Table, partition: Partition) -> list[Row]:
+        path = self._path(table, partition)
+        if not path.exists():
+            return []
+        values = dict(partition)
+        return [
+            tuple(stored.get(name, values.get(name)) for name in table.columns)
+            for stored in pq.read_table(path).to_pylist()
+        ]
+
+    def _write_partition(
+        self, table: Table, partition: Partition, rows: list[Row]
+    ) -> None:
+        """
+        Merges rows into a partition, and writes the partition's file again.
+
+        :param table: the table the rows belong to
+        :param partition: the partition the rows belong to
+        :param rows: the rows we want to write
+        """
+        by_key: dict[tuple, Row] = {}
+        # A partition of plays holds all the plays of a game, replaced together.
+        if table is not PLAYS:
+            by_key = {
+                table.row_key(row): row
+                for row in self._read_partition(table, partition)
+            }
+        for row in rows:
+            key = table.row_key(row)
+            by_key[key] = merge(table, by_key.get(key), row)
+        ordered = [by_key[key] for key in sorted(by_key, key=_sort_key)]
+        excluded = dict(partition)
+        schema = _schema(
+            table, [name for name in table.columns if name not in excluded]
+        )
+        data = pa.table(
+            [
+                [row[position] for row in ordered]
+                for position, name in enumerate(table.columns)
+                if name not in excluded
+            ],
+            schema=schema,
+        )
+        path = self._path(table, partition)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a hidden temporary file first, so readers never see a partial
+        # file.
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=".")
+        os.close(descriptor)
+        try:
+            pq.write_table(data, temporary)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def checkpoints(self, game_pks: Iterable[int]) -> dict[int, Checkpoint]:
+        game_pks = set(game_pks)
+        seasons = {season_of(game_pk) for game_pk in game_pks}
+        checkpoints = {}
+        for season in seasons:
+            stored = self.read("checkpoints", season=season)
+            for game_pk, detailed_state, content_hash in zip(
+                stored["game_pk"], stored["detailed_state"], stored["content_hash"]
+            ):
+                if game_pk in game_pks:
+                    checkpoints[game_pk] = Checkpoint(
+                        int(game_pk), detailed_state, content_hash
+                    )
+        return checkpoints
+
+    def read(self, table: str, **filters) -> pd.DataFrame:
+        """
+        Reads a table of the dataset, only opening the partitions which match the
+        filters.
+
+        :param table: the name of the table (e.g. "plays")
+        :param filters: the values the columns must be equal to, e.g.
+            `season="20222023"`
+        :return: the matching rows, with JSON columns left as text
+        """
+        layout = next(layout for layout in TABLES if layout.name == table)
+        partitions = _PARTITIONS[layout]
+        schema = _schema(
+            layout,
+            list(layout.columns)
+            + [name for name in partitions if name not in layout.columns],
+        )
+        directory = self.root / table
+        if not directory.exists():
+            return schema.empty_table().to_pandas()
+        dataset = ds.dataset(
+            directory,
+            schema=schema,
+            format="parquet",
+            partitioning=ds.partitioning(
+                pa.schema([schema.field(name) for name in partitions]), flavor="hive"
+            ),
+        )
+        expression = None
+        for name, value in filters.items():
+            condition = ds.field(name) == value
+            expression = condition if expression is None else expression & condition
+        return dataset.to_table(filter=expression).to_pandas()
@@ -0,0 +1,250 @@
+"""
+A warehouse stored in a SQLite database.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+
+from nhl_api_py.core.decoder import decode
+from nhl_api_py.models.game import Game, Play
+from nhl_api_py.models.team import Team
+from nhl_api_py.warehouse.base import Warehouse
+from nhl_api_py.warehouse.tables import (
+    GAMES,
+    PLAYS,
+    TABLES,
+    TEAMS,
+    Checkpoint,
+    Rows,
+    Table,
+)
+
+logger = logging.getLogger(__name__)
+
+_SQL_TYPES = {"JSON": "TEXT"}
+# Stays well below SQLite's limit on the number of parameters of a query.
+_CHUNK_SIZE = 500
+
+
+def _create(table: Table) -> list[str]:
+    """
+    :param table: the table we want to create
+    :return: the statements creating the table and its indexes, if missing
+    """
+    columns = ", ".join(
+        f"{name} {_SQL_TYPES.get(kind, kind)}" for name, kind in table.columns.items()
+    )
+    statements = [
+        f"CREATE TABLE IF NOT EXISTS {table.name} "
+        + f"({columns}, PRIMARY KEY ({', '.join(table.key)}))"
+    ]
+    for index in table.indexes:
+        statements.append(
+            f"CREATE INDEX IF NOT EXISTS {table.name}_{'_'.join(index)} "
+            + f"ON {table.name} ({', '.join(index)})"
+        )
+    return statements
+
+
+def _upsert(table: Table) -> str:
+    """
+    :param table: the table we want to write rows to
+    :return: the statement inserting a row, or updating the row with the same
+        key; merged tables keep the stored values the new row has none for
+    """
+    updates = ", ".join(
+        f"{name} = COALESCE(excluded.{name}, {table.name}.{name})"
+        if table.merged
+        else f"{name} = excluded.{name}"
+        for name in table.columns
+        if name not in table.key
+    )
+    return (
+        f"INSERT INTO {table.name} ({', '.join(table.columns)}) "
+        + f"VALUES ({', '.join('?' for _ in table.columns)}) "
+        + f"ON CONFLICT ({', '.join(table.key)}) "
+        + (f"DO UPDATE SET {updates}" if updates else "DO NOTHING")
+    )
+
+
+def _decode(table: Table, row: sqlite3.Row) -> dict:
+    """
+    :param table: the table the row was read from
+    :param row: the row, holding some of the table's columns
+    :return: the row's values by column, with JSON decoded and booleans restored
+    """
+    values = {}
+    for name in row.keys():
+        value = row[name]
+        kind = table.columns.get(name)
+        if value is not None and kind == "JSON":
+            value = decode(value)
+        elif value is not None and kind == "BOOLEAN":
+            value = bool(value)
+        values[name] = value
+    return values
+
+
+class SqliteWarehouse(Warehouse):
+    """
+    Stores NHL data in a SQLite database, which can be a file or in memory.
+
+    Rows are written with one `executemany` per table and batch, in a single
+    transaction, and upserted on their key. The database is safe to share
+    between threads.
+    """
+
+    def __init__(self, path: str | Path = ":memory:", batch_size: int = 1000):
+        """
+        :param path: the file of the database, created if missing; by default,
+            the database is only kept in memory
+        :param batch_size: the number of models written together
+        """
+        super().__init__(batch_size=batch_size)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        with self._connection:
+            for table in TABLES:
+                for statement in _create(table):
+                    self._connection.execute(statement)
+        self._upserts = {table: _upsert(table) for table in TABLES}
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _write(self, rows: Rows) -> None:
+        with self._lock, self._connection:
+            for table in TABLES:
+                if rows.tables[table]:
+                    self._connection.executemany(
+                        self._upserts[table], rows.tables[table].values()
+                    )
+            self._connection.executemany(
+                "DELETE FROM plays WHERE game_pk = ? AND play_index >= ?",
+                rows.play_counts.items(),
+            )
+        logger.debug(
+            "Wrote "
+            + ", ".join(f"{len(rows.tables[table])} {table.name}" for table in TABLES)
+        )
+
+    def _select(self, sql: str, parameters: Iterable = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._connection.execute(sql, tuple(parameters)).fetchall()
+
+    def read_sql(self, sql: str, parameters: Iterable = ()) -> pd.DataFrame:
+        """
+        Runs any query against the warehouse.
+
+        :param sql: the query, with `?` placeholders
+        :param parameters: the values of the placeholders
+        :return: the rows the query returns
+        """
+        with self._lock:
+            return pd.read_sql_query(sql, self._connection, params=tuple(parameters))
+
+    def checkpoints(self, game_pks: Iterable[int]) -> dict[int, Checkpoint]:
+        game_pks = list(game_pks)
+        checkpoints = {}
+        for start in range(0, len(game_pks), _CHUNK_SIZE):
+            chunk = game_pks[start : start + _CHUNK_SIZE]
+            rows = self._select(
+                "SELECT game_pk, detailed_state, content_hash FROM checkpoints "
+                + f"WHERE game_pk IN ({', '.join('?' for _ in chunk)})",
+                chunk,
+            )
+            checkpoints.update((row[0], Checkpoint(*row)) for row in rows)
+        return checkpoints
+
+    def teams(self, team_ids: Iterable[int] = None) -> list[Team]:
+        """
+        :param team_ids: the teams we want, or all stored teams if not given
+        :return: the teams, by ID
+        """
+        sql = "SELECT * FROM teams"
+        team_ids = list(team_ids) if team_ids is not None else None
+        if team_ids is not None:
+            sql += f" WHERE id IN ({', '.join('?' for _ in team_ids)})"
+        rows = self._select(sql + " ORDER BY id", team_ids or ())
+        return [Team(**_decode(TEAMS, row)) for row in rows]
+
+    def _games(self, rows: list[sqlite3.Row]) -> list[Game]:
+        team_ids = {row[side] for row in rows for side in ("away_id", "home_id")}
+        teams = {team.id: team for team in self.teams(team_ids - {None})}
+        games = []
+        for row in rows:
+            values = _decode(GAMES, row)
+            away, home = values.pop("away_id"), values.pop("home_id")
+            games.append(Game(**values, away=teams.get(away), home=teams.get(home)))
+        return games
+
+    def games(self, season: str = None, game_type: str = None) -> list[Game]:
+        """
+        :param season: only the games of this season (e.g. "20222023"), if given
+        :param game_type: only the games of this type (e.g. "R"), if given
+        :return: the games, by pk, without their plays
+        """
+        sql, parameters = "SELECT * FROM games WHERE 1 = 1", []
+        if season is not None:
+            sql += " AND season = ?"
+            parameters.append(season)
+        if game_type is not None:
+            sql += " AND type = ?"
+            parameters.append(game_type)
+        return self._games(self._select(sql + " ORDER BY pk", parameters))
+
+    def game(self, game_pk: int) -> Optional[Game]:
+        """
+        :param game_pk: the ID of the game we want
+        :return: the game along with its plays, or None if it is not stored
+        """
+        games = self._games(self._select("SELECT * FROM games WHERE pk = ?", [game_pk]))
+        if not games:
+            return None
+        game = games[0]
+        game.all_plays = self.plays(game_pk) or None
+        return game
+
+    def plays(self, game_pk: int) -> list[Play]:
+        """
+        :param game_pk: the ID of the game the plays were made in
+        :return: the plays of the game, in order
+        """
+        rows = self._select(
+            "SELECT plays.*, teams.name AS team_name, teams.link AS team_link "
+            + "FROM plays LEFT JOIN teams ON teams.id = plays.team_id "
+            + "WHERE game_pk = ? ORDER BY play_index",
+            [game_pk],
+        )
+        plays = []
+        for row in rows:
+            values = _decode(PLAYS, row)
+            for name in ("game_pk", "play_index"):
+                del values[name]
+            x, y = values.pop("x"), values.pop("y")
+            team_id, name, link = (
+                values.pop("team_id"),
+                values.pop("team_name"),
+                values.pop("team_link"),
+            )
+            coordinates = {k: v for k, v in (("x", x), ("y", y)) if v is not None}
+            plays.append(
+                Play(
+                    **values,
+                    coordinates=coordinates or None,
+                    team=Team(id=team_id, name=name, link=link)
+                    if team_id is not None
+                    else None,
+                )
+            )
+        return plays
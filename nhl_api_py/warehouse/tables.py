@@ -0,0 +1,378 @@
+"""
+The normalized tables NHL data is stored in by the warehouses, and how models
+are split into rows of those tables.
+
+- `teams`: one row per team, keyed on `id`
+- `games`: one row per game, keyed on `pk`, with its teams as `away_id` and
+  `home_id`
+- `plays`: one row per play, keyed on `game_pk` and `play_index` (the position
+  of the play in the game), with its team as `team_id`
+- `boxscores`: one row per game, keyed on `game_pk`
+- `schedule`: one row per game of each date, keyed on `date` and `game_pk`
+- `checkpoints`: one row per game written by a backfill, keyed on `game_pk`
+  (see `nhl_api_py.warehouse.backfill`)
+
+Free-form sections (e.g. a team's venue, or a game's players) are stored as JSON
+text. A game's current play is not stored, since it is one of its plays.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Iterable, NamedTuple, Optional
+
+from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.models.schedule import ScheduleDate
+from nhl_api_py.models.team import Team
+
+logger = logging.getLogger(__name__)
+
+Row = tuple
+
+
+@dataclass(frozen=True, eq=False)
+class Table:
+    """
+    The layout of a table: its columns and their types, its key, and the
+    columns it is indexed on. Rows are tuples holding the columns in order.
+
+    Rows of tables which are `merged` only update the columns they have a value
+    for, since their models are often only partially filled (e.g. the teams of a
+    play only have an ID and a name). Other rows replace the stored row whole.
+    """
+
+    name: str
+    columns: dict[str, str]
+    key: tuple[str, ...]
+    merged: bool = False
+    indexes: tuple[tuple[str, ...], ...] = ()
+    key_positions: tuple[int, ...] = field(init=False)
+
+    def __post_init__(self):
+        names = list(self.columns)
+        positions = tuple(names.index(column) for column in self.key)
+        object.__setattr__(self, "key_positions", positions)
+
+    def row_key(self, row: Row) -> tuple:
+        return tuple(row[position] for position in self.key_positions)
+
+
+_BOXSCORE_SIDE_COLUMNS = {
+    "team_stats": "JSON",
+    "players": "JSON",
+    "goalies": "JSON",
+    "skaters": "JSON",
+    "on_ice": "JSON",
+    "on_ice_plus": "JSON",
+    "scratchers": "JSON",
+    "penalty_box": "JSON",
+    "coaches": "JSON",
+}
+
+TEAMS = Table(
+    "teams",
+    {
+        "id": "INTEGER",
+        "name": "TEXT",
+        "link": "TEXT",
+        "venue": "JSON",
+        "abbreviation": "TEXT",
+        "team_name": "TEXT",
+        "location_name": "TEXT",
+        "first_year_of_play": "INTEGER",
+        "division": "JSON",
+        "conference": "JSON",
+        "franchise": "JSON",
+        "team_stats": "JSON",
+        "roster": "JSON",
+        "short_name": "TEXT",
+        "official_site_url": "TEXT",
+        "franchise_id": "INTEGER",
+        "active": "BOOLEAN",
+    },
+    key=("id",),
+    merged=True,
+)
+GAMES = Table(
+    "games",
+    {
+        "pk": "INTEGER",
+        "season": "TEXT",
+        "type": "TEXT",
+        "date_time": "TEXT",
+        "end_date_time": "TEXT",
+        "abstract_game_state": "TEXT",
+        "coded_game_state": "TEXT",
+        "detailed_state": "TEXT",
+        "status_code": "TEXT",
+        "start_time_tbd": "BOOLEAN",
+        "away_id": "INTEGER",
+        "home_id": "INTEGER",
+        "players": "JSON",
+        "venue": "JSON",
+        "scoring_plays": "JSON",
+        "penalty_plays": "JSON",
+        "plays_by_period": "JSON",
+        "decisions": "JSON",
+    },
+    key=("pk",),
+    merged=True,
+    indexes=(("season", "type"), ("date_time",)),
+)
+PLAYS = Table(
+    "plays",
+    {
+        "game_pk": "INTEGER",
+        "play_index": "INTEGER",
+        "players": "JSON",
+        "event": "TEXT",
+        "event_type_id": "TEXT",
+        "description": "TEXT",
+        "secondary_type": "TEXT",
+        "strength_name": "TEXT",
+        "game_winning_goal": "BOOLEAN",
+        "empty_net": "BOOLEAN",
+        "penalty_severity": "TEXT",
+        "penalty_minutes": "INTEGER",
+        "period": "INTEGER",
+        "period_type": "TEXT",
+        "ordinal_num": "TEXT",
+        "period_time": "TEXT",
+        "period_time_remaining": "TEXT",
+        "date_time": "TEXT",
+        "goals_away": "INTEGER",
+        "goals_home": "INTEGER",
+        "x": "REAL",
+        "y": "REAL",
+        "team_id": "INTEGER",
+    },
+    key=("game_pk", "play_index"),
+    indexes=(("event_type_id",), ("team_id",)),
+)
+BOXSCORES = Table(
+    "boxscores",
+    {
+        "game_pk": "INTEGER",
+        "away_team_id": "INTEGER",
+        **{f"away_{name}": kind for name, kind in _BOXSCORE_SIDE_COLUMNS.items()},
+        "home_team_id": "INTEGER",
+        **{f"home_{name}": kind for name, kind in _BOXSCORE_SIDE_COLUMNS.items()},
+        "officials": "JSON",
+    },
+    key=("game_pk",),
+)
+SCHEDULE = Table(
+    "schedule",
+    {"date": "TEXT", "game_pk": "INTEGER"},
+    key=("date", "game_pk"),
+    indexes=(("game_pk",),),
+)
+
+CHECKPOINTS = Table(
+    "checkpoints",
+    {"game_pk": "INTEGER", "detailed_state": "TEXT", "content_hash": "TEXT"},
+    key=("game_pk",),
+)
+
+# In the order rows are written, so the rows a row refers to come first.
+TABLES = (TEAMS, GAMES, PLAYS, BOXSCORES, SCHEDULE, CHECKPOINTS)
+
+
+class Checkpoint(NamedTuple):
+    """
+    Records that a game was written, in which state, and a hash of its content.
+    """
+
+    game_pk: int
+    detailed_state: Optional[str]
+    content_hash: str
+
+
+def season_of(game_pk: int) -> str:
+    """
+    :param game_pk: the ID of a game, which starts with the start year of its
+        season (e.g. 2022020001)
+    :return: the season of the game (e.g. "20222023")
+    """
+    year = game_pk // 1_000_000
+    return f"{year}{year + 1}"
+
+
+def to_json(value: Any) -> Optional[str]:
+    return json.dumps(value, separators=(",", ":")) if value is not None else None
+
+
+def merge(table: Table, old: Optional[Row], new: Row) -> Row:
+    """
+    :param table: the table both rows belong to
+    :param old: the stored row, if any
+    :param new: the row written over it, with the same key
+    :return: the row to store
+    """
+    if old is None or not table.merged:
+        return new
+    return tuple(value if value is not None else kept for value, kept in zip(new, old))
+
+
+def _int(value: Any) -> Optional[int]:
+    # Some integers are sent as strings by the API, e.g. `firstYearOfPlay`.
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        logger.debug(f"Expected an integer, got {value!r}")
+        return None
+
+
+class Rows:
+    """
+    The rows of each table split from a batch of models, ready to be written
+    together. Rows with the same key are only kept once (see `merge`).
+    """
+
+    def __init__(self):
+        self.tables: dict[Table, dict[tuple, Row]] = {table: {} for table in TABLES}
+        # The number of plays of each game; any other stored play is stale.
+        self.play_counts: dict[int, int] = {}
+
+    def _add(self, table: Table, row: Row) -> None:
+        key = table.row_key(row)
+        rows = self.tables[table]
+        rows[key] = merge(table, rows.get(key), row)
+
+    def add_team(self, team: Optional[Team]) -> Optional[int]:
+        """
+        :param team: the team we want to store, if any
+        :return: the ID of the team, or None if it has none
+        """
+        if team is None or team.id is None:
+            return None
+        self._add(
+            TEAMS,
+            (
+                team.id,
+                team.name,
+                team.link,
+                to_json(team.venue),
+                team.abbreviation,
+                team.team_name,
+                team.location_name,
+                _int(team.first_year_of_play),
+                to_json(team.division),
+                to_json(team.conference),
+                to_json(team.franchise),
+                to_json(team.team_stats),
+                to_json(team.roster),
+                team.short_name,
+                team.official_site_url,
+                team.franchise_id,
+                team.active,
+            ),
+        )
+        return team.id
+
+    def add_plays(self, game_pk: int, plays: Optional[Iterable[Play]]) -> None:
+        """
+        :param game_pk: the ID of the game the plays were made in
+        :param plays: all the plays of the game, in order; they replace the
+            stored ones
+        """
+        count = 0
+        for count, play in enumerate(plays or (), start=1):
+            coordinates = play.coordinates or {}
+            self._add(
+                PLAYS,
+                (
+                    game_pk,
+                    count - 1,
+                    to_json(play.players),
+                    play.event,
+                    play.event_type_id,
+                    play.description,
+                    play.secondary_type,
+                    play.strength_name,
+                    play.game_winning_goal,
+                    play.empty_net,
+                    play.penalty_severity,
+                    _int(play.penalty_minutes),
+                    play.period,
+                    play.period_type,
+                    play.ordinal_num,
+                    play.period_time,
+                    play.period_time_remaining,
+                    play.date_time,
+                    play.goals_away,
+                    play.goals_home,
+                    coordinates.get("x"),
+                    coordinates.get("y"),
+                    self.add_team(play.team),
+                ),
+            )
+        self.play_counts[game_pk] = count
+
+    def add_game(self, game: Game, with_plays: bool = True) -> bool:
+        """
+        :param game: the game we want to store, along with its teams
+        :param with_plays: whether the game's plays are stored too, replacing the
+            stored ones
+        :return: whether the game could be stored, which requires a pk
+        """
+        if game.pk is None:
+            logger.warning("Skipping a game without a pk")
+            return False
+        self._add(
+            GAMES,
+            (
+                game.pk,
+                game.season,
+                game.type,
+                game.date_time,
+                game.end_date_time,
+                game.abstract_game_state,
+                game.coded_game_state,
+                game.detailed_state,
+                game.status_code,
+                game.start_time_tbd,
+                self.add_team(game.away),
+                self.add_team(game.home),
+                to_json(game.players),
+                to_json(game.venue),
+                to_json(game.scoring_plays),
+                to_json(game.penalty_plays),
+                to_json(game.plays_by_period),
+                to_json(game.decisions),
+            ),
+        )
+        if with_plays:
+            self.add_plays(game.pk, game.all_plays)
+        return True
+
+    def add_boxscore(self, game_pk: int, boxscore: Boxscore) -> None:
+        """
+        :param game_pk: the ID of the game the boxscore is of
+        :param boxscore: the boxscore we want to store, along with its teams
+        """
+        row = [game_pk]
+        for side in ("away", "home"):
+            row.append(self.add_team(getattr(boxscore, f"{side}_team")))
+            row.extend(
+                to_json(getattr(boxscore, f"{side}_{name}"))
+                for name in _BOXSCORE_SIDE_COLUMNS
+            )
+        row.append(to_json(boxscore.officials))
+        self._add(BOXSCORES, tuple(row))
+
+    def add_schedule_date(self, date: ScheduleDate) -> None:
+        """
+        :param date: the date we want to store, along with a summary of its games
+        """
+        for game in date.games:
+            # Schedules only hold a summary of each game, without its plays.
+            if self.add_game(game, with_plays=False):
+                self._add(SCHEDULE, (date.date, game.pk))
+
+    def add_checkpoint(self, checkpoint: Checkpoint) -> None:
+        """
+        :param checkpoint: the checkpoint of a game written in the same batch
+        """
+        self._add(CHECKPOINTS, tuple(checkpoint))
@@ -0,0 +1,91 @@
+"""
+A read-through cache of the JSON bodies served by the views, in front of the NHL
+API.
+
+Bodies are kept in the default Django cache, along with their ETag. On a miss,
+concurrent requests for the same key are coalesced: only one of them fetches the
+data upstream, and the others wait for its body instead of fetching their own.
+Coalescing happens within a process; the cache is shared between processes only
+if the configured backend is (e.g. the file-based one).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+from time import time
+from typing import Any, Callable, NamedTuple, Optional
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from nhl_api_py.core.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# How long clients may reuse a body which never expires on the server, since
+# the NHL sometimes corrects the data of past games.
+IMMUTABLE_MAX_AGE = 24 * 60 * 60
+
+Fetch = Callable[[], tuple[Any, Optional[float]]]
+
+
+class Payload(NamedTuple):
+    """
+    A JSON body ready to be served, along with its validator.
+    """
+
+    body: bytes
+    etag: str
+    expires_at: Optional[float] = None
+
+    @property
+    def max_age(self) -> int:
+        """
+        :return: the number of seconds clients may reuse the body for
+        """
+        if self.expires_at is None:
+            return IMMUTABLE_MAX_AGE
+        return max(0, math.ceil(self.expires_at - time()))
+
+    @classmethod
+    def from_data(cls, data: Any, ttl: Optional[float]) -> Payload:
+        """
+        :param data: the data we want to serve as JSON
+        :param ttl: the number of seconds the body stays fresh, or None if it never
+            expires
+        :return: the body of the data
+        """
+        body = json.dumps(data, separators=(",", ":"), cls=DjangoJSONEncoder).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        return cls(body, etag, None if ttl is None else time() + ttl)
+
+
+_flights: SingleFlight[Payload] = SingleFlight()
+
+
+def _load(key: str, fetch: Fetch) -> Payload:
+    # The previous call of the same key may have stored its body meanwhile.
+    payload = cache.get(key)
+    if payload is None:
+        data, ttl = fetch()
+        payload = Payload.from_data(data, ttl)
+        cache.set(key, payload, ttl)
+        logger.debug(f"Cached {key} for {ttl} seconds")
+    return payload
+
+
+def read_through(key: str, fetch: Fetch) -> Payload:
+    """
+    Gets a body from the cache, or fetches and caches it if it is missing.
+
+    :param key: identifies the body in the cache
+    :param fetch: retrieves the data of the body, and the number of seconds it
+        stays fresh (or None if it never expires)
+    :return: the cached body
+    """
+    payload = cache.get(key)
+    if payload is None:
+        payload = _flights.do(key, lambda: _load(key, fetch))
+    return payload
@@ -0,0 +1,260 @@
+"""
+Fans the updates of live games out to many streaming clients.
+
+Each game followed by at least one client has a single `LiveGamePoller`, run
+as one asyncio task, no matter how many clients follow it: the upstream
+requests grow with the number of live games, not with the number of clients.
+Each batch of new plays is encoded once, as a Server-Sent Event shared by every
+client, so a connection only holds a small queue of references to events.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import asdict
+from typing import AsyncIterator, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from nhl_api_py.core.api import NhlApi
+from nhl_api_py.core.live import LiveGamePoller
+from nhl_api_py.models.game import Play
+
+logger = logging.getLogger(__name__)
+
+# How many events a slow client may fall behind by before it is disconnected;
+# it then reconnects and resumes from its `Last-Event-ID`.
+MAX_PENDING_EVENTS = 64
+# Sent in place of an event to end a stream.
+_END = (None, b"")
+
+# An event's ID (None for status events) and its encoded form.
+Event = tuple[Optional[int], bytes]
+
+
+def encode_event(event: str, data: object, event_id: int = None) -> bytes:
+    """
+    :param event: the type of the event, e.g. "plays"
+    :param data: the data of the event, which is sent as JSON
+    :param event_id: the ID clients resume from when they reconnect, if any
+    :return: the event in the Server-Sent Events format
+    """
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines += [f"event: {event}", f"data: {json.dumps(data, cls=DjangoJSONEncoder)}"]
+    return ("\n".join(lines) + "\n\n").encode()
+
+
+class GameFeed:
+    """
+    Polls one game, and publishes its updates to all of its subscribers.
+
+    Plays are published as `plays` events, whose ID is the number of plays sent
+    so far. Every event is kept, so late subscribers are sent the plays they
+    missed first. The game's state is published as a `status` event whenever it
+    changes; once the game is final, the streams end.
+
+    A subscriber resuming past the events of this feed (e.g. after a restart)
+    skips the events it already received, but may receive again the first plays
+    of an event it only received part of.
+    """
+
+    def __init__(self, poller: LiveGamePoller, interval: float):
+        """
+        :param poller: keeps the game up to date
+        :param interval: the number of seconds between polls
+        """
+        self.poller = poller
+        self.interval = interval
+        self.events: list[Event] = []
+        self.status: Optional[Event] = None
+        self.ended = False
+        self._plays = 0
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._polling: Optional[asyncio.Future] = None
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, last_event_id: int = 0) -> asyncio.Queue:
+        """
+        :param last_event_id: the ID of the last event the subscriber received
+        :return: the queue the subscriber receives its events from, already
+            holding the events it missed
+        """
+        missed = [event for event in self.events if event[0] > last_event_id]
+        queue = asyncio.Queue(maxsize=max(MAX_PENDING_EVENTS, len(missed) + 2))
+        for event in missed:
+            queue.put_nowait(event)
+        if self.status is not None:
+            queue.put_nowait(self.status)
+        if self.ended:
+            queue.put_nowait(_END)
+        else:
+            self._subscribers.add(queue)
+            if self._task is None:
+                self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """
+        Stops sending events to a subscriber, and stops polling once the game has
+        no subscriber left.
+
+        :param queue: the queue of the subscriber
+        """
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _publish(self, event: Event) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.info(f"Disconnecting a subscriber of {self.poller.game_id}")
+                self._subscribers.discard(queue)
+                queue.get_nowait()
+                queue.put_nowait(_END)
+
+    def _update(self, plays: list[Play]) -> None:
+        """
+        Publishes what changed in the game after a poll.
+
+        :param plays: the plays added by the poll
+        """
+        if plays:
+            self._plays += len(plays)
+            data = [asdict(play) for play in plays]
+            event = (self._plays, encode_event("plays", data, self._plays))
+            self.events.append(event)
+            self._publish(event)
+        game = self.poller.game
+        status = None, encode_event(
+            "status",
+            {
+                "abstract_game_state": game.abstract_game_state,
+                "detailed_state": game.detailed_state,
+            },
+        )
+        if status != self.status:
+            self.status = status
+            self._publish(status)
+
+    async def _poll(self) -> list[Play]:
+        """
+        Polls the game in a worker thread.
+
+        Cancelling the task polling the game does not stop a poll in flight. The
+        next task awaits that poll, and publishes its plays, instead of polling
+        the game at the same time.
+
+        :return: the plays added by the poll
+        """
+        if self._polling is None:
+            self._polling = asyncio.ensure_future(asyncio.to_thread(self.poller.poll))
+            # Retrieves the error of a poll no task awaits anymore.
+            self._polling.add_done_callback(
+                lambda future: future.cancelled() or future.exception()
+            )
+        try:
+            plays = await asyncio.shield(self._polling)
+        except Exception:
+            self._polling = None
+            raise
+        self._polling = None
+        return plays
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                try:
+                    plays = await self._poll()
+                except Exception as error:
+                    logger.warning(f"Could not poll {self.poller.game_id}: {error}")
+                else:
+                    self._update(plays)
+                    if self.poller.is_final:
+                        break
+                await asyncio.sleep(self.interval)
+        finally:
+            if self.poller.is_final:
+                self.ended = True
+                self._publish(_END)
+                self._subscribers.clear()
+
+
+class LiveGames:
+    """
+    The feeds of the games which are followed, created on the first subscriber.
+    """
+
+    def __init__(self, api: NhlApi, interval: float = 10, keepalive: float = 15):
+        """
+        :param api: the client the games are polled with
+        :param interval: the number of seconds between polls of a game
+        :param keepalive: the number of idle seconds after which a comment is
+            sent, so proxies keep the connection open
+        """
+        self.api = api
+        self.interval = interval
+        self.keepalive = keepalive
+        self.feeds: dict[int, GameFeed] = {}
+
+    async def check(self, game_pk: int) -> None:
+        """
+        Fetches the feed of a game which is not followed yet, so that a game which
+        cannot be followed is reported before its stream starts. The feed is
+        cached by the client, so the first poll of the game reuses it.
+
+        :param game_pk: the ID of the game we want to follow
+        :raises ResponseError: if the feed of the game could not be fetched, e.g.
+            because the game does not exist
+        """
+        if game_pk not in self.feeds:
+            await asyncio.to_thread(self.api.get, f"game/{game_pk}/feed/live")
+
+    async def stream(
+        self, game_pk: int, last_event_id: int = 0, max_seconds: float = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Follows a game.
+
+        :param game_pk: the ID of the game we want to follow
+        :param last_event_id: the ID of the last event the client received, when
+            it reconnects
+        :param max_seconds: ends the stream after this many seconds, if given; the
+            client then reconnects from its last event
+        :return: the events of the game, until it is final
+        """
+        feed = self.feeds.get(game_pk)
+        if feed is None:
+            feed = self.feeds[game_pk] = GameFeed(
+                LiveGamePoller(self.api, game_pk, self.interval), self.interval
+            )
+        queue = feed.subscribe(last_event_id)
+        loop = asyncio.get_running_loop()
+        deadline = None if max_seconds is None else loop.time() + max_seconds
+        try:
+            yield f"retry: {int(self.interval * 1000)}\n\n".encode()
+            while deadline is None or loop.time() < deadline:
+                timeout = self.keepalive
+                if deadline is not None:
+                    timeout = min(timeout, deadline - loop.time())
+                try:
+                    event_id, event = await asyncio.wait_for(
+                        queue.get(), max(timeout, 0)
+                    )
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                if event == _END[1]:
+                    break
+                if event_id is None or event_id > last_event_id:
+                    yield event
+        finally:
+            feed.unsubscribe(queue)
+            if not feed and self.feeds.get(game_pk) is feed:
+                del self.feeds[game_pk]
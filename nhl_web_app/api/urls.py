@@ -0,0 +1,16 @@
+"""
+The JSON endpoints of the NHL API, served under `api/`.
+"""
+from django.urls import path
+
+from . import views
+
+app_name = "api"
+urlpatterns = [
+    path("teams/", views.teams, name="teams"),
+    path("schedule/", views.schedule, name="schedule"),
+    path("games/<int:game_pk>/", views.game, name="game"),
+    path("games/<int:game_pk>/boxscore/", views.boxscore, name="boxscore"),
+    path("games/<int:game_pk>/plays/", views.plays, name="plays"),
+    path("games/<int:game_pk>/live/", views.live, name="live"),
+]
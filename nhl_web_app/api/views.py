@@ -0,0 +1,264 @@
+"""
+JSON views of the NHL API: teams, schedule, and the feed, boxscore and plays of
+a game.
+
+Each body is served from a read-through cache (see `api.cache`), and carries an
+ETag and a `Cache-Control` max age matching how long it stays fresh, so clients
+and proxies can reuse it, or revalidate it for a `304 Not Modified`.
+
+The views are async: the blocking work of a cache miss (the upstream requests
+and the parsing of their responses) runs in a worker thread, so a slow upstream
+does not hold up the event loop. Live games are also streamed as Server-Sent
+Events, which needs the project to be served over ASGI (see `api.live`).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import asdict, replace
+from functools import cache, wraps
+from typing import Awaitable, Callable, Optional
+
+from django.conf import settings
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotAllowed,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from nhl_api_py.core.api import NhlApi
+from nhl_api_py.core.cache import DEFAULT_TTL, LIVE_TTL, TEAMS_TTL, MemoryCache
+from nhl_api_py.core.error_exceptions import ResponseError
+from nhl_api_py.models.game import Game
+from nhl_api_py.models.schedule import ScheduleDate
+
+from .cache import Fetch, read_through
+from .live import LiveGames
+
+logger = logging.getLogger(__name__)
+
+# How long a live stream stays open before the client has to reconnect, which
+# bounds how long a stream outlives a client that went away silently.
+STREAM_SECONDS = 5 * 60
+
+View = Callable[..., Awaitable[HttpResponse]]
+
+
+@cache
+def nhl_api() -> NhlApi:
+    """
+    :return: the client shared by all views; its own cache, bounded by the
+        `NHL_API_CACHE` setting, lets the views of the same game share one
+        download of its feed
+    """
+    options = getattr(settings, "NHL_API_CACHE", {})
+    cache = MemoryCache(
+        maxsize=options.get("MAXSIZE", 64), max_age=options.get("MAX_AGE", 15 * 60)
+    )
+    return NhlApi(cache=cache)
+
+
+@cache
+def live_games() -> LiveGames:
+    """
+    :return: the feeds of the live games followed by the clients of this process
+    """
+    return LiveGames(nhl_api(), interval=LIVE_TTL)
+
+
+def _integers(request: HttpRequest, name: str) -> list[int]:
+    """
+    :param request: the request we want a query parameter of
+    :param name: the name of the parameter, holding comma separated integers
+    :return: the integers, none if the parameter is missing
+    :raises ValueError: if a value is not an integer
+    """
+    value = request.GET.get(name)
+    return [int(item) for item in value.split(",")] if value else []
+
+
+def _integer(request: HttpRequest, name: str) -> Optional[int]:
+    values = _integers(request, name)
+    if len(values) > 1:
+        raise ValueError(f"{name} must be a single integer")
+    return values[0] if values else None
+
+
+def _key(*parts) -> str:
+    """
+    :param parts: what identifies a body, e.g. its view and parameters
+    :return: the key of the body in the cache
+    """
+    return ":".join(
+        ",".join(map(str, sorted(part))) if isinstance(part, list) else str(part)
+        for part in parts
+    )
+
+
+def _game_ttl(game: Optional[Game]) -> Optional[float]:
+    if game is not None and game.abstract_game_state == "Final":
+        return None
+    return LIVE_TTL
+
+
+def _scheduled_game(game_pk: int) -> Optional[Game]:
+    """
+    :param game_pk: the ID of the game we want the state of
+    :return: the summary of the game in the schedule, which is much smaller than
+        its feed, or None if it is not scheduled
+    """
+    response = nhl_api().get(f"schedule?gamePk={game_pk}")
+    for date in response.data.get("dates", []):
+        for game in ScheduleDate.from_dict(date).games:
+            return game
+    return None
+
+
+def _require_safe(view: View) -> View:
+    """
+    Only lets GET and HEAD requests through to an async view, which Django's own
+    `require_safe` does not support before Django 5.
+
+    :param view: the view we want to protect
+    :return: the view, answering `405 Method Not Allowed` to other methods
+    """
+
+    @wraps(view)
+    async def safe_view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        if request.method not in ("GET", "HEAD"):
+            return HttpResponseNotAllowed(["GET", "HEAD"])
+        return await view(request, *args, **kwargs)
+
+    return safe_view
+
+
+async def _serve(request: HttpRequest, key: str, fetch: Fetch) -> HttpResponse:
+    """
+    :param request: the request being answered
+    :param key: identifies the body in the cache
+    :param fetch: retrieves the data of the body, and how many seconds it stays
+        fresh
+    :return: the cached body, or a `304 Not Modified` if the client has it already
+    """
+    try:
+        payload = await asyncio.to_thread(read_through, key, fetch)
+    except ResponseError as error:
+        logger.warning(f"Could not serve {key}: {error}")
+        return JsonResponse({"error": str(error)}, status=502)
+    response = HttpResponse(payload.body, content_type="application/json")
+    response["ETag"] = payload.etag
+    patch_cache_control(response, public=True, max_age=payload.max_age)
+    return get_conditional_response(request, etag=payload.etag, response=response)
+
+
+def _bad_request(error: ValueError) -> JsonResponse:
+    return JsonResponse({"error": str(error)}, status=400)
+
+
+@_require_safe
+async def teams(request: HttpRequest) -> HttpResponse:
+    """
+    Serves teams, e.g. `teams/?ids=1,2&season=2022`; by default, all current
+    teams.
+    """
+    try:
+        team_ids, season = _integers(request, "ids"), _integer(request, "season")
+    except ValueError as error:
+        return _bad_request(error)
+
+    def fetch():
+        found = nhl_api().teams(team_ids=team_ids or None, season=season)
+        return [asdict(team) for team in found], TEAMS_TTL
+
+    return await _serve(request, _key("teams", team_ids, season), fetch)
+
+
+@_require_safe
+async def schedule(request: HttpRequest) -> HttpResponse:
+    """
+    Serves a schedule, e.g. `schedule/?season=2022&teams=1,2&game_type=R`; by
+    default, today's.
+    """
+    try:
+        team_ids, season = _integers(request, "teams"), _integer(request, "season")
+    except ValueError as error:
+        return _bad_request(error)
+    game_type = request.GET.get("game_type")
+
+    def fetch():
+        dates = nhl_api().schedule(
+            team_ids=team_ids or None, season_start_year=season, game_type=game_type
+        )
+        return [asdict(date) for date in dates], DEFAULT_TTL
+
+    return await _serve(request, _key("schedule", team_ids, season, game_type), fetch)
+
+
+@_require_safe
+async def game(request: HttpRequest, game_pk: int) -> HttpResponse:
+    """
+    Serves a game, without its plays (see `plays`).
+    """
+
+    def fetch():
+        found = nhl_api().game(game_pk)
+        return asdict(replace(found, all_plays=None)), _game_ttl(found)
+
+    return await _serve(request, _key("game", game_pk), fetch)
+
+
+@_require_safe
+async def boxscore(request: HttpRequest, game_pk: int) -> HttpResponse:
+    """
+    Serves the boxscore of a game.
+    """
+
+    def fetch():
+        # The boxscore does not tell the game's state: its schedule does.
+        ttl = _game_ttl(_scheduled_game(game_pk))
+        return asdict(nhl_api().boxscore(game_pk)), ttl
+
+    return await _serve(request, _key("boxscore", game_pk), fetch)
+
+
+@_require_safe
+async def plays(request: HttpRequest, game_pk: int) -> HttpResponse:
+    """
+    Serves all the plays of a game, in order.
+    """
+
+    def fetch():
+        found = nhl_api().game(game_pk)
+        return [asdict(play) for play in found.all_plays or []], _game_ttl(found)
+
+    return await _serve(request, _key("plays", game_pk), fetch)
+
+
+async def live(request: HttpRequest, game_pk: int) -> HttpResponse:
+    """
+    Streams the new plays and state changes of a game as Server-Sent Events,
+    until the game is final. Clients resume from the `Last-Event-ID` header.
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+    try:
+        last_event_id = int(request.headers.get("Last-Event-ID") or 0)
+    except ValueError as error:
+        return _bad_request(error)
+    try:
+        await live_games().check(game_pk)
+    except ResponseError as error:
+        logger.warning(f"Could not follow {game_pk}: {error}")
+        status = 404 if error.status_code == 404 else 502
+        return JsonResponse({"error": str(error)}, status=status)
+    response = StreamingHttpResponse(
+        live_games().stream(game_pk, last_event_id, max_seconds=STREAM_SECONDS),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    # Stops nginx from buffering the events.
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -37,6 +37,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "api",
 ]
 
 MIDDLEWARE = [
@@ -81,6 +82,25 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+# Holds the bodies served by the `api` views. A local-memory cache is private to
+# each process; the file-based backend shares it between processes.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "nhl-api",
+        "OPTIONS": {"MAX_ENTRIES": 1000},
+    }
+}
+
+# The client shared by the `api` views also keeps the decoded NHL API responses
+# in memory, so the views of the same game share one download of its feed. A
+# decoded feed weighs megabytes, so only a few recently used responses are kept.
+NHL_API_CACHE = {"MAXSIZE": 64, "MAX_AGE": 15 * 60}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
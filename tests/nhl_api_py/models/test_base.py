@@ -0,0 +1,130 @@
+import pickle
+from dataclasses import dataclass, fields
+from typing import Optional
+
+import pandas as pd
+import pytest
+
+from nhl_api_py.core.utils import SnakeCaseDict
+from nhl_api_py.models.base import _field_only_keys, to_dataframe
+from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.models.schedule import ScheduleDate
+from nhl_api_py.models.team import Team
+
+
+@dataclass
+class ExtendedTeam(Team):
+    """
+    A subclass adding a field, to check each model gets its own field names.
+    """
+
+    extra: Optional[int] = None
+
+
+@pytest.mark.parametrize(
+    "cls", [Team, Play, Game, Boxscore, ScheduleDate, ExtendedTeam]
+)
+def test_field_names(cls):
+    names = cls._field_names()
+    assert names == frozenset(field.name for field in fields(cls))
+    assert cls._field_names() is names
+
+
+@pytest.mark.parametrize("cls", [Team, Play, Game, Boxscore, ScheduleDate])
+def test_models_are_slotted(cls):
+    model = cls()
+    assert not hasattr(model, "__dict__")
+    with pytest.raises(AttributeError):
+        model.not_a_field = 1
+
+
+@pytest.mark.parametrize(
+    "model",
+    [Team(id=1), Play(event="e", team=Team(id=1)), Game(pk=1, all_plays=[Play()])],
+)
+def test_slotted_models_pickle(model):
+    assert pickle.loads(pickle.dumps(model)) == model
+
+
+def test_field_names_per_subclass():
+    Team._field_names()
+    assert "extra" in ExtendedTeam._field_names()
+    assert "extra" not in Team._field_names()
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (dict(), dict()),
+        ({"id": 1, "not_a_field": 2}, {"id": 1}),
+        ({"not_a_field": 2}, dict()),
+    ],
+    ids=["empty", "mixed_keys", "no_field_keys"],
+)
+@pytest.mark.parametrize("data_type", [dict, SnakeCaseDict])
+def test_field_only_keys(data, expected, data_type):
+    result = _field_only_keys(data_type(data), Team)
+    assert result == expected
+    assert type(result) is data_type
+
+
+class TestToDataFrame:
+    """
+    Tests building one DataFrame from many models.
+    """
+
+    PLAYS = [
+        Play(
+            event="Shot",
+            period=1,
+            coordinates={"x": 10.0, "y": -3.5},
+            team=Team(id=1, name="Team 1"),
+        ),
+        Play(event="Stoppage", period=2, coordinates={}),
+    ]
+
+    def test_flattens_nested_values(self):
+        df = to_dataframe(self.PLAYS)
+        assert list(df.columns) == [
+            "event",
+            "period",
+            "coordinates_x",
+            "coordinates_y",
+            "team_id",
+            "team_name",
+        ]
+        assert df["coordinates_x"].tolist() == [10.0, pd.NA]
+        assert df["team_name"].tolist() == ["Team 1", pd.NA]
+
+    def test_uses_nullable_dtypes(self):
+        df = to_dataframe(self.PLAYS)
+        assert df["period"].dtype == "Int64"
+        assert df["team_id"].dtype == "Int64"
+        assert df["coordinates_y"].dtype == "Float64"
+        assert df["event"].dtype == "string"
+
+    def test_keeps_missing_values(self):
+        df = to_dataframe(self.PLAYS, remove_missing_values=False)
+        assert "description" in df.columns
+        assert df["description"].isna().all()
+        # Flattened fields are replaced by their columns.
+        assert "team" not in df.columns and "coordinates" not in df.columns
+
+    def test_keeps_plain_values_of_flattened_fields(self):
+        df = to_dataframe([Play(coordinates={"x": 1.0}), Play(coordinates=2.0)])
+        assert df["coordinates_x"].tolist() == [1.0, pd.NA]
+        assert df["coordinates"].tolist() == [pd.NA, 2.0]
+
+    def test_keeps_lists(self):
+        df = to_dataframe([Game(scoring_plays=[1, 2]), Game(scoring_plays=[])])
+        assert df["scoring_plays"].tolist() == [[1, 2], []]
+
+    def test_matches_to_series(self):
+        teams = [Team(id=1, name="Team 1"), Team(id=2, name="Team 2")]
+        expected = pd.DataFrame([team.to_series() for team in teams])
+        df = to_dataframe(teams)
+        assert df.astype(object).equals(expected.astype(object))
+
+    def test_empty(self):
+        df = to_dataframe([])
+        assert df.empty and len(df.columns) == 0
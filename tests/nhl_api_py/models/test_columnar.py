@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from nhl_api_py.models.columnar import COLUMNS, PlayColumns
+
+PLAYS = [
+    {
+        "result": {"eventTypeId": "FACEOFF"},
+        "about": {
+            "eventIdx": 0,
+            "period": 1,
+            "periodType": "REGULAR",
+            "periodTime": "00:00",
+            "periodTimeRemaining": "20:00",
+            "dateTime": "2022-10-12T23:00:00Z",
+            "goals": {"away": 0, "home": 0},
+        },
+        "coordinates": {"x": 0.0, "y": 0.0},
+        "team": {"id": 1},
+    },
+    {
+        "result": {
+            "eventTypeId": "GOAL",
+            "secondaryType": "Wrist Shot",
+            "strength": {"code": "PPG", "name": "Power Play"},
+            "gameWinningGoal": True,
+            "emptyNet": False,
+        },
+        "about": {
+            "eventIdx": 1,
+            "period": 3,
+            "periodType": "REGULAR",
+            "periodTime": "12:34",
+            "periodTimeRemaining": "07:26",
+            "dateTime": "2022-10-13T01:00:00Z",
+            "goals": {"away": 0, "home": 1},
+        },
+        "coordinates": {"x": 80.0, "y": -5.0},
+        "team": {"id": 2},
+    },
+    {
+        "result": {"eventTypeId": "PERIOD_END"},
+        "about": {"eventIdx": 2, "period": 3},
+        "coordinates": {},
+    },
+]
+
+
+class TestPlayColumns:
+    """
+    Tests the `nhl_api_py.models.columnar.PlayColumns` class
+    """
+
+    def test_from_json(self):
+        columns = PlayColumns.from_json(PLAYS, game_pk=2022020001)
+        assert len(columns) == 3
+        np.testing.assert_array_equal(columns["game_pk"], [2022020001] * 3)
+        np.testing.assert_array_equal(
+            columns["event_type_id"], ["FACEOFF", "GOAL", "PERIOD_END"]
+        )
+        np.testing.assert_array_equal(columns["period"], [1, 3, 3])
+        np.testing.assert_array_equal(columns["period_time"], [0, 754, -1])
+        np.testing.assert_array_equal(columns["period_time_remaining"], [1200, 446, -1])
+        np.testing.assert_array_equal(columns["team_id"], [1, 2, -1])
+        np.testing.assert_array_equal(columns["x"], [0.0, 80.0, np.nan])
+        np.testing.assert_array_equal(columns["goals_home"], [0, 1, 0])
+        np.testing.assert_array_equal(columns["strength_code"], ["", "PPG", ""])
+        np.testing.assert_array_equal(
+            columns["game_winning_goal"], [False, True, False]
+        )
+        assert columns["date_time"][1] == np.datetime64("2022-10-13T01:00:00")
+        assert np.isnat(columns["date_time"][2])
+
+    @pytest.mark.parametrize("plays", [[], PLAYS], ids=["empty", "plays"])
+    def test_column_dtypes(self, plays):
+        columns = PlayColumns.from_json(plays)
+        assert set(columns.columns) == set(COLUMNS)
+        for name, dtype in COLUMNS.items():
+            assert columns[name].dtype.kind == np.dtype(dtype).kind
+            assert len(columns[name]) == len(plays)
+
+    def test_long_strings_are_not_truncated(self):
+        description = "Delay of game - Unsuccessful challenge"
+        plays = [{"result": {"eventTypeId": "PENALTY", "secondaryType": description}}]
+        assert PlayColumns.from_json(plays)["secondary_type"][0] == description
+
+    @pytest.mark.parametrize(
+        "feed, expected_pk",
+        [
+            ({"gamePk": 5, "liveData": {"plays": {"allPlays": PLAYS}}}, 5),
+            ({"gameData": {"game": {"pk": 6}}}, 6),
+            (dict(), 0),
+        ],
+        ids=["game_pk", "game_data_pk", "empty"],
+    )
+    def test_from_feed(self, feed, expected_pk):
+        columns = PlayColumns.from_feed(feed)
+        assert set(columns["game_pk"]) <= {expected_pk}
+
+    def test_vectorized_filter(self):
+        columns = PlayColumns.from_json(PLAYS)
+        selected = columns[
+            (columns["period"] == 3) & (columns["event_type_id"] == "GOAL")
+        ]
+        assert isinstance(selected, PlayColumns) and len(selected) == 1
+        np.testing.assert_array_equal(selected["event_idx"], [1])
+        np.testing.assert_array_equal(columns[np.array([2, 0])]["event_idx"], [2, 0])
+        np.testing.assert_array_equal(columns[1:]["event_idx"], [1, 2])
+
+    def test_concat(self):
+        first = PlayColumns.from_json(PLAYS, game_pk=1)
+        second = PlayColumns.from_json(PLAYS[:1], game_pk=2)
+        columns = PlayColumns.concat([first, second])
+        np.testing.assert_array_equal(columns["game_pk"], [1, 1, 1, 2])
+        assert len(PlayColumns.concat([])) == 0
+
+    def test_to_dataframe(self):
+        df = PlayColumns.from_json(PLAYS).to_dataframe()
+        assert isinstance(df, pd.DataFrame)
+        assert list(df.columns) == list(COLUMNS)
+        assert df.shape == (3, len(COLUMNS))
+        assert df["period"].tolist() == [1, 3, 3]
@@ -1,9 +1,11 @@
+import pickle
 from dataclasses import fields
 
 import pandas as pd
 import pytest
 
-from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.core.utils import convert_keys_to_snake_case
+from nhl_api_py.models.game import Boxscore, Game, LazyGame, Play
 from nhl_api_py.models.team import Team
 
 
@@ -20,6 +22,12 @@ class TestPlay:
             ({"nonExistentField": "f"}, Play()),
             ({"result": {"event": "some_event"}}, Play(event="some_event")),
             ({"team": {"id": 1}}, Play(team=Team(id=1))),
+            (
+                {"players": [{"player": {"fullName": "A"}, "playerType": "Shooter"}]},
+                Play(
+                    players=[{"player": {"full_name": "A"}, "player_type": "Shooter"}]
+                ),
+            ),
         ],
         ids=[
             "missing_parameters",
@@ -27,12 +35,18 @@ class TestPlay:
             "non_real_kwarg",
             "nested_attr",
             "teams_created",
+            "list_keys_converted",
         ],
     )
     def test_from_dict(self, input, expected):
         result = Play.from_dict(input)
         assert expected == result
 
+    def test_from_dict_skips_converted_data(self, monkeypatch):
+        converted = convert_keys_to_snake_case({"result": {"eventTypeId": "GOAL"}})
+        monkeypatch.setattr("nhl_api_py.core.utils.camel_to_snake_case", None)
+        assert Play.from_dict(converted) == Play(event_type_id="GOAL")
+
     @pytest.mark.parametrize(
         "team_input, remove_na, expected",
         [
@@ -84,6 +98,13 @@ class TestGame:
         result = Game.from_dict(input)
         assert expected == result
 
+    def test_from_dict_does_not_mutate_converted_data(self):
+        converted = convert_keys_to_snake_case(
+            {"liveData": {"plays": {"allPlays": [{"result": {"event": "e"}}]}}}
+        )
+        assert Game.from_dict(converted) == Game.from_dict(converted)
+        assert Game.from_dict(converted).all_plays == [Play(event="e")]
+
     @pytest.mark.parametrize(
         "game_input, remove_na, expected",
         [
@@ -129,17 +150,29 @@ class TestBoxscore:
                 {"teams": {"away": {"team": {"id": 1}}}},
                 Boxscore(away_team=Team(id=1)),
             ),
+            (
+                {"teams": {"home": {"team": {"id": 1, "triCode": "T01"}}}},
+                Boxscore(home_team=Team(id=1)),
+            ),
         ],
         ids=[
             "missing_parameters",
             "empty_attribute",
             "teams_created",
+            "team_with_unknown_key",
         ],
     )
     def test_from_dict(self, input, expected):
         result = Boxscore.from_dict(input)
         assert expected == result
 
+    def test_from_dict_does_not_mutate_converted_data(self):
+        converted = convert_keys_to_snake_case(
+            {"teams": {"away": {"team": {"id": 1}, "coaches": []}}}
+        )
+        assert Boxscore.from_dict(converted) == Boxscore.from_dict(converted)
+        assert Boxscore.from_dict(converted).away_team == Team(id=1)
+
     @pytest.mark.parametrize(
         "game_input, remove_na, expected",
         [
@@ -168,3 +201,68 @@ class TestBoxscore:
     def test_to_series(self, game_input, remove_na, expected):
         result = game_input.to_series(remove_missing_values=remove_na)
         pd.testing.assert_series_equal(expected, result, check_dtype=False)
+
+
+class TestLazyGame:
+    """
+    Tests the `nhl_api_py.models.game.LazyGame` class
+    """
+
+    FEED = {
+        "gameData": {
+            "game": {"pk": 1},
+            "status": {"detailedState": "Final"},
+            "players": {"ID1": {"fullName": "Player 1"}},
+        },
+        "liveData": {
+            "plays": {
+                "allPlays": [{"result": {"event": "e0"}}, {"result": {"event": "e1"}}],
+                "currentPlay": {"result": {"event": "e1"}},
+                "scoringPlays": [1],
+            },
+            "boxscore": {"teams": {"home": {"team": {"id": 2}}}},
+        },
+    }
+
+    @pytest.mark.parametrize(
+        "input",
+        [dict(), {"gameData": {"game": {"pk": 0}}}, FEED],
+        ids=["missing_parameters", "nested_expected_attr", "full_feed"],
+    )
+    def test_from_dict_equals_game(self, input):
+        result = LazyGame.from_dict(input)
+        assert result == Game.from_dict(input)
+        assert Game.from_dict(input) == result
+
+    def test_sections_parsed_on_access(self, monkeypatch):
+        parsed = []
+        from_dict = Play.from_dict.__func__
+        monkeypatch.setattr(
+            Play,
+            "from_dict",
+            classmethod(lambda cls, data: parsed.append(data) or from_dict(cls, data)),
+        )
+        game = LazyGame.from_dict(self.FEED)
+        assert game.pk == 1 and game.detailed_state == "Final"
+        assert game.scoring_plays == [1]
+        assert parsed == []
+        assert game.all_plays == [Play(event="e0"), Play(event="e1")]
+        assert len(parsed) == 2
+        assert game.all_plays is game.all_plays
+        assert len(parsed) == 2
+
+    def test_sections(self):
+        game = LazyGame.from_dict(self.FEED)
+        assert game.players == Game.from_dict(self.FEED).players
+        assert game.current_play == Play(event="e1")
+        assert game.boxscore.home_team == Team(id=2)
+        assert LazyGame.from_dict(dict()).boxscore is None
+
+    def test_set_section_before_access(self):
+        game = LazyGame.from_dict(self.FEED)
+        game.all_plays = []
+        assert game.all_plays == []
+
+    def test_pickle(self):
+        game = LazyGame.from_dict(self.FEED)
+        assert pickle.loads(pickle.dumps(game)) == Game.from_dict(self.FEED)
@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+from nhl_api_py.models.columnar import PlayColumns
+from nhl_api_py.models.query import (
+    ColumnIn,
+    EventType,
+    GamePk,
+    Period,
+    Strength,
+    TeamId,
+    TimeWindow,
+)
+
+
+def _play(event_type_id, period, period_time, team_id=None, strength=None):
+    play = {
+        "result": {"eventTypeId": event_type_id},
+        "about": {"period": period, "periodTime": period_time},
+    }
+    if team_id is not None:
+        play["team"] = {"id": team_id}
+    if strength is not None:
+        play["result"]["strength"] = {"code": strength}
+    return play
+
+
+PLAYS = [
+    _play("FACEOFF", 1, "00:00", team_id=1),
+    _play("SHOT", 1, "05:00", team_id=2),
+    _play("GOAL", 1, "06:00", team_id=2, strength="PPG"),
+    _play("SHOT", 2, "10:00", team_id=1),
+    _play("GOAL", 3, "16:00", team_id=1, strength="EVEN"),
+    _play("SHOT", 3, "19:00", team_id=2),
+]
+
+
+@pytest.fixture
+def columns():
+    return PlayColumns.from_json(PLAYS, game_pk=1)
+
+
+class TestIndex:
+    """
+    Tests the `nhl_api_py.models.columnar.PlayColumns.index` method
+    """
+
+    def test_contiguous_groups_are_slices(self, columns):
+        assert columns.index("period") == {
+            1: slice(0, 3),
+            2: slice(3, 4),
+            3: slice(4, 6),
+        }
+
+    def test_scattered_groups_are_read_only_positions(self, columns):
+        shots = columns.index("event_type_id")["SHOT"]
+        np.testing.assert_array_equal(shots, [1, 3, 5])
+        assert not shots.flags.writeable
+
+    def test_is_kept(self, columns):
+        assert columns.index("team_id") is columns.index("team_id")
+
+    def test_empty(self):
+        assert PlayColumns.from_json([]).index("period") == {}
+
+
+class TestPlayFilter:
+    """
+    Tests the filters of the `nhl_api_py.models.query` module
+    """
+
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            (EventType("SHOT"), [1, 3, 5]),
+            (EventType("SHOT", "GOAL"), [1, 2, 3, 4, 5]),
+            (EventType("HIT"), []),
+            (EventType("SHOT", "SHOT"), [1, 3, 5]),
+            (Period(3, 3), [4, 5]),
+            (Period(3), [4, 5]),
+            (Period(1, 3), [0, 1, 2, 4, 5]),
+            (TeamId(1), [0, 3, 4]),
+            (Strength("PPG"), [2]),
+            (GamePk(1), [0, 1, 2, 3, 4, 5]),
+            (TimeWindow("05:00", "10:00"), [1, 2]),
+            (TimeWindow(600), [3, 4, 5]),
+            (EventType("SHOT") & Period(3), [5]),
+            (EventType("GOAL") | Period(2), [2, 3, 4]),
+            (~EventType("SHOT"), [0, 2, 4]),
+            (
+                (EventType("GOAL") & Strength("PPG"))
+                | (EventType("SHOT") & Period(3) & TimeWindow("15:00", "20:00")),
+                [2, 5],
+            ),
+        ],
+        ids=[
+            "event_type",
+            "event_types",
+            "missing_event_type",
+            "repeated_event_type",
+            "repeated_period",
+            "period",
+            "periods",
+            "team",
+            "strength",
+            "game",
+            "time_window",
+            "open_time_window",
+            "and",
+            "or",
+            "not",
+            "nested",
+        ],
+    )
+    def test_positions(self, columns, query, expected):
+        np.testing.assert_array_equal(query.positions(columns), expected)
+        np.testing.assert_array_equal(np.flatnonzero(query.mask(columns)), expected)
+
+    def test_select(self, columns):
+        goals = EventType("GOAL").select(columns)
+        assert len(goals) == 2
+        np.testing.assert_array_equal(goals["strength_code"], ["PPG", "EVEN"])
+
+    def test_many_games(self):
+        columns = PlayColumns.concat(
+            [PlayColumns.from_json(PLAYS, game_pk=pk) for pk in (1, 2, 3)]
+        )
+        np.testing.assert_array_equal(Period(2).positions(columns), [3, 9, 15])
+        np.testing.assert_array_equal(
+            (EventType("GOAL") & GamePk(2)).positions(columns), [8, 10]
+        )
+
+    def test_repr(self):
+        query = (EventType("SHOT") | Period(3)) & ~ColumnIn("team_id", 1)
+        assert repr(query) == (
+            "((EventType('SHOT') | Period(3)) & ~ColumnIn('team_id', 1))"
+        )
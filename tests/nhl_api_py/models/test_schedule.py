@@ -1,6 +1,8 @@
 import pytest
 
+from nhl_api_py.models.game import Game
 from nhl_api_py.models.schedule import ScheduleDate
+from nhl_api_py.models.team import Team
 
 
 class TestScheduleDate:
@@ -21,3 +23,38 @@ class TestScheduleDate:
     def test_from_dict(self, input, expected):
         result = ScheduleDate.from_dict(input)
         assert expected == result
+
+    def test_from_dict_games(self):
+        result = ScheduleDate.from_dict(
+            {
+                "date": "2022-10-12",
+                "totalGames": 1,
+                "games": [
+                    {
+                        "gamePk": 2022020001,
+                        "gameType": "R",
+                        "season": "20222023",
+                        "gameDate": "2022-10-12T23:00:00Z",
+                        "status": {"abstractGameState": "Final", "statusCode": "7"},
+                        "teams": {
+                            "away": {"score": 3, "team": {"id": 1, "name": "One"}},
+                            "home": {"score": 2, "team": {"id": 2, "name": "Two"}},
+                        },
+                        "venue": {"name": "Arena"},
+                    }
+                ],
+            }
+        )
+        assert result.games == [
+            Game(
+                pk=2022020001,
+                season="20222023",
+                type="R",
+                date_time="2022-10-12T23:00:00Z",
+                abstract_game_state="Final",
+                status_code="7",
+                away=Team(id=1, name="One"),
+                home=Team(id=2, name="Two"),
+                venue={"name": "Arena"},
+            )
+        ]
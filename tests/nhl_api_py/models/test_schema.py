@@ -0,0 +1,160 @@
+import json
+
+import pytest
+
+from nhl_api_py.models import base
+from nhl_api_py.models.game import Boxscore, Game, LazyGame, Play
+from nhl_api_py.models.schedule import ScheduleDate
+from nhl_api_py.models.team import Team
+
+pytest.importorskip("msgspec")
+
+TEAM = {
+    "id": 1,
+    "name": "Team 1",
+    "venue": {"name": "Arena", "timeZone": {"tz": "EDT"}},
+    "teamName": "One",
+    "firstYearOfPlay": "1917",
+    "franchiseId": 20,
+    "active": True,
+    "unknownKey": {"nested": 1},
+}
+PLAY = {
+    "players": [{"player": {"fullName": "Player 1"}, "playerType": "Shooter"}],
+    "result": {
+        "event": "Goal",
+        "eventTypeId": "GOAL",
+        "strength": {"code": "PPG"},
+        "gameWinningGoal": True,
+        "penaltyMinutes": 2,
+    },
+    "about": {"period": 3, "periodTime": "12:34", "goals": {"away": 0, "home": 1}},
+    "coordinates": {"x": 80.0},
+    "team": {"id": 2, "triCode": "T02"},
+}
+GAME = {
+    "gamePk": 1,
+    "gameData": {
+        "game": {"pk": 1, "season": "20222023", "type": "R"},
+        "datetime": {"dateTime": "2022-10-12T23:00:00Z"},
+        "status": {"abstractGameState": "Final", "startTimeTBD": False},
+        "teams": {"away": TEAM, "home": {}},
+        "players": {"ID1": {"fullName": "Player 1"}},
+    },
+    "liveData": {
+        "plays": {
+            "allPlays": [PLAY, {"result": {"event": "Stoppage"}}],
+            "scoringPlays": [0],
+            "playsByPeriod": [{"startIndex": 0}],
+            "currentPlay": PLAY,
+        },
+        "decisions": {"winner": {"fullName": "Player 1"}},
+    },
+}
+BOXSCORE = {
+    "teams": {
+        "away": {
+            "team": {"id": 1},
+            "teamStats": {"teamSkaterStats": {"goals": 1}},
+            "players": {"ID1": {"jerseyNumber": "1"}},
+            "goalies": [1],
+            "onIcePlus": [{"playerId": 1}],
+            "scratches": [],
+        },
+        "home": {"team": {}},
+    },
+    "officials": [{"officialType": "Referee"}],
+}
+SCHEDULE_DATE = {
+    "date": "2022-10-12",
+    "totalGames": 1,
+    "games": [{"gamePk": 1}],
+    "events": [{"eventType": "x"}],
+}
+
+
+@pytest.mark.parametrize(
+    "cls, data",
+    [
+        (Team, TEAM),
+        (Team, dict()),
+        (Play, PLAY),
+        (Play, dict()),
+        (Game, GAME),
+        (Game, dict()),
+        (Game, {"liveData": {"plays": {"allPlays": [], "currentPlay": {}}}}),
+        (Boxscore, BOXSCORE),
+        (Boxscore, dict()),
+        (ScheduleDate, SCHEDULE_DATE),
+        (ScheduleDate, dict()),
+    ],
+    ids=[
+        "team",
+        "empty_team",
+        "play",
+        "empty_play",
+        "game",
+        "empty_game",
+        "game_without_plays",
+        "boxscore",
+        "empty_boxscore",
+        "schedule_date",
+        "empty_schedule_date",
+    ],
+)
+def test_from_json_equals_from_dict(cls, data):
+    assert cls.from_json(json.dumps(data).encode()) == cls.from_dict(data)
+
+
+def test_from_json_falls_back_when_schema_does_not_match():
+    data = {"about": {"period": "first"}}
+    assert Play.from_json(json.dumps(data).encode()) == Play(period="first")
+
+
+def test_from_json_without_schema(monkeypatch):
+    monkeypatch.setattr(base, "_schema", lambda: None)
+    assert Game.from_json(json.dumps(GAME).encode()) == Game.from_dict(GAME)
+
+
+def test_from_json_model_without_schema():
+    result = LazyGame.from_json(json.dumps(GAME).encode())
+    assert isinstance(result, LazyGame)
+    assert result == Game.from_dict(GAME)
+
+
+def test_from_json_invalid_json():
+    assert Team.from_json(b"<html>") == Team()
+    assert Team.list_from_json(b"<html>", "teams") == []
+
+
+@pytest.mark.parametrize(
+    "cls, key, data",
+    [
+        (Team, "teams", {"teams": [TEAM, {}]}),
+        (ScheduleDate, "dates", {"dates": [SCHEDULE_DATE]}),
+        (Team, "teams", {}),
+        (Team, "teams", {"teams": None}),
+    ],
+    ids=["teams", "dates", "missing", "null"],
+)
+def test_list_from_json_equals_from_dict(cls, key, data):
+    expected = [cls.from_dict(item) for item in data.get(key) or []]
+    assert cls.list_from_json(json.dumps(data).encode(), key) == expected
+
+
+def test_list_from_json_without_schema(monkeypatch):
+    monkeypatch.setattr(base, "_schema", lambda: None)
+    content = json.dumps({"teams": [TEAM]}).encode()
+    assert Team.list_from_json(content, "teams") == [Team.from_dict(TEAM)]
+
+
+def test_from_json_raises_errors_of_the_schema(monkeypatch):
+    from nhl_api_py.models import schema
+
+    def build(team):
+        raise KeyError("bug")
+
+    decoder = schema._DECODERS[Team][0]
+    monkeypatch.setitem(schema._DECODERS, Team, (decoder, build))
+    with pytest.raises(KeyError):
+        Team.from_json(json.dumps(TEAM).encode())
@@ -0,0 +1,195 @@
+"""
+Tests the `nhl_api.core.async_api` module.
+"""
+import asyncio
+import json
+import threading
+import time
+from typing import Callable
+
+import pytest
+import responses
+
+from benchmarks.server import mock_api
+from nhl_api_py.core.api import NhlApi, ResponseError
+from nhl_api_py.core.async_api import AsyncNhlApi
+from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.models.schedule import ScheduleDate
+from nhl_api_py.models.team import Team
+
+
+class _SlowFeeds:
+    """
+    Builds minimal game feeds slowly, recording the peak number of requests
+    being handled at the same time.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def route(self, game_id: int) -> Callable[[], bytes]:
+        def body() -> bytes:
+            with self.lock:
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+            time.sleep(0.02)
+            with self.lock:
+                self.in_flight -= 1
+            return json.dumps({"gameData": {"game": {"pk": game_id}}}).encode()
+
+        return body
+
+
+class TestAsyncNhlApi:
+    """
+    Tests the AsyncNhlApi class from the `nhl_data_py.core.async_api` module.
+    """
+
+    BASE_URL = "https://statsapi.web.nhl.com/api/v1"
+
+    def test_concurrency_is_bounded(self):
+        """
+        Tests that many concurrent calls against a local server never exceed
+        `max_concurrency` requests in flight, and return the parsed models.
+        """
+        feeds = _SlowFeeds()
+        game_ids = range(100, 140)
+        routes = {
+            f"/api/v1/game/{game_id}/feed/live": feeds.route(game_id)
+            for game_id in game_ids
+        }
+
+        async def fetch_all(url):
+            async with AsyncNhlApi(max_concurrency=4) as api:
+                api.api.url = f"{url}/api/v1"
+                return await asyncio.gather(
+                    *(api.game(game_id) for game_id in game_ids)
+                )
+
+        with mock_api(routes) as url:
+            results = asyncio.run(fetch_all(url))
+        assert results == [Game(pk=game_id) for game_id in game_ids]
+        assert 1 < feeds.peak <= 4
+
+    @responses.activate
+    def test_get(self):
+        responses.get(f"{TestAsyncNhlApi.BASE_URL}/random-endpoint", json={"a": 1})
+
+        async def call():
+            async with AsyncNhlApi() as api:
+                return await api.get("random-endpoint")
+
+        resp = asyncio.run(call())
+        assert resp.status_code == 200 and resp.data == {"a": 1}
+
+    @responses.activate
+    def test_errors_are_raised(self):
+        responses.get(f"{TestAsyncNhlApi.BASE_URL}/random-endpoint", status=404)
+
+        async def call():
+            async with AsyncNhlApi() as api:
+                return await api.get("random-endpoint")
+
+        with pytest.raises(ResponseError):
+            asyncio.run(call())
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "method, kwargs, endpoint, resp_data, expected",
+        [
+            ("teams", {}, "teams", {"teams": [{"id": 1}]}, [Team(id=1)]),
+            (
+                "game",
+                {"game_id": 1},
+                "game/1/feed/live",
+                {"gameData": {"game": {"pk": 1}}},
+                Game(pk=1),
+            ),
+            (
+                "boxscore",
+                {"game_id": 1},
+                "game/1/boxscore",
+                {"teams": {"away": {"team": {"id": 1}}}},
+                Boxscore(away_team=Team(id=1)),
+            ),
+            (
+                "plays",
+                {"game_id": 1},
+                "game/1/feed/live",
+                {"liveData": {"plays": {"allPlays": [{"result": {"event": "e"}}]}}},
+                [Play(event="e")],
+            ),
+            (
+                "schedule",
+                {},
+                "schedule",
+                {"dates": [{"date": "2000-01-01"}]},
+                [ScheduleDate(date="2000-01-01")],
+            ),
+        ],
+        ids=["teams", "game", "boxscore", "plays", "schedule"],
+    )
+    def test_methods_return_models(self, method, kwargs, endpoint, resp_data, expected):
+        responses.get(f"{TestAsyncNhlApi.BASE_URL}/{endpoint}", json=resp_data)
+
+        async def call():
+            async with AsyncNhlApi() as api:
+                return await getattr(api, method)(**kwargs)
+
+        assert asyncio.run(call()) == expected
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "share_models", [False, True], ids=["own_models", "shared_models"]
+    )
+    def test_identical_calls_are_coalesced(self, share_models):
+        """
+        Tests that identical calls made at once send one request, and share the
+        one model if `share_models` is set.
+        """
+
+        def callback(request):
+            # Slow enough for the requests of each thread to overlap.
+            time.sleep(0.05)
+            return 200, {}, json.dumps({"gameData": {"game": {"pk": 1}}})
+
+        responses.add_callback(
+            responses.GET,
+            f"{TestAsyncNhlApi.BASE_URL}/game/1/feed/live",
+            callback=callback,
+        )
+
+        async def call():
+            async with AsyncNhlApi(share_models=share_models) as api:
+                games = await asyncio.gather(*(api.game(1) for _ in range(10)))
+                return games, api._flights
+
+        games, flights = asyncio.run(call())
+        assert len(responses.calls) == 1
+        assert all(game == Game(pk=1) for game in games)
+        assert len({id(game) for game in games}) == (1 if share_models else 10)
+        assert flights == {}
+
+    @responses.activate
+    def test_cancelled_caller_does_not_cancel_others(self):
+        responses.get(f"{TestAsyncNhlApi.BASE_URL}/random-endpoint", json={"a": 1})
+
+        async def call():
+            async with AsyncNhlApi() as api:
+                first = asyncio.create_task(api.get("random-endpoint"))
+                second = asyncio.create_task(api.get("random-endpoint"))
+                await asyncio.sleep(0)
+                first.cancel()
+                return await second
+
+        assert asyncio.run(call()).data == {"a": 1}
+        assert len(responses.calls) == 1
+
+    def test_close_keeps_external_api_open(self):
+        api = NhlApi()
+        closed = []
+        api.close = lambda: closed.append(True)
+        asyncio.run(AsyncNhlApi(api=api).close())
+        assert closed == []
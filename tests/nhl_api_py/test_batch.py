@@ -0,0 +1,85 @@
+"""
+Tests the `nhl_api.core.batch` module.
+"""
+import gc
+import threading
+import time
+import weakref
+
+import pytest
+
+from nhl_api_py.core.batch import BatchResult, fan_out
+from nhl_api_py.core.error_exceptions import ResponseError
+
+
+def _slow_double(key):
+    # Later keys finish first, so completion order is the reverse of input order.
+    time.sleep(0.01 * (5 - key))
+    if key == 3:
+        raise ResponseError("bad key")
+    return key * 2
+
+
+def test_batch_result_ok():
+    assert BatchResult(1, value=2).ok
+    assert not BatchResult(1, error=ResponseError()).ok
+
+
+@pytest.mark.parametrize("ordered", [True, False], ids=["ordered", "unordered"])
+def test_fan_out_collects_errors(ordered):
+    results = list(fan_out(_slow_double, range(5), max_workers=5, ordered=ordered))
+    assert {r.key: r.value for r in results if r.ok} == {0: 0, 1: 2, 2: 4, 4: 8}
+    errors = [r for r in results if not r.ok]
+    assert len(errors) == 1 and errors[0].key == 3
+    assert isinstance(errors[0].error, ResponseError)
+
+
+def test_fan_out_ordered():
+    results = fan_out(_slow_double, range(5), max_workers=5, ordered=True)
+    assert [r.key for r in results] == [0, 1, 2, 3, 4]
+
+
+def test_fan_out_unordered_yields_as_completed():
+    results = fan_out(_slow_double, range(5), max_workers=5, ordered=False)
+    assert [r.key for r in results] == [4, 3, 2, 1, 0]
+
+
+def test_fan_out_uses_max_workers():
+    threads = set()
+
+    def record_thread(key):
+        threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return key
+
+    list(fan_out(record_thread, range(20), max_workers=3))
+    assert len(threads) <= 3
+
+
+def test_fan_out_cancels_pending_on_close():
+    started = []
+
+    def record_start(key):
+        started.append(key)
+        time.sleep(0.02)
+        return key
+
+    results = fan_out(record_start, range(50), max_workers=1, ordered=True)
+    next(results)
+    results.close()
+    time.sleep(0.05)
+    assert len(started) < 50
+
+
+@pytest.mark.parametrize("ordered", [True, False], ids=["ordered", "unordered"])
+def test_fan_out_drops_yielded_results(ordered):
+    class Value:
+        pass
+
+    results = fan_out(lambda key: Value(), range(3), max_workers=3, ordered=ordered)
+    first = weakref.ref(next(results).value)
+    next(results)
+    gc.collect()
+    # The first value is no longer referenced while the batch goes on.
+    assert first() is None
+    assert len(list(results)) == 1
@@ -0,0 +1,206 @@
+"""
+Tests the `nhl_api.core.cache` module.
+"""
+import json
+import os
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from nhl_api_py.core.cache import (
+    DEFAULT_TTL,
+    LIVE_TTL,
+    TEAMS_TTL,
+    CacheEntry,
+    DiskCache,
+    MemoryCache,
+    default_ttl_policy,
+)
+from nhl_api_py.core.response import Response
+
+
+@pytest.fixture(params=["memory", "disk"])
+def cache(request, tmp_path):
+    return MemoryCache() if request.param == "memory" else DiskCache(tmp_path)
+
+
+class TestCaches:
+    """
+    Tests behaviour shared by all cache backends.
+    """
+
+    def test_get_missing(self, cache):
+        assert cache.get("teams?") is None
+
+    def test_set_then_get(self, cache):
+        response = Response(200, {"teams": [{"id": 1}]}, {"ETag": '"abc"'})
+        cache.set("teams?", response, ttl=60)
+        result = cache.get("teams?").response
+        assert result.status_code == 200 and result.data == {"teams": [{"id": 1}]}
+        assert result.etag == '"abc"'
+
+    @pytest.mark.parametrize("ttl", [None, 60], ids=["never_expires", "ttl"])
+    def test_fresh_entry(self, cache, ttl):
+        cache.set("teams?", Response(200, {}), ttl=ttl)
+        assert cache.get("teams?").fresh
+        with patch("nhl_api_py.core.cache.time", return_value=10**12):
+            assert cache.get("teams?").fresh == (ttl is None)
+
+    def test_expired_entry_is_kept(self, cache):
+        cache.set("teams?", Response(200, {"teams": []}), ttl=0)
+        entry = cache.get("teams?")
+        assert not entry.fresh
+        assert entry.response.data == {"teams": []}
+
+    def test_delete(self, cache):
+        cache.set("teams?", Response(200, {}), ttl=60)
+        cache.delete("teams?")
+        cache.delete("never-set")
+        assert cache.get("teams?") is None
+
+    def test_clear(self, cache):
+        cache.set("teams?", Response(200, {}), ttl=60)
+        cache.set("schedule?", Response(200, {}), ttl=60)
+        cache.clear()
+        assert cache.get("teams?") is None and cache.get("schedule?") is None
+
+
+@pytest.mark.parametrize(
+    "expires_at, expected",
+    [(None, True), (10**12, True), (0, False)],
+    ids=["never_expires", "future", "past"],
+)
+def test_cache_entry_fresh(expires_at, expected):
+    assert CacheEntry(Response(200, {}), expires_at).fresh == expected
+
+
+class TestMemoryCache:
+    """
+    Tests the `MemoryCache` class.
+    """
+
+    def test_evicts_least_recently_used(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", Response(200, {}), ttl=None)
+        cache.set("b", Response(200, {}), ttl=None)
+        cache.get("a")
+        cache.set("c", Response(200, {}), ttl=None)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+
+    def test_evicts_unused(self):
+        cache = MemoryCache(max_age=60)
+        with patch("nhl_api_py.core.cache.time", return_value=1000):
+            cache.set("a", Response(200, {}), ttl=None)
+            cache.set("b", Response(200, {}), ttl=None)
+        with patch("nhl_api_py.core.cache.time", return_value=1050):
+            cache.get("b")
+        with patch("nhl_api_py.core.cache.time", return_value=1100):
+            assert cache.get("a") is None
+            assert cache.get("b") is not None
+            assert len(cache) == 1
+
+    def test_returns_same_response(self):
+        cache = MemoryCache()
+        response = Response(200, {})
+        cache.set("a", response, ttl=None)
+        assert cache.get("a").response is response
+
+
+class TestDiskCache:
+    """
+    Tests the `DiskCache` class.
+    """
+
+    def test_persists_between_instances(self, tmp_path):
+        DiskCache(tmp_path).set("teams?", Response(200, {"teams": []}), ttl=None)
+        assert DiskCache(tmp_path).get("teams?").response.data == {"teams": []}
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.set("teams?", Response(200, {}), ttl=None)
+        cache._path("teams?").write_text("{not json")
+        assert cache.get("teams?") is None
+
+    def test_entry_without_headers(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        entry = {"key": "teams?", "expires_at": None, "status_code": 200, "data": {}}
+        cache._path("teams?").write_text(json.dumps(entry))
+        assert cache.get("teams?").response.headers == {}
+
+    def test_failed_write_leaves_no_file(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        with pytest.raises(TypeError):
+            cache.set("teams?", Response(200, {"a": object()}), ttl=None)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_prunes_unused(self, tmp_path):
+        cache = DiskCache(tmp_path, max_age=60)
+        cache.set("a", Response(200, {}), ttl=None)
+        cache.set("b", Response(200, {}), ttl=None)
+        os.utime(cache._path("a"), (0, 0))
+        cache.prune()
+        assert cache.get("a") is None and cache.get("b") is not None
+
+    def test_prunes_least_recently_used_beyond_max_bytes(self, tmp_path):
+        cache = DiskCache(tmp_path, max_age=None, max_bytes=None)
+        for used_at, key in enumerate("abc"):
+            cache.set(key, Response(200, {"data": "x" * 100}), ttl=None)
+            os.utime(cache._path(key), (used_at, used_at))
+        # "a" is used last, so "b" is the least recently used.
+        cache.get("a")
+        cache.max_bytes = 2 * cache._path("a").stat().st_size
+        cache.prune()
+        assert [key for key in "abc" if cache.get(key)] == ["a", "c"]
+
+    def test_prunes_on_set(self, tmp_path):
+        cache = DiskCache(tmp_path, max_age=60)
+        cache.set("a", Response(200, {}), ttl=None)
+        os.utime(cache._path("a"), (0, 0))
+        cache.set("b", Response(200, {}), ttl=None)
+        # Pruned when "a" was set, not again yet.
+        assert cache._path("a").exists()
+        with patch("nhl_api_py.core.cache.PRUNE_INTERVAL", 0):
+            cache.set("c", Response(200, {}), ttl=None)
+        assert not cache._path("a").exists()
+
+
+@pytest.mark.parametrize(
+    "endpoint, data, expected",
+    [
+        (
+            "game/2017020001/feed/live",
+            {"gameData": {"status": {"abstractGameState": "Final"}}},
+            None,
+        ),
+        (
+            "game/2017020001/feed/live",
+            {"gameData": {"status": {"abstractGameState": "Live"}}},
+            LIVE_TTL,
+        ),
+        ("game/2017020001/feed/live", {}, LIVE_TTL),
+        ("game/2017020001/boxscore", {}, None),
+        (f"game/{date.today().year}020001/boxscore", {}, LIVE_TTL),
+        (f"game/{date.today().year - 1}020001/boxscore", {}, LIVE_TTL),
+        ("teams?", {}, TEAMS_TTL),
+        ("teams?season=20102011&", {}, None),
+        (f"teams?season={date.today().year}{date.today().year + 1}&", {}, TEAMS_TTL),
+        ("schedule?", {}, DEFAULT_TTL),
+    ],
+    ids=[
+        "final_game",
+        "live_game",
+        "unknown_game_state",
+        "past_season_boxscore",
+        "current_season_boxscore",
+        "last_season_boxscore",
+        "current_teams",
+        "past_season_teams",
+        "current_season_teams",
+        "schedule",
+    ],
+)
+def test_default_ttl_policy(endpoint, data, expected):
+    assert default_ttl_policy(endpoint, Response(200, data)) == expected
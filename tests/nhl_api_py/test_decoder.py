@@ -0,0 +1,58 @@
+"""
+Tests the `nhl_api.core.decoder` module.
+"""
+import json
+
+import pytest
+
+from nhl_api_py.core import decoder
+
+
+@pytest.fixture(autouse=True)
+def reset_decoder():
+    yield
+    decoder.set_decoder(None)
+
+
+def _library_decoder(name):
+    if name == "orjson":
+        return pytest.importorskip("orjson").loads
+    if name == "msgspec":
+        return pytest.importorskip("msgspec").json.Decoder().decode
+    return json.loads
+
+
+class TestDecoder:
+    """
+    Tests decoding JSON bodies with each supported library.
+    """
+
+    def test_default_decoder(self):
+        assert decoder.get_decoder() is decoder.DEFAULT_DECODER
+        assert decoder.DEFAULT_DECODER_NAME in ("orjson", "msgspec", "json")
+
+    @pytest.mark.parametrize("library", ["orjson", "msgspec", "json"])
+    def test_decode(self, library):
+        decoder.set_decoder(_library_decoder(library))
+        body = '{"gamePk": 1, "name": "Montréal", "plays": [1.5, null, true]}'
+        assert decoder.decode(body.encode()) == json.loads(body)
+
+    @pytest.mark.parametrize("library", ["orjson", "msgspec", "json"])
+    @pytest.mark.parametrize("body", [b"", b"<html>", b'{"a": '])
+    def test_invalid_json_raises_value_error(self, library, body):
+        decoder.set_decoder(_library_decoder(library))
+        with pytest.raises(ValueError):
+            decoder.decode(body)
+
+    @pytest.mark.parametrize("library", ["orjson", "msgspec", "json"])
+    def test_decode_or_empty(self, library):
+        decoder.set_decoder(_library_decoder(library))
+        assert decoder.decode_or_empty(b'{"a": 1}') == {"a": 1}
+        assert decoder.decode_or_empty(b"<html>") == {}
+        assert decoder.decode_or_empty(b"x", lambda content: [content]) == [b"x"]
+
+    def test_set_decoder(self):
+        decoder.set_decoder(lambda content: {"decoded": content})
+        assert decoder.decode(b"x") == {"decoded": b"x"}
+        decoder.set_decoder(None)
+        assert decoder.get_decoder() is decoder.DEFAULT_DECODER
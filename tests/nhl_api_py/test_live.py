@@ -0,0 +1,266 @@
+"""
+Tests the `nhl_api.core.live` module.
+"""
+import threading
+
+import pytest
+import responses
+from responses import matchers
+
+from nhl_api_py.core.api import NhlApi
+from nhl_api_py.core.cache import MemoryCache
+from nhl_api_py.core.live import LiveGamePoller
+from nhl_api_py.models.game import Play
+
+BASE_URL = "https://statsapi.web.nhl.com/api/v1/game/2017020001/feed/live"
+
+
+def _feed(events, state="Live", timecode="t0"):
+    return {
+        "metaData": {"timeStamp": timecode},
+        "gameData": {
+            "game": {"pk": 2017020001},
+            "status": {"abstractGameState": state, "detailedState": state},
+        },
+        "liveData": {
+            "plays": {
+                "allPlays": [{"result": {"event": event}} for event in events],
+                "scoringPlays": [],
+                "penaltyPlays": [],
+            }
+        },
+    }
+
+
+def _diff(timecode, operations):
+    return [
+        {
+            "diff": [
+                {"op": "replace", "path": "/metaData/timeStamp", "value": timecode},
+                *operations,
+            ]
+        }
+    ]
+
+
+def _diff_endpoint(timecode, **kwargs):
+    responses.get(
+        f"{BASE_URL}/diffPatch",
+        match=[matchers.query_param_matcher({"startTimecode": timecode})],
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def poller():
+    return LiveGamePoller(NhlApi(max_retries=0), 2017020001)
+
+
+class TestLiveGamePoller:
+    """
+    Tests the `LiveGamePoller` class.
+    """
+
+    @responses.activate
+    def test_first_poll_loads_feed(self, poller):
+        responses.get(BASE_URL, json=_feed(["a", "b"]))
+        received = []
+        poller.subscribe(received.append)
+        new_plays = poller.poll()
+        assert new_plays == [Play(event="a"), Play(event="b")]
+        assert received == [new_plays]
+        assert poller.game.pk == 2017020001 and poller.timecode == "t0"
+
+    @responses.activate
+    def test_poll_applies_diff(self, poller):
+        responses.get(BASE_URL, json=_feed(["a"]))
+        poller.poll()
+        all_plays = poller.game.all_plays
+        _diff_endpoint(
+            "t0",
+            json=_diff(
+                "t1",
+                [
+                    {
+                        "op": "add",
+                        "path": "/liveData/plays/allPlays/1",
+                        "value": {"result": {"event": "goal"}},
+                    },
+                    {"op": "add", "path": "/liveData/plays/scoringPlays/0", "value": 1},
+                    {
+                        "op": "replace",
+                        "path": "/liveData/plays/allPlays/0/result/event",
+                        "value": "ignored",
+                    },
+                    {
+                        "op": "replace",
+                        "path": "/gameData/status/detailedState",
+                        "value": "In Progress - Critical",
+                    },
+                    {"op": "remove", "path": "/gameData/status/codedGameState"},
+                ],
+            ),
+        )
+        received = []
+        poller.subscribe(received.append)
+        new_plays = poller.poll()
+        assert new_plays == [Play(event="goal")]
+        assert received == [new_plays]
+        assert poller.game.all_plays is all_plays
+        assert all_plays == [Play(event="a"), Play(event="goal")]
+        assert poller.game.current_play is new_plays[0]
+        assert poller.game.scoring_plays == [1]
+        assert poller.game.detailed_state == "In Progress - Critical"
+        assert poller.timecode == "t1"
+
+    @responses.activate
+    def test_poll_sets_play_indexes_by_position(self, poller):
+        feed = _feed(["a", "b"])
+        feed["liveData"]["plays"]["scoringPlays"] = [0]
+        responses.get(BASE_URL, json=feed)
+        poller.poll()
+        _diff_endpoint(
+            "t0",
+            json=_diff(
+                "t1",
+                [
+                    {
+                        "op": "replace",
+                        "path": "/liveData/plays/scoringPlays/0",
+                        "value": 1,
+                    },
+                    {"op": "add", "path": "/liveData/plays/penaltyPlays/-", "value": 0},
+                    {"op": "add", "path": "/liveData/plays/penaltyPlays/0", "value": 1},
+                ],
+            ),
+        )
+        poller.poll()
+        assert poller.game.scoring_plays == [1]
+        assert poller.game.penalty_plays == [1, 0]
+
+    @responses.activate
+    def test_poll_appends_plays_to_the_end(self, poller):
+        responses.get(BASE_URL, json=_feed(["a"]))
+        poller.poll()
+        _diff_endpoint(
+            "t0",
+            json=_diff(
+                "t1",
+                [
+                    {
+                        "op": "add",
+                        "path": "/liveData/plays/allPlays/-",
+                        "value": {"result": {"event": "b"}},
+                    }
+                ],
+            ),
+        )
+        assert poller.poll() == [Play(event="b")]
+        assert poller.game.all_plays == [Play(event="a"), Play(event="b")]
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "path, value",
+        [
+            ("/liveData/plays/allPlays/3", {"result": {"event": "d"}}),
+            ("/liveData/plays/scoringPlays/2", 3),
+            ("/liveData/plays/scoringPlays/0", 3),
+        ],
+        ids=["play_past_the_end", "index_past_the_end", "replace_past_the_end"],
+    )
+    def test_poll_falls_back_to_full_feed_on_gaps(self, poller, path, value):
+        responses.get(BASE_URL, json=_feed(["a"]))
+        poller.poll()
+        feed = _feed(["a", "b", "c", "d"], timecode="t2")
+        feed["liveData"]["plays"]["scoringPlays"] = [3]
+        responses.replace(responses.GET, BASE_URL, json=feed)
+        op = "replace" if path.endswith("scoringPlays/0") else "add"
+        added = {
+            "op": "add",
+            "path": "/liveData/plays/allPlays/1",
+            "value": {"result": {"event": "b"}},
+        }
+        _diff_endpoint(
+            "t0",
+            json=_diff("t1", [added, {"op": op, "path": path, "value": value}]),
+        )
+        assert poller.poll() == [Play(event=event) for event in "bcd"]
+        assert poller.game.all_plays == [Play(event=event) for event in "abcd"]
+        assert poller.game.scoring_plays == [3]
+        assert poller.game.current_play == Play(event="d")
+        assert poller.timecode == "t2"
+
+    @responses.activate
+    def test_empty_diff_emits_nothing(self, poller):
+        responses.get(BASE_URL, json=_feed(["a"]))
+        poller.poll()
+        _diff_endpoint("t0", json=[])
+        received = []
+        poller.subscribe(received.append)
+        assert poller.poll() == []
+        assert received == []
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "diff_kwargs",
+        [{"json": _feed(["a", "b"], "Final", "t1")}, {"status": 404}],
+        ids=["full_feed_returned", "diff_failed"],
+    )
+    def test_poll_falls_back_to_full_feed(self, poller, diff_kwargs):
+        responses.get(BASE_URL, json=_feed(["a"]))
+        poller.poll()
+        responses.replace(
+            responses.GET, BASE_URL, json=_feed(["a", "b"], "Final", "t1")
+        )
+        _diff_endpoint("t0", **diff_kwargs)
+        assert poller.poll() == [Play(event="b")]
+        assert poller.game.all_plays == [Play(event="a"), Play(event="b")]
+        assert poller.is_final and poller.timecode == "t1"
+
+    @responses.activate
+    def test_unchanged_cached_feed_is_skipped(self):
+        responses.get(BASE_URL, json=_feed(["a"]))
+        api = NhlApi(cache=MemoryCache(), max_retries=0)
+        poller = LiveGamePoller(api, 2017020001)
+        poller.poll()
+        _diff_endpoint("t0", status=500)
+        assert poller.poll() == []
+        assert poller.game.all_plays == [Play(event="a")]
+
+    @responses.activate
+    def test_unsubscribe(self, poller):
+        responses.get(BASE_URL, json=_feed(["a"]))
+        received = []
+        poller.subscribe(received.append)
+        poller.unsubscribe(received.append)
+        poller.poll()
+        assert received == []
+
+    @responses.activate
+    def test_run_stops_when_final(self, poller):
+        responses.get(BASE_URL, json=_feed(["a"]))
+        _diff_endpoint(
+            "t0",
+            json=_diff(
+                "t1",
+                [
+                    {
+                        "op": "replace",
+                        "path": "/gameData/status/abstractGameState",
+                        "value": "Final",
+                    }
+                ],
+            ),
+        )
+        poller.interval = 0
+        poller.run()
+        assert poller.is_final
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_run_stops_when_set(self, poller):
+        responses.get(BASE_URL, json=_feed(["a"]))
+        stop = threading.Event()
+        poller.subscribe(lambda plays: stop.set())
+        poller.run(stop)
+        assert len(responses.calls) == 1
@@ -0,0 +1,136 @@
+"""
+Tests the `nhl_api.core.metrics` module.
+"""
+import socket
+
+import pytest
+
+from nhl_api_py.core.metrics import (
+    InMemorySink,
+    NullSink,
+    PrometheusSink,
+    StatsdSink,
+    Summary,
+    endpoint_name,
+    timer,
+)
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected",
+    [
+        ("teams?", "teams"),
+        ("teams?teamId=1,2&season=20222023&", "teams"),
+        ("game/2017020001/feed/live", "game/{id}/feed/live"),
+        (
+            "game/2017020001/feed/live/diffPatch?startTimecode=20221013_030512",
+            "game/{id}/feed/live/diffPatch",
+        ),
+    ],
+    ids=["no_query", "query", "game", "game_with_query"],
+)
+def test_endpoint_name(endpoint, expected):
+    assert endpoint_name(endpoint) == expected
+
+
+class TestInMemorySink:
+    """
+    Tests the `nhl_api_py.core.metrics.InMemorySink` class.
+    """
+
+    def test_summary(self):
+        sink = InMemorySink()
+        for value in range(1, 101):
+            sink.observe("request_seconds", value, {"endpoint": "teams"})
+        assert sink.summary("request_seconds", endpoint="teams") == Summary(
+            100, 5050, 50, 95, 99
+        )
+        assert sink.summary("request_seconds", endpoint="schedule") is None
+
+    def test_summary_window(self):
+        sink = InMemorySink(window=2)
+        for value in (100, 1, 2):
+            sink.observe("response_bytes", value)
+        assert sink.summary("response_bytes") == Summary(3, 103, 1, 2, 2)
+
+    def test_count(self):
+        sink = InMemorySink()
+        sink.increment("cache", tags={"result": "hit"})
+        sink.increment("cache", 2, tags={"result": "hit"})
+        sink.increment("cache", tags={"result": "miss"})
+        assert sink.count("cache", result="hit") == 3
+        assert sink.count("cache", result="miss") == 1
+        assert sink.count("cache", result="revalidated") == 0
+
+    def test_clear(self):
+        sink = InMemorySink()
+        sink.observe("response_bytes", 1)
+        sink.increment("responses")
+        sink.clear()
+        assert sink.summaries() == {} and sink.counters() == {}
+
+
+def test_prometheus_render():
+    sink = PrometheusSink()
+    sink.observe("request_seconds", 0.5, {"endpoint": 'a"b', "status": "200"})
+    sink.increment("responses", tags={"endpoint": "teams", "status": "200"})
+    assert sink.render().splitlines() == [
+        "# TYPE nhl_api_request_seconds summary",
+        'nhl_api_request_seconds{endpoint="a\\"b",status="200",quantile="0.5"} 0.5',
+        'nhl_api_request_seconds{endpoint="a\\"b",status="200",quantile="0.95"} 0.5',
+        'nhl_api_request_seconds{endpoint="a\\"b",status="200",quantile="0.99"} 0.5',
+        'nhl_api_request_seconds_sum{endpoint="a\\"b",status="200"} 0.5',
+        'nhl_api_request_seconds_count{endpoint="a\\"b",status="200"} 1',
+        "# TYPE nhl_api_responses_total counter",
+        'nhl_api_responses_total{endpoint="teams",status="200"} 1',
+    ]
+
+
+def test_statsd_sends_udp():
+    listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.settimeout(2)
+    sink = StatsdSink(port=listener.getsockname()[1])
+    try:
+        sink.observe("request_seconds", 0.25, {"endpoint": "teams"})
+        sink.observe("response_bytes", 1024)
+        sink.increment("responses", tags={"status": "200"})
+        received = [listener.recv(1024).decode() for _ in range(3)]
+    finally:
+        sink.close()
+        listener.close()
+    assert received == [
+        "nhl_api.request:250|ms|#endpoint:teams",
+        "nhl_api.response_bytes:1024|h",
+        "nhl_api.responses:1|c|#status:200",
+    ]
+
+
+def test_statsd_never_raises():
+    sink = StatsdSink(host="256.0.0.1")
+    sink.increment("responses")
+    sink.close()
+
+
+class TestTimer:
+    """
+    Tests the `nhl_api_py.core.metrics.timer` context manager.
+    """
+
+    def test_records_duration(self):
+        sink = InMemorySink()
+        with timer(sink, "parse_seconds", {"model": "Game"}):
+            pass
+        summary = sink.summary("parse_seconds", model="Game")
+        assert summary.count == 1 and summary.sum >= 0
+
+    def test_nothing_recorded_on_exception(self):
+        sink = InMemorySink()
+        with pytest.raises(ValueError):
+            with timer(sink, "parse_seconds"):
+                raise ValueError()
+        assert sink.summaries() == {}
+
+    def test_null_sink(self):
+        with timer(NullSink(), "parse_seconds"):
+            pass
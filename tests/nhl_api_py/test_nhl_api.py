@@ -1,13 +1,24 @@
 """
 Tests the `nhl_api.core.nhl_api` module.
 """
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
 
+import pandas as pd
 import pytest
 import responses
+from requests import Session
+from responses import matchers, registries
 
 from nhl_api_py.core.api import NhlApi, ResponseError
-from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.core.cache import MemoryCache
+from nhl_api_py.core.metrics import InMemorySink
+from nhl_api_py.core.throttle import AdaptiveConcurrency, RetryPolicy, TokenBucket
+from nhl_api_py.models.game import Boxscore, Game, LazyGame, Play
+from nhl_api_py.models.query import Period
 from nhl_api_py.models.schedule import ScheduleDate
 from nhl_api_py.models.team import Team
 
@@ -19,6 +30,275 @@ class TestNhlApi:
 
     BASE_URL = "https://statsapi.web.nhl.com/api/v1"
 
+    def test_context_manager_closes_owned_session(self):
+        """
+        Tests that leaving the `NhlApi` context closes the session it created.
+        """
+        with NhlApi() as api:
+            api.session = MagicMock(spec=Session)
+        api.session.close.assert_called_once()
+
+    def test_close_keeps_external_session_open(self):
+        """
+        Tests that `NhlApi.close` does not close a session it was given.
+        """
+        session = MagicMock(spec=Session)
+        NhlApi(session=session).close()
+        session.close.assert_not_called()
+
+    @responses.activate
+    def test_requests_reuse_session(self):
+        """
+        Tests that every request goes through the session owned by `NhlApi`.
+        """
+        responses.get(f"{TestNhlApi.BASE_URL}/random-endpoint", json={})
+        api = NhlApi(timeout=5)
+        api.session = MagicMock(wraps=api.session)
+        api.get("random-endpoint")
+        api.get("random-endpoint")
+        assert api.session.request.call_count == 2
+        api.session.request.assert_called_with(
+            "GET", f"{TestNhlApi.BASE_URL}/random-endpoint", headers=None, timeout=5
+        )
+
+    @responses.activate
+    def test_get_uses_cache(self):
+        """
+        Tests that `NhlApi.get` serves fresh responses from the cache.
+        """
+        responses.get(f"{TestNhlApi.BASE_URL}/random-endpoint", json={"a": 1})
+        api = NhlApi(cache=MemoryCache(), ttl_policy=lambda endpoint, response: 60)
+        first = api.get("random-endpoint")
+        second = api.get("random-endpoint")
+        assert second is first
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_metrics(self):
+        """
+        Tests that requests record network, decoding and parsing metrics per
+        endpoint.
+        """
+        responses.get(f"{TestNhlApi.BASE_URL}/game/2017020001/feed/live", json={"a": 1})
+        responses.get(f"{TestNhlApi.BASE_URL}/game/2017020002/feed/live", status=500)
+        sink = InMemorySink()
+        api = NhlApi(max_retries=0, metrics=sink)
+        api.game(2017020001)
+        with pytest.raises(ResponseError):
+            api.game(2017020002)
+        endpoint = "game/{id}/feed/live"
+        for status in ("200", "500"):
+            summary = sink.summary("request_seconds", endpoint=endpoint, status=status)
+            assert summary.count == 1
+            assert sink.count("responses", endpoint=endpoint, status=status) == 1
+        assert sink.summary("response_bytes", endpoint=endpoint).count == 2
+        assert sink.summary("decode_seconds", endpoint=endpoint).count == 1
+        assert sink.summary("parse_seconds", model="Game").count == 1
+
+    @responses.activate
+    def test_cache_metrics(self):
+        """
+        Tests that cache hits, revalidations and misses are counted.
+        """
+        responses.get(
+            f"{TestNhlApi.BASE_URL}/random-endpoint",
+            json={"a": 1},
+            headers={"ETag": '"v1"'},
+        )
+        responses.get(f"{TestNhlApi.BASE_URL}/random-endpoint", status=304)
+        sink = InMemorySink()
+        ttl = iter([0, 60])
+        api = NhlApi(
+            cache=MemoryCache(),
+            ttl_policy=lambda endpoint, response: next(ttl),
+            metrics=sink,
+        )
+        for _ in range(3):
+            api.get("random-endpoint")
+        for result in ("miss", "revalidated", "hit"):
+            assert sink.count("cache", endpoint="random-endpoint", result=result) == 1
+
+    @responses.activate
+    def test_get_can_skip_cache(self):
+        """
+        Tests that `NhlApi.get` neither reads nor fills the cache when told not to.
+        """
+        responses.get(f"{TestNhlApi.BASE_URL}/random-endpoint", json={"a": 1})
+        cache = MemoryCache()
+        api = NhlApi(cache=cache)
+        api.get("random-endpoint", use_cache=False)
+        api.get("random-endpoint", use_cache=False)
+        assert len(responses.calls) == 2
+        assert len(cache) == 0
+
+    @staticmethod
+    def _concurrently(callers: int, call) -> list:
+        """
+        Makes the same call from many threads at once, against an endpoint slow
+        enough for the calls to overlap.
+        """
+        started = threading.Barrier(callers)
+
+        def caller():
+            started.wait()
+            return call()
+
+        with ThreadPoolExecutor(callers) as executor:
+            return [
+                result for result in executor.map(lambda _: caller(), range(callers))
+            ]
+
+    @staticmethod
+    def _slow_endpoint(endpoint: str, data: dict) -> None:
+        def callback(request):
+            threading.Event().wait(0.05)
+            return 200, {}, json.dumps(data)
+
+        responses.add_callback(
+            responses.GET, f"{TestNhlApi.BASE_URL}/{endpoint}", callback=callback
+        )
+
+    @responses.activate
+    def test_get_coalesces_requests_in_flight(self):
+        """
+        Tests that concurrent `NhlApi.get` calls of the same endpoint send one
+        request, and share its `Response`.
+        """
+        self._slow_endpoint("random-endpoint", {"a": 1})
+        sink = InMemorySink()
+        api = NhlApi(metrics=sink)
+        results = self._concurrently(10, lambda: api.get("random-endpoint"))
+        assert len(responses.calls) == 1
+        assert all(result is results[0] for result in results)
+        assert sink.count("coalesced", endpoint="random-endpoint") == 9
+        # Nothing is kept once the request is over.
+        api.get("random-endpoint")
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_get_coalesces_only_calls_using_the_cache_alike(self):
+        """
+        Tests that a `NhlApi.get` call bypassing the cache does not share the
+        request of a call going through it, nor the other way around.
+        """
+        self._slow_endpoint("random-endpoint", {"a": 1})
+        api = NhlApi(cache=MemoryCache())
+        use_cache = [True, False]
+        results = self._concurrently(
+            2, lambda: api.get("random-endpoint", use_cache=use_cache.pop())
+        )
+        assert len(responses.calls) == 2
+        assert results[0] is not results[1]
+
+    @responses.activate
+    def test_get_without_single_flight(self):
+        self._slow_endpoint("random-endpoint", {"a": 1})
+        api = NhlApi(single_flight=False)
+        self._concurrently(5, lambda: api.get("random-endpoint"))
+        assert len(responses.calls) == 5
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "share_models", [False, True], ids=["own_models", "shared_models"]
+    )
+    def test_models_can_be_shared(self, share_models):
+        """
+        Tests that concurrent identical `NhlApi.game` calls share one request,
+        and the one model too if `share_models` is set.
+        """
+        self._slow_endpoint("game/1/feed/live", {"gameData": {"game": {"pk": 1}}})
+        api = NhlApi(share_models=share_models)
+        games = self._concurrently(5, lambda: api.game(1))
+        assert len(responses.calls) == 1
+        assert all(game == Game(pk=1) for game in games)
+        assert len({id(game) for game in games}) == (1 if share_models else 5)
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "share_models", [False, True], ids=["own_models", "shared_models"]
+    )
+    def test_plays_can_be_shared(self, share_models):
+        """
+        Tests that concurrent identical `NhlApi.plays` calls share the one list
+        of plays if `share_models` is set.
+        """
+        feed = {"liveData": {"plays": {"allPlays": [{}], "scoringPlays": [0]}}}
+        self._slow_endpoint("game/1/feed/live", feed)
+        api = NhlApi(share_models=share_models)
+        plays = self._concurrently(5, lambda: api.plays(1, scoring_plays_only=True))
+        assert len(responses.calls) == 1
+        assert all(len(found) == 1 for found in plays)
+        assert len({id(found) for found in plays}) == (1 if share_models else 5)
+
+    @responses.activate
+    def test_get_refetches_expired(self):
+        """
+        Tests that `NhlApi.get` sends the request again once the response expired.
+        """
+        responses.get(f"{TestNhlApi.BASE_URL}/random-endpoint", json={"a": 1})
+        api = NhlApi(cache=MemoryCache(), ttl_policy=lambda endpoint, response: 0)
+        api.get("random-endpoint")
+        api.get("random-endpoint")
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "resp_headers, expected_headers",
+        [
+            ({"ETag": '"v1"'}, {"If-None-Match": '"v1"'}),
+            (
+                {"Last-Modified": "Sat, 01 Jan 2000 00:00:00 GMT"},
+                {"If-Modified-Since": "Sat, 01 Jan 2000 00:00:00 GMT"},
+            ),
+        ],
+        ids=["etag", "last_modified"],
+    )
+    def test_get_revalidates_expired(self, resp_headers, expected_headers):
+        """
+        Tests that `NhlApi.get` revalidates expired responses and reuses the cached
+        response when the server answers 304 Not Modified.
+        """
+        url = f"{TestNhlApi.BASE_URL}/random-endpoint"
+        responses.get(url, json={"a": 1}, headers=resp_headers)
+        api = NhlApi(cache=MemoryCache(), ttl_policy=lambda endpoint, response: 0)
+        first = api.get("random-endpoint")
+        responses.replace(
+            responses.GET,
+            url,
+            status=304,
+            match=[matchers.header_matcher(expected_headers)],
+        )
+        second = api.get("random-endpoint")
+        assert second is first
+        assert second.data == {"a": 1}
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_get_replaces_modified(self):
+        """
+        Tests that `NhlApi.get` caches the new response when the data changed.
+        """
+        url = f"{TestNhlApi.BASE_URL}/random-endpoint"
+        responses.get(url, json={"a": 1}, headers={"ETag": '"v1"'})
+        cache = MemoryCache()
+        api = NhlApi(cache=cache, ttl_policy=lambda endpoint, response: 0)
+        api.get("random-endpoint")
+        responses.replace(responses.GET, url, json={"a": 2}, headers={"ETag": '"v2"'})
+        assert api.get("random-endpoint").data == {"a": 2}
+        assert cache.get("random-endpoint").response.etag == '"v2"'
+
+    @responses.activate
+    @pytest.mark.parametrize("status", [300, 404])
+    def test_get_does_not_cache_unsuccessful(self, status):
+        """
+        Tests that `NhlApi.get` only caches successful responses.
+        """
+        responses.get(f"{TestNhlApi.BASE_URL}/random-endpoint", status=status)
+        cache = MemoryCache()
+        with pytest.raises(ResponseError) if status >= 400 else nullcontext():
+            NhlApi(cache=cache).get("random-endpoint")
+        assert len(cache) == 0
+
     @responses.activate
     @pytest.mark.parametrize("expected_status", [200, 300, 400, 500])
     def test_get_json_is_available(self, expected_status):
@@ -37,6 +317,7 @@ class TestNhlApi:
             with pytest.raises(ResponseError) as error:
                 NhlApi().get("random-endpoint")
             assert error.match(f"GET method returns HTTP status code {expected_status}")
+            assert error.value.status_code == expected_status
 
     @responses.activate
     @pytest.mark.parametrize("expected_status", [200, 300, 400, 500])
@@ -57,6 +338,61 @@ class TestNhlApi:
                 NhlApi().get("random-endpoint")
             assert error.match(f"GET method returns HTTP status code {expected_status}")
 
+    @responses.activate(registry=registries.OrderedRegistry)
+    @pytest.mark.parametrize(
+        "headers, min_delay",
+        [({}, 0), ({"Retry-After": "2"}, 2)],
+        ids=["backoff", "retry-after"],
+    )
+    def test_get_retries_retryable_status(self, headers, min_delay):
+        """
+        Tests that `NhlApi.get` sends the request again after a retryable status,
+        waiting for as long as the server asked.
+        """
+        url = f"{TestNhlApi.BASE_URL}/game/2017020001/feed/live"
+        responses.get(url, status=429, headers=headers)
+        responses.get(url, status=200, json={"a": 1})
+        sink = InMemorySink()
+        with patch("nhl_api_py.core.api.sleep") as sleep:
+            response = NhlApi(metrics=sink).get("game/2017020001/feed/live")
+        assert response.data == {"a": 1} and len(responses.calls) == 2
+        assert min_delay <= sleep.call_args.args[0] <= min_delay + 0.5
+        tags = {"endpoint": "game/{id}/feed/live"}
+        assert sink.count("retries", **tags, status="429") == 1
+        assert sink.count("responses", **tags, status="200") == 1
+
+    @responses.activate
+    def test_get_gives_up_after_max_retries(self):
+        """
+        Tests that `NhlApi.get` raises once the retries are exhausted.
+        """
+        responses.get(f"{TestNhlApi.BASE_URL}/random-endpoint", status=503)
+        with patch("nhl_api_py.core.api.sleep") as sleep:
+            with pytest.raises(ResponseError, match="503"):
+                NhlApi(retry=RetryPolicy(max_retries=2)).get("random-endpoint")
+        assert len(responses.calls) == 3 and sleep.call_count == 2
+
+    @responses.activate
+    def test_requests_are_throttled(self):
+        """
+        Tests that every request, retries included, goes through the shared rate
+        and concurrency limits.
+        """
+        url = f"{TestNhlApi.BASE_URL}/random-endpoint"
+        responses.get(url, status=502)
+        responses.get(url, json={})
+        rate_limiter = MagicMock(wraps=TokenBucket(rate=1000, burst=10))
+        concurrency = MagicMock(wraps=AdaptiveConcurrency(initial=4))
+        with patch("nhl_api_py.core.api.sleep"):
+            first = NhlApi(rate_limiter=rate_limiter, concurrency=concurrency)
+            second = NhlApi(rate_limiter=rate_limiter, concurrency=concurrency)
+            first.get("random-endpoint")
+            second.get("random-endpoint")
+        assert rate_limiter.acquire.call_count == 3
+        assert concurrency.acquire.call_count == 3
+        statuses = [call.args[1] for call in concurrency.release.call_args_list]
+        assert statuses == [502, 200, 200]
+
     @responses.activate
     @pytest.mark.parametrize(
         "status, error_raise",
@@ -136,12 +472,14 @@ class TestNhlApi:
             "team_with_unknown_key",
         ],
     )
+    @pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
     def test_game(
         self,
         status,
         status_error,
         resp_data,
         expected,
+        lazy,
     ):
         responses.get(
             f"{TestNhlApi.BASE_URL}/game/2017020001/feed/live",
@@ -149,8 +487,9 @@ class TestNhlApi:
             json=resp_data,
         )
         with status_error:
-            result = NhlApi().game(game_id=2017020001)
+            result = NhlApi().game(game_id=2017020001, lazy=lazy)
             assert result == expected
+            assert isinstance(result, LazyGame) is lazy
 
     @responses.activate
     @pytest.mark.parametrize(
@@ -210,6 +549,7 @@ class TestNhlApi:
         "scoring_plays_only, penalty_plays_only, resp_data, expected",
         [
             (False, False, {"liveData": {"plays": dict()}}, []),
+            (True, True, {"liveData": {"plays": {"scoringPlays": [0]}}}, []),
             (
                 False,
                 False,
@@ -295,6 +635,7 @@ class TestNhlApi:
         ],
         ids=[
             "play_data_missing",
+            "play_data_missing_with_indexes",
             "play_data_empty",
             "get_all_plays",
             "get_penalty_plays",
@@ -324,6 +665,195 @@ class TestNhlApi:
             )
             assert result == expected
 
+    @responses.activate
+    @pytest.mark.parametrize(
+        "method, kwargs, endpoint, resp_data",
+        [
+            ("teams", {}, "teams", {"teams": [{"id": 1, "teamName": "Team 1"}]}),
+            (
+                "game",
+                {"game_id": 1},
+                "game/1/feed/live",
+                {"gameData": {"game": {"pk": 1}, "status": {"detailedState": "x"}}},
+            ),
+            (
+                "boxscore",
+                {"game_id": 1},
+                "game/1/boxscore",
+                {"teams": {"away": {"team": {"id": 1}}}},
+            ),
+            ("schedule", {}, "schedule", {"dates": [{"date": "2000-01-01"}]}),
+        ],
+        ids=["teams", "game", "boxscore", "schedule"],
+    )
+    def test_decode_models(self, method, kwargs, endpoint, resp_data):
+        """
+        Tests that with `decode_models`, models are decoded straight from the
+        response bodies, without decoding them into dictionaries, and equal the
+        models built from dictionaries.
+        """
+        pytest.importorskip("msgspec")
+        responses.get(f"{TestNhlApi.BASE_URL}/{endpoint}", json=resp_data)
+        decoded = []
+
+        def decoder(content):
+            decoded.append(content)
+            return json.loads(content)
+
+        api = NhlApi(decoder=decoder, decode_models=True)
+        result = getattr(api, method)(**kwargs)
+        assert decoded == []
+        assert result == getattr(NhlApi(), method)(**kwargs)
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "method, kwargs, endpoint",
+        [
+            ("teams", {}, "teams"),
+            ("game", {"game_id": 1}, "game/1/feed/live"),
+            ("boxscore", {"game_id": 1}, "game/1/boxscore"),
+            ("schedule", {}, "schedule"),
+        ],
+        ids=["teams", "game", "boxscore", "schedule"],
+    )
+    def test_decode_models_of_invalid_json(self, method, kwargs, endpoint):
+        """
+        Tests that with `decode_models`, a body which is not valid JSON gives the
+        same empty result as without it.
+        """
+        responses.get(f"{TestNhlApi.BASE_URL}/{endpoint}", body="<html>")
+        result = getattr(NhlApi(decode_models=True), method)(**kwargs)
+        assert result == getattr(NhlApi(), method)(**kwargs)
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "method, endpoint, resp_data",
+        [
+            ("teams", "teams", {"teams": [{"id": 1, "name": "Team 1"}]}),
+            (
+                "plays",
+                "game/2017020001/feed/live",
+                {"liveData": {"plays": {"allPlays": [{"result": {"event": "e"}}]}}},
+            ),
+            ("schedule", "schedule", {"dates": [{"date": "2000-01-01"}]}),
+        ],
+        ids=["teams", "plays", "schedule"],
+    )
+    def test_as_dataframe(self, method, endpoint, resp_data):
+        responses.get(f"{TestNhlApi.BASE_URL}/{endpoint}", json=resp_data)
+        kwargs = {"game_id": 2017020001} if method == "plays" else {}
+        api = NhlApi()
+        result = getattr(api, method)(as_dataframe=True, **kwargs)
+        models = getattr(api, method)(**kwargs)
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == len(models) == 1
+
+    @responses.activate
+    def test_plays_missing_as_dataframe(self):
+        responses.get(
+            f"{TestNhlApi.BASE_URL}/game/1/feed/live",
+            json={"liveData": {"plays": {"scoringPlays": [0]}}},
+        )
+        df = NhlApi().plays(1, scoring_plays_only=True, as_dataframe=True)
+        assert isinstance(df, pd.DataFrame) and df.empty
+
+    @responses.activate
+    def test_stream_plays(self):
+        responses.get(
+            f"{TestNhlApi.BASE_URL}/game/2017020001/feed/live",
+            json={"liveData": {"plays": {"allPlays": [{"result": {"event": "e"}}]}}},
+        )
+        plays = NhlApi().stream_plays(game_id=2017020001)
+        assert len(responses.calls) == 0
+        assert list(plays) == [Play(event="e")]
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    @pytest.mark.parametrize("status", [200, 404], ids=["streamed", "error"])
+    def test_stream_plays_holds_a_concurrency_slot(self, status):
+        responses.get(
+            f"{TestNhlApi.BASE_URL}/game/2017020001/feed/live",
+            status=status,
+            json={"liveData": {"plays": {"allPlays": [{}, {}]}}},
+        )
+        concurrency = AdaptiveConcurrency(initial=2)
+        plays = NhlApi(concurrency=concurrency).stream_plays(game_id=2017020001)
+        if status == 200:
+            next(plays)
+            assert concurrency.in_flight == 1
+            plays.close()
+        else:
+            with pytest.raises(ResponseError):
+                next(plays)
+        assert concurrency.in_flight == 0
+
+    @responses.activate
+    def test_stream_plays_error(self):
+        responses.get(f"{TestNhlApi.BASE_URL}/game/2017020001/feed/live", status=404)
+        with pytest.raises(ResponseError):
+            list(NhlApi().stream_plays(game_id=2017020001))
+
+    @responses.activate
+    def test_play_columns(self):
+        responses.get(
+            f"{TestNhlApi.BASE_URL}/game/2017020001/feed/live",
+            json={
+                "gamePk": 2017020001,
+                "liveData": {
+                    "plays": {"allPlays": [{"about": {"eventIdx": 0, "period": 1}}]}
+                },
+            },
+        )
+        result = NhlApi().play_columns(game_id=2017020001)
+        assert len(result) == 1
+        assert result["game_pk"][0] == 2017020001 and result["period"][0] == 1
+        assert len(NhlApi().play_columns(game_id=2017020001, query=Period(2))) == 0
+
+    @responses.activate
+    @pytest.mark.parametrize("ordered", [True, False], ids=["ordered", "unordered"])
+    @pytest.mark.parametrize(
+        "method, endpoint, resp_data, expected",
+        [
+            (
+                "games",
+                "feed/live",
+                {"gameData": {"game": {"pk": 1}}},
+                Game(pk=1),
+            ),
+            (
+                "boxscores",
+                "boxscore",
+                {"teams": {"away": {"team": {"id": 1}}}},
+                Boxscore(away_team=Team(id=1)),
+            ),
+            (
+                "plays_many",
+                "feed/live",
+                {"liveData": {"plays": {"allPlays": [{"result": {"event": "e"}}]}}},
+                [Play(event="e")],
+            ),
+        ],
+        ids=["games", "boxscores", "plays_many"],
+    )
+    def test_bulk_methods(self, ordered, method, endpoint, resp_data, expected):
+        game_ids = [2017020001, 2017020002, 2017020003]
+        for game_id in game_ids:
+            responses.get(
+                f"{TestNhlApi.BASE_URL}/game/{game_id}/{endpoint}",
+                status=500 if game_id == 2017020002 else 200,
+                json=resp_data,
+            )
+        results = list(
+            getattr(NhlApi(max_retries=0), method)(game_ids, ordered=ordered)
+        )
+        if ordered:
+            assert [result.key for result in results] == game_ids
+        results = {result.key: result for result in results}
+        assert results[2017020001].value == expected
+        assert results[2017020003].value == expected
+        assert isinstance(results[2017020002].error, ResponseError)
+        assert results[2017020002].value is None
+
     @responses.activate
     @pytest.mark.parametrize(
         "resp_data, expected",
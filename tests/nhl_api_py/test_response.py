@@ -1,6 +1,8 @@
 """
 Tests the `nhl_api.core.response` module.
 """
+import json
+
 import pytest
 import requests
 import responses
@@ -29,7 +31,9 @@ class TestResponse:
         is passed.
         """
         responses.get(
-            "https://statsapi.web.nhl.com/api/v1/random-endpoint", json={"msg": "NHL"}
+            "https://statsapi.web.nhl.com/api/v1/random-endpoint",
+            json={"msg": "NHL"},
+            headers={"ETag": '"abc"'},
         )
         resp = requests.get(
             "https://statsapi.web.nhl.com/api/v1/random-endpoint", timeout=10
@@ -37,3 +41,70 @@ class TestResponse:
         result = Response.from_requests(resp)
         assert result.status_code == 200
         assert result.data == {"msg": "NHL"}
+        assert result.headers["etag"] == '"abc"'
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "body, expected",
+        [(b'{"msg": "NHL"}', {"msg": "NHL"}), (b"", {}), (b"<html>", {})],
+        ids=["json", "empty", "not_json"],
+    )
+    @pytest.mark.parametrize("decoder", [None, json.loads], ids=["default", "stdlib"])
+    def test_from_requests_decodes_body(self, body, expected, decoder):
+        """
+        Tests `Response.from_requests` decodes the raw body, or falls back to an
+        empty dictionary when it is not JSON.
+        """
+        responses.get("https://statsapi.web.nhl.com/api/v1/random-endpoint", body=body)
+        resp = requests.get(
+            "https://statsapi.web.nhl.com/api/v1/random-endpoint", timeout=10
+        )
+        assert Response.from_requests(resp, decoder=decoder).data == expected
+
+    @responses.activate
+    def test_from_requests_lazy(self):
+        """
+        Tests that a lazy `Response` keeps the raw body, and only decodes it once
+        its data is first read.
+        """
+        responses.get(
+            "https://statsapi.web.nhl.com/api/v1/random-endpoint", body=b'{"a": 1}'
+        )
+        resp = requests.get(
+            "https://statsapi.web.nhl.com/api/v1/random-endpoint", timeout=10
+        )
+        calls = []
+
+        def decoder(content):
+            calls.append(content)
+            return json.loads(content)
+
+        result = Response.from_requests(resp, decoder=decoder, lazy=True)
+        assert result.content == b'{"a": 1}' and calls == []
+        assert result.data == {"a": 1} and result.data == {"a": 1}
+        assert calls == [b'{"a": 1}']
+
+    @pytest.mark.parametrize(
+        "headers, expected",
+        [
+            (None, {}),
+            ({"etag": '"abc"'}, {"If-None-Match": '"abc"'}),
+            (
+                {"last-modified": "Sat, 01 Jan 2000 00:00:00 GMT"},
+                {"If-Modified-Since": "Sat, 01 Jan 2000 00:00:00 GMT"},
+            ),
+            (
+                {"ETag": '"abc"', "Last-Modified": "Sat, 01 Jan 2000 00:00:00 GMT"},
+                {
+                    "If-None-Match": '"abc"',
+                    "If-Modified-Since": "Sat, 01 Jan 2000 00:00:00 GMT",
+                },
+            ),
+        ],
+        ids=["no_validators", "etag", "last_modified", "both"],
+    )
+    def test_conditional_headers(self, headers, expected):
+        """
+        Tests `Response.conditional_headers` builds headers from the validators.
+        """
+        assert Response(200, {}, headers).conditional_headers() == expected
@@ -0,0 +1,62 @@
+"""
+Tests the `nhl_api.core.session` module.
+"""
+import pytest
+import requests
+import responses
+from responses import registries
+
+from nhl_api_py.core.session import create_session
+
+
+class TestCreateSession:
+    """
+    Tests the `create_session` function.
+    """
+
+    URL = "https://statsapi.web.nhl.com/api/v1/random-endpoint"
+
+    @pytest.mark.parametrize("scheme", ["http://", "https://"])
+    def test_adapter_is_pooled(self, scheme):
+        session = create_session(pool_connections=2, pool_maxsize=7, pool_block=True)
+        adapter = session.get_adapter(f"{scheme}statsapi.web.nhl.com")
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 7
+        assert adapter._pool_block is True
+        assert session.headers["Connection"] == "keep-alive"
+
+    @responses.activate(registry=registries.OrderedRegistry)
+    @pytest.mark.parametrize("retry_status", [429, 502, 503, 504])
+    def test_retries_retryable_status(self, retry_status):
+        responses.get(TestCreateSession.URL, status=retry_status)
+        responses.get(TestCreateSession.URL, status=200, json={"msg": "NHL"})
+        session = create_session(max_retries=1, backoff_factor=0)
+        resp = session.get(TestCreateSession.URL, timeout=10)
+        assert resp.status_code == 200 and resp.json() == {"msg": "NHL"}
+
+    @responses.activate(registry=registries.OrderedRegistry)
+    def test_returns_last_response_when_retries_exhausted(self):
+        responses.get(TestCreateSession.URL, status=503)
+        responses.get(TestCreateSession.URL, status=503)
+        session = create_session(max_retries=1, backoff_factor=0)
+        resp = session.get(TestCreateSession.URL, timeout=10)
+        assert resp.status_code == 503
+
+    @responses.activate
+    def test_retry_status_codes(self):
+        responses.get(TestCreateSession.URL, status=503)
+        session = create_session(max_retries=3, backoff_factor=0, retry_status_codes=())
+        resp = session.get(TestCreateSession.URL, timeout=10)
+        assert resp.status_code == 503
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_does_not_retry_client_errors(self):
+        responses.get(TestCreateSession.URL, status=404)
+        session = create_session(max_retries=3, backoff_factor=0)
+        resp = session.get(TestCreateSession.URL, timeout=10)
+        assert resp.status_code == 404
+        assert len(responses.calls) == 1
+
+    def test_returns_requests_session(self):
+        assert isinstance(create_session(), requests.Session)
@@ -0,0 +1,108 @@
+"""
+Tests the `nhl_api.core.singleflight` module.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nhl_api_py.core.error_exceptions import ResponseError
+from nhl_api_py.core.singleflight import SingleFlight
+
+
+def _concurrently(callers: int, call) -> list:
+    """
+    Starts all calls together, and waits until the first one is in flight before
+    releasing it, so every other call finds it in flight.
+
+    :param callers: the number of concurrent callers
+    :param call: the call each caller makes, given an event set once all
+        callers started
+    :return: the results (or errors) of each caller
+    """
+    started = threading.Barrier(callers + 1)
+    release = threading.Event()
+
+    def caller():
+        started.wait()
+        try:
+            return call(release)
+        except Exception as error:
+            return error
+
+    with ThreadPoolExecutor(callers) as executor:
+        futures = [executor.submit(caller) for _ in range(callers)]
+        started.wait()
+        # Give every caller time to find the call in flight.
+        threading.Event().wait(0.05)
+        release.set()
+        return [future.result() for future in futures]
+
+
+class TestSingleFlight:
+    """
+    Tests the `SingleFlight` class.
+    """
+
+    def test_duplicate_calls_share_one_result(self):
+        flight, calls = SingleFlight(), []
+
+        def work(release):
+            calls.append(1)
+            release.wait()
+            return object()
+
+        results = _concurrently(
+            20, lambda release: flight.do("a", lambda: work(release))
+        )
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert len(flight) == 0
+
+    def test_call_tells_shared_results(self):
+        flight = SingleFlight()
+        results = _concurrently(
+            5, lambda release: flight.call("a", lambda: release.wait() and "a")
+        )
+        assert sorted(shared for value, shared in results) == [False] + [True] * 4
+        assert flight.call("a", lambda: "b") == ("b", False)
+
+    def test_errors_are_shared(self):
+        flight, calls = SingleFlight(), []
+
+        def fail(release):
+            calls.append(1)
+            release.wait()
+            raise ResponseError("upstream failed")
+
+        results = _concurrently(
+            5, lambda release: flight.do("a", lambda: fail(release))
+        )
+        assert len(calls) == 1
+        assert all(isinstance(result, ResponseError) for result in results)
+        # The failed call is forgotten, so the next call runs again.
+        assert flight.do("a", lambda: 2) == 2
+
+    def test_keys_are_independent(self):
+        flight = SingleFlight()
+        keys = iter(range(10))
+        lock = threading.Lock()
+
+        def call(release):
+            with lock:
+                key = next(keys)
+            return flight.do(key, lambda: release.wait() and key)
+
+        assert sorted(_concurrently(10, call)) == list(range(10))
+
+    def test_results_are_not_kept(self):
+        flight = SingleFlight()
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("a", lambda: 2) == 2
+
+    def test_leader_error_is_raised(self):
+        def fail():
+            raise ResponseError("upstream failed")
+
+        with pytest.raises(ResponseError):
+            SingleFlight().do("a", fail)
@@ -0,0 +1,69 @@
+"""
+Tests the `nhl_api.core.streaming` module.
+"""
+import gzip
+import json
+
+import pytest
+import requests
+import responses
+
+from nhl_api_py.core import streaming
+
+URL = "https://statsapi.web.nhl.com/api/v1/game/2017020001/feed/live"
+FEED = {
+    "gamePk": 2017020001,
+    "liveData": {
+        "plays": {
+            "allPlays": [
+                {"result": {"event": "Faceoff"}, "coordinates": {"x": 0.5}},
+                {"result": {"event": "Goal"}, "about": {"period": 3}},
+            ]
+        }
+    },
+}
+
+
+@pytest.fixture(params=["ijson", "fallback"])
+def parser(request, monkeypatch):
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(streaming, "ijson", None)
+    return request.param
+
+
+class TestIterItems:
+    """
+    Tests the `nhl_api_py.core.streaming.iter_items` function.
+    """
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("liveData.plays.allPlays", FEED["liveData"]["plays"]["allPlays"]),
+            ("liveData.plays.scoringPlays", []),
+            ("gamePk", []),
+        ],
+        ids=["array", "missing_array", "not_an_array"],
+    )
+    def test_iter_items(self, parser, path, expected):
+        responses.get(URL, json=FEED)
+        response = requests.get(URL, stream=True, timeout=10)
+        result = list(streaming.iter_items(response, path))
+        assert result == expected
+        assert all(
+            type(x) is float for r in result for x in r.get("coordinates", {}).values()
+        )
+
+    @responses.activate
+    def test_iter_items_compressed(self, parser):
+        responses.get(
+            URL,
+            body=gzip.compress(json.dumps(FEED).encode()),
+            headers={"Content-Encoding": "gzip"},
+        )
+        response = requests.get(URL, stream=True, timeout=10)
+        result = list(streaming.iter_items(response, "liveData.plays.allPlays"))
+        assert result == FEED["liveData"]["plays"]["allPlays"]
@@ -0,0 +1,189 @@
+"""
+Tests the `nhl_api.core.throttle` module.
+"""
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+
+from nhl_api_py.core.throttle import (
+    AdaptiveConcurrency,
+    RetryPolicy,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """
+    Stands in for `monotonic` and `sleep`, so time only moves when slept.
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch("nhl_api_py.core.throttle.monotonic", clock.monotonic), patch(
+        "nhl_api_py.core.throttle.sleep", clock.sleep
+    ):
+        yield clock
+
+
+class TestTokenBucket:
+    """
+    Tests the `TokenBucket` class.
+    """
+
+    def test_burst_is_not_delayed(self, clock):
+        bucket = TokenBucket(rate=2, burst=3)
+        assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+        assert clock.now == 1000
+
+    def test_waits_at_the_rate_once_empty(self, clock):
+        bucket = TokenBucket(rate=4, burst=1)
+        waits = [bucket.acquire() for _ in range(5)]
+        assert waits == [0, 0.25, 0.25, 0.25, 0.25]
+        assert clock.now == 1001
+
+    def test_refills_up_to_the_burst(self, clock):
+        bucket = TokenBucket(rate=10, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 60
+        assert [bucket.acquire() for _ in range(3)] == [0, 0, 0.1]
+
+    def test_reserves_in_order(self, clock):
+        bucket = TokenBucket(rate=1, burst=1)
+        assert [bucket.reserve() for _ in range(3)] == [0, 1, 2]
+
+    @pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+    def test_invalid(self, rate, burst):
+        with pytest.raises(ValueError):
+            TokenBucket(rate, burst)
+
+
+class TestAdaptiveConcurrency:
+    """
+    Tests the `AdaptiveConcurrency` class.
+    """
+
+    def test_increases_additively(self, clock):
+        limiter = AdaptiveConcurrency(initial=2, maximum=3)
+        for _ in range(4):
+            limiter.acquire()
+            limiter.release(0.1, 200)
+        assert limiter.limit == 3
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(0.1, 200)
+        assert limiter.limit == 3
+
+    @pytest.mark.parametrize("status_code", [429, 500, 503, None])
+    def test_decreases_multiplicatively_on_errors(self, clock, status_code):
+        limiter = AdaptiveConcurrency(initial=8, minimum=3)
+        limiter.acquire()
+        limiter.release(0.1, status_code)
+        assert limiter.limit == 4
+        clock.now += 1
+        limiter.acquire()
+        limiter.release(0.1, status_code)
+        assert limiter.limit == 3
+
+    def test_decreases_on_high_latency(self, clock):
+        limiter = AdaptiveConcurrency(initial=8, latency_target=0.5)
+        limiter.acquire()
+        limiter.release(0.6, 200)
+        assert limiter.limit == 4
+
+    def test_client_errors_keep_the_limit(self, clock):
+        limiter = AdaptiveConcurrency(initial=8)
+        limiter.acquire()
+        limiter.release(0.1, 404)
+        assert limiter.limit == 8 and limiter.in_flight == 0
+
+    def test_decreases_once_per_round_trip(self, clock):
+        limiter = AdaptiveConcurrency(initial=16)
+        for _ in range(4):
+            limiter.acquire()
+        for _ in range(4):
+            limiter.release(0.5, 503)
+        assert limiter.limit == 8
+        clock.now += 0.5
+        limiter.acquire()
+        limiter.release(0.5, 503)
+        assert limiter.limit == 4
+
+    def test_blocks_at_the_limit(self):
+        limiter = AdaptiveConcurrency(initial=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        assert not acquired.wait(0.05)
+        limiter.release(0.01, 200)
+        assert acquired.wait(1)
+        thread.join()
+        assert limiter.in_flight == 1
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrency(initial=5, maximum=4)
+
+
+class TestRetryPolicy:
+    """
+    Tests the `RetryPolicy` class and the `parse_retry_after` function.
+    """
+
+    @pytest.mark.parametrize("status_code", [200, 404, 500])
+    def test_does_not_retry(self, status_code):
+        assert RetryPolicy().backoff(0, status_code) is None
+
+    def test_stops_after_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+        assert policy.backoff(1, 503) is not None
+        assert policy.backoff(2, 503) is None
+
+    @pytest.mark.parametrize("attempt", [0, 1, 2, 3])
+    def test_jittered_exponential_backoff(self, attempt):
+        policy = RetryPolicy(max_retries=5, backoff_factor=0.5, max_backoff=2)
+        with patch("random.uniform", side_effect=lambda low, high: high):
+            assert policy.backoff(attempt, 502) == min(2, 0.5 * 2**attempt)
+        with patch("random.uniform", side_effect=lambda low, high: low):
+            assert policy.backoff(attempt, 502) == 0
+
+    def test_honors_retry_after(self):
+        policy = RetryPolicy(backoff_factor=0.5)
+        assert 3 <= policy.backoff(0, 429, "3") <= 3.5
+
+    def test_does_not_wait_longer_than_max_backoff(self):
+        assert RetryPolicy(max_backoff=60).backoff(0, 429, "3600") is None
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("120", 120), (" 5 ", 5), (None, None), ("", None), ("soon", None)],
+    )
+    def test_parse_retry_after_seconds(self, value, expected):
+        assert parse_retry_after(value) == expected
+
+    def test_parse_retry_after_date(self):
+        date = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert 28 <= parse_retry_after(format_datetime(date, usegmt=True)) <= 30
+        past = datetime.now(timezone.utc) - timedelta(seconds=30)
+        assert parse_retry_after(format_datetime(past, usegmt=True)) == 0
@@ -1,6 +1,10 @@
 import pytest
 
-from nhl_api_py.core.utils import camel_to_snake_case, convert_keys_to_snake_case
+from nhl_api_py.core.utils import (
+    SnakeCaseDict,
+    camel_to_snake_case,
+    convert_keys_to_snake_case,
+)
 
 
 @pytest.mark.parametrize(
@@ -30,9 +34,54 @@ def test_camel_to_snake_case(test_value, expected):
             {"hiThere": {"nestedHiThere": None, "nested_fine": None}},
             {"hi_there": {"nested_hi_there": None, "nested_fine": None}},
         ),
+        (
+            {"allPlays": [{"playerType": 1}, [{"eventIdx": 2}], 3, None]},
+            {"all_plays": [{"player_type": 1}, [{"event_idx": 2}], 3, None]},
+        ),
+        (
+            {"aKey": {"bKey": [{"cKey": {"dKey": []}}]}},
+            {"a_key": {"b_key": [{"c_key": {"d_key": []}}]}},
+        ),
     ],
-    ids=["empty_dict", "normal_level", "nested_dict"],
+    ids=["empty_dict", "normal_level", "nested_dict", "nested_lists", "mixed"],
 )
 def test_convert_keys_to_snake_case(test_value, expected):
     result = convert_keys_to_snake_case(test_value)
     assert expected == result
+    assert list(expected) == list(result)
+
+
+def test_convert_keys_to_snake_case_marks_output():
+    data = {"topKey": {"nestedKey": [{"listKey": 1}]}}
+    result = convert_keys_to_snake_case(data)
+    assert isinstance(result, SnakeCaseDict)
+    assert isinstance(result["top_key"], SnakeCaseDict)
+    assert isinstance(result["top_key"]["nested_key"][0], SnakeCaseDict)
+    assert data == {"topKey": {"nestedKey": [{"listKey": 1}]}}
+
+
+def test_convert_keys_to_snake_case_skips_converted():
+    result = convert_keys_to_snake_case({"topKey": {"nestedKey": 1}})
+    assert convert_keys_to_snake_case(result) is result
+    assert convert_keys_to_snake_case(result["top_key"]) is result["top_key"]
+    wrapped = convert_keys_to_snake_case({"outerKey": result})
+    assert wrapped["outer_key"] is result
+
+
+def test_convert_keys_to_snake_case_deep_nesting():
+    data = {}
+    innermost = data
+    for _ in range(10_000):
+        innermost["childNode"] = [{}]
+        innermost = innermost["childNode"][0]
+    result = convert_keys_to_snake_case(data)
+    for _ in range(10_000):
+        result = result["child_node"][0]
+    assert result == {}
+
+
+def test_camel_to_snake_case_is_memoized():
+    camel_to_snake_case("memoizedKey")
+    hits = camel_to_snake_case.cache_info().hits
+    assert camel_to_snake_case("memoizedKey") == "memoized_key"
+    assert camel_to_snake_case.cache_info().hits == hits + 1
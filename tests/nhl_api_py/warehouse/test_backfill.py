@@ -0,0 +1,170 @@
+"""
+Tests the `nhl_api.warehouse.backfill` module.
+"""
+import re
+
+import pytest
+import responses
+
+from nhl_api_py.core.api import NhlApi
+from nhl_api_py.warehouse.backfill import Backfill, content_hash, main
+from nhl_api_py.warehouse.sqlite import SqliteWarehouse
+
+BASE_URL = "https://statsapi.web.nhl.com/api/v1"
+FINAL, LIVE, PREVIEW = 2022020001, 2022020002, 2022020003
+STATES = {
+    FINAL: ("Final", "Final"),
+    LIVE: ("Live", "In Progress"),
+    PREVIEW: ("Preview", "Scheduled"),
+}
+
+
+def _status(game_pk: int) -> dict:
+    abstract, detailed = STATES[game_pk]
+    return {"abstractGameState": abstract, "detailedState": detailed}
+
+
+def _mock_api(plays: int = 1, failing: tuple = ()) -> None:
+    """
+    Mocks the schedule of a season, and the feed and boxscore of its games.
+
+    :param plays: the number of plays of each game
+    :param failing: the IDs of the games whose feed cannot be retrieved
+    """
+    games = [{"gamePk": pk, "status": _status(pk)} for pk in STATES]
+    responses.get(
+        re.compile(f"{BASE_URL}/schedule.*"),
+        json={"dates": [{"date": "2022-10-07", "games": games}]},
+    )
+    for pk in STATES:
+        responses.get(
+            f"{BASE_URL}/game/{pk}/feed/live",
+            status=404 if pk in failing else 200,
+            json={
+                "gameData": {"game": {"pk": pk}, "status": _status(pk)},
+                "liveData": {
+                    "plays": {"allPlays": [{"result": {"event": "Shot"}}] * plays}
+                },
+            },
+        )
+        responses.get(
+            f"{BASE_URL}/game/{pk}/boxscore",
+            json={"teams": {"away": {"team": {"id": 1}}, "home": {"team": {"id": 2}}}},
+        )
+
+
+def _requested(endpoint: str) -> list[str]:
+    return [
+        call.request.url for call in responses.calls if endpoint in call.request.url
+    ]
+
+
+@pytest.fixture
+def warehouse():
+    with SqliteWarehouse(batch_size=2) as warehouse:
+        yield warehouse
+
+
+def test_content_hash_is_canonical():
+    assert content_hash({"a": 1, "b": [1.5, None]}, {}) == content_hash(
+        {"b": [1.5, None], "a": 1}, {}
+    )
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+    assert content_hash({"a": 1}) != content_hash({"a": 1}, {})
+
+
+class TestBackfill:
+    """
+    Tests the `Backfill` class.
+    """
+
+    @responses.activate
+    def test_first_run(self, warehouse):
+        _mock_api()
+        with NhlApi() as api:
+            report = Backfill(api, warehouse).season(2022)
+        assert (report.scheduled, report.up_to_date, report.not_started) == (3, 0, 1)
+        assert (report.fetched, report.written, report.failed) == (2, 2, {})
+        assert "season=20222023" in _requested("schedule")[0]
+        assert len(_requested("feed/live")) == len(_requested("boxscore")) == 2
+        checkpoints = warehouse.checkpoints([FINAL, LIVE, PREVIEW])
+        assert set(checkpoints) == {FINAL, LIVE}
+        assert checkpoints[FINAL].detailed_state == "Final"
+        assert checkpoints[LIVE].detailed_state == "In Progress"
+        stored = warehouse.game(FINAL)
+        assert len(stored.all_plays) == 1
+        assert checkpoints[FINAL].content_hash == content_hash(
+            NhlApi().get(f"game/{FINAL}/feed/live").data,
+            NhlApi().get(f"game/{FINAL}/boxscore").data,
+        )
+        assert warehouse.read_sql("SELECT * FROM boxscores")["game_pk"].tolist() == [
+            FINAL,
+            LIVE,
+        ]
+        # The schedule is stored too, including the games not started yet.
+        assert warehouse.game(PREVIEW).detailed_state == "Scheduled"
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "plays, written", [(1, 0), (2, 1)], ids=["unchanged", "changed"]
+    )
+    def test_rerun_only_fetches_games_not_final(self, warehouse, plays, written):
+        _mock_api()
+        with NhlApi() as api:
+            Backfill(api, warehouse).season(2022)
+        before = warehouse.checkpoints([LIVE])[LIVE]
+        responses.reset()
+        _mock_api(plays=plays)
+        with NhlApi() as api:
+            report = Backfill(api, warehouse).season(2022)
+        assert (report.up_to_date, report.fetched, report.written) == (1, 1, written)
+        assert _requested("feed/live") == [f"{BASE_URL}/game/{LIVE}/feed/live"]
+        after = warehouse.checkpoints([LIVE])[LIVE]
+        assert (before == after) is (written == 0)
+        assert len(warehouse.game(LIVE).all_plays) == plays
+
+    @responses.activate
+    def test_failed_games_are_not_checkpointed(self, warehouse):
+        _mock_api(failing=(LIVE,))
+        with NhlApi(max_retries=0) as api:
+            report = Backfill(api, warehouse).season(2022)
+        assert list(report.failed) == [LIVE]
+        assert (report.fetched, report.written) == (1, 1)
+        assert set(warehouse.checkpoints([FINAL, LIVE])) == {FINAL}
+        assert warehouse.game(LIVE).all_plays is None
+
+        responses.reset()
+        _mock_api()
+        with NhlApi() as api:
+            report = Backfill(api, warehouse).season(2022)
+        assert (report.up_to_date, report.written, report.failed) == (1, 1, {})
+        assert set(warehouse.checkpoints([FINAL, LIVE])) == {FINAL, LIVE}
+
+    @responses.activate
+    def test_without_boxscores(self, warehouse):
+        _mock_api()
+        with NhlApi() as api:
+            report = Backfill(api, warehouse, boxscores=False).season(2022)
+        assert report.written == 2
+        assert _requested("boxscore") == []
+        assert warehouse.read_sql("SELECT * FROM boxscores").empty
+
+    @responses.activate
+    def test_run_many_seasons(self, warehouse):
+        _mock_api()
+        with NhlApi() as api:
+            report = Backfill(api, warehouse).run([2021, 2022], game_type="R")
+        # The mocked schedule is the same for both seasons.
+        assert (report.scheduled, report.up_to_date, report.written) == (6, 1, 2)
+        assert all("gameType=R" in url for url in _requested("schedule"))
+
+    @responses.activate
+    def test_main(self, tmp_path, capsys):
+        _mock_api()
+        database = tmp_path / "nhl.sqlite3"
+        report = main(["2022", "--database", str(database), "--rate", "100"])
+        assert report.written == 2
+        assert "2 written" in capsys.readouterr().out
+        with SqliteWarehouse(database) as warehouse:
+            assert set(warehouse.checkpoints([FINAL, LIVE])) == {FINAL, LIVE}
+            assert warehouse.checkpoints([FINAL])[FINAL].detailed_state == "Final"
@@ -0,0 +1,125 @@
+"""
+Tests the `nhl_api.warehouse.parquet` module.
+"""
+import pytest
+
+from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.models.schedule import ScheduleDate
+from nhl_api_py.models.team import Team
+from nhl_api_py.warehouse.tables import Checkpoint
+
+pytest.importorskip("pyarrow")
+
+from nhl_api_py.warehouse.parquet import ParquetWarehouse  # noqa: E402
+
+AWAY = Team(id=1, name="Team 1")
+PLAYS = [Play(event="Shot", event_type_id="SHOT", period=1, team=AWAY)] * 3
+GAME = Game(pk=2022020001, season="20222023", type="R", away=AWAY, all_plays=PLAYS)
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    return ParquetWarehouse(tmp_path / "dataset")
+
+
+class TestParquetWarehouse:
+    """
+    Tests the `ParquetWarehouse` class.
+    """
+
+    def test_layout(self, warehouse):
+        warehouse.write_games([GAME, Game(pk=2021020001, season="20212022")])
+        warehouse.write_boxscores([(GAME.pk, Boxscore(away_team=AWAY))])
+        files = sorted(
+            str(path.relative_to(warehouse.root))
+            for path in warehouse.root.rglob("*")
+            if path.is_file()
+        )
+        assert files == [
+            "boxscores/season=20222023/part-0.parquet",
+            "games/season=20212022/part-0.parquet",
+            "games/season=20222023/part-0.parquet",
+            "plays/season=20222023/game_pk=2022020001/part-0.parquet",
+            "teams/part-0.parquet",
+        ]
+
+    def test_read(self, warehouse):
+        warehouse.write_games([GAME])
+        plays = warehouse.read("plays")
+        assert plays["play_index"].tolist() == [0, 1, 2]
+        assert plays["game_pk"].tolist() == [GAME.pk] * 3
+        assert plays["season"].tolist() == ["20222023"] * 3
+        assert plays["team_id"].tolist() == [1] * 3
+        games = warehouse.read("games")
+        assert games[["pk", "season", "away_id"]].values.tolist() == [
+            [GAME.pk, "20222023", 1]
+        ]
+        assert warehouse.read("teams")["name"].tolist() == ["Team 1"]
+
+    def test_read_sorts_rows_by_key(self, warehouse):
+        teams = [Team(id=team_id) for team_id in range(12, 0, -1)]
+        warehouse.write_games(
+            [Game(pk=GAME.pk, season="20222023", all_plays=PLAYS * 4)]
+        )
+        warehouse.write_teams(teams)
+        assert warehouse.read("plays")["play_index"].tolist() == list(range(12))
+        assert warehouse.read("teams")["id"].tolist() == list(range(1, 13))
+
+    def test_read_filters(self, warehouse):
+        warehouse.write_games([GAME, Game(pk=2021020001, season="20212022")])
+        assert warehouse.read("games", season="20212022")["pk"].tolist() == [2021020001]
+        assert len(warehouse.read("plays", game_pk=GAME.pk)) == 3
+        assert len(warehouse.read("plays", game_pk=1)) == 0
+
+    def test_read_missing_table(self, warehouse):
+        result = warehouse.read("schedule")
+        assert len(result) == 0
+        assert list(result.columns) == ["date", "game_pk", "season"]
+
+    def test_upserts(self, warehouse):
+        warehouse.write_games([GAME])
+        warehouse.write_games([Game(pk=GAME.pk, detailed_state="Final")])
+        games = warehouse.read("games")
+        assert len(games) == 1
+        assert games.iloc[0]["detailed_state"] == "Final"
+        assert games.iloc[0]["type"] == "R"
+        # The plays of the game were replaced by none.
+        assert len(warehouse.read("plays")) == 0
+
+    def test_plays_are_replaced(self, warehouse):
+        warehouse.write_games([GAME])
+        warehouse.write_plays(GAME.pk, PLAYS[:1])
+        assert len(warehouse.read("plays")) == 1
+
+    def test_schedule(self, warehouse):
+        dates = [
+            ScheduleDate.from_dict({"date": "2022-10-12", "games": [{"gamePk": 1}]}),
+            ScheduleDate.from_dict(
+                {"date": "2022-10-13", "games": [{"gamePk": 2022020020}]}
+            ),
+        ]
+        warehouse.write_schedule(dates)
+        warehouse.write_schedule(dates)
+        assert warehouse.read("schedule")["date"].tolist() == [
+            "2022-10-12",
+            "2022-10-13",
+        ]
+
+    def test_checkpoints(self, warehouse):
+        assert warehouse.checkpoints([GAME.pk]) == {}
+        other = Game(pk=2021020001, season="20212022")
+        checkpoints = {
+            GAME.pk: Checkpoint(GAME.pk, "Final", "hash"),
+            other.pk: Checkpoint(other.pk, "In Progress", "other"),
+        }
+        warehouse.write_checkpointed(
+            [
+                (GAME, Boxscore(), checkpoints[GAME.pk]),
+                (other, None, checkpoints[other.pk]),
+            ]
+        )
+        assert warehouse.checkpoints([GAME.pk, other.pk, 1]) == checkpoints
+        assert warehouse.checkpoints([other.pk]) == {other.pk: checkpoints[other.pk]}
+        assert "checkpoints/season=20222023/part-0.parquet" in {
+            str(path.relative_to(warehouse.root)) for path in warehouse.root.rglob("*")
+        }
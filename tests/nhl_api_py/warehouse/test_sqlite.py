@@ -0,0 +1,223 @@
+"""
+Tests the `nhl_api.warehouse.sqlite` and `nhl_api.warehouse.base` modules.
+"""
+import threading
+
+import pytest
+
+from nhl_api_py.core.batch import BatchResult
+from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.models.schedule import ScheduleDate
+from nhl_api_py.models.team import Team
+from nhl_api_py.warehouse.sqlite import SqliteWarehouse
+from nhl_api_py.warehouse.tables import Checkpoint
+
+AWAY = Team(id=1, name="Team 1", link="/api/v1/teams/1")
+HOME = Team(id=2, name="Team 2", link="/api/v1/teams/2")
+PLAYS = [
+    Play(event="Faceoff", event_type_id="FACEOFF", period=1, team=HOME),
+    Play(
+        players=[{"player": {"id": 3}, "player_type": "Scorer"}],
+        event="Goal",
+        event_type_id="GOAL",
+        game_winning_goal=True,
+        penalty_minutes="2",
+        period=3,
+        period_time="12:34",
+        coordinates={"x": 80.0, "y": -3.0},
+        team=AWAY,
+    ),
+]
+GAME = Game(
+    pk=2022020001,
+    season="20222023",
+    type="R",
+    detailed_state="Final",
+    start_time_tbd=False,
+    away=AWAY,
+    home=HOME,
+    players={"id3": {"full_name": "Player 3"}},
+    all_plays=PLAYS,
+    scoring_plays=[1],
+    penalty_plays=[],
+)
+
+
+@pytest.fixture
+def warehouse():
+    with SqliteWarehouse(batch_size=2) as warehouse:
+        yield warehouse
+
+
+class TestSqliteWarehouse:
+    """
+    Tests the `SqliteWarehouse` class.
+    """
+
+    def test_game_round_trip(self, warehouse):
+        assert warehouse.write_games([GAME]) == 1
+        result = warehouse.game(GAME.pk)
+        assert warehouse.plays(GAME.pk) == result.all_plays
+        # Penalty minutes are stored as the integers the API sends.
+        assert result.all_plays[1].penalty_minutes == 2
+        result.all_plays[1].penalty_minutes = "2"
+        assert result == GAME
+
+    def test_missing_game(self, warehouse):
+        assert warehouse.game(1) is None
+        assert warehouse.plays(1) == []
+
+    def test_games_are_upserted(self, warehouse):
+        warehouse.write_games([GAME])
+        warehouse.write_games([Game(pk=GAME.pk, detailed_state="Postponed")])
+        (stored,) = warehouse.games()
+        assert stored.detailed_state == "Postponed"
+        # Values missing from the new row are kept.
+        assert stored.season == "20222023" and stored.away == AWAY
+
+    def test_plays_are_replaced(self, warehouse):
+        warehouse.write_games([GAME])
+        assert warehouse.write_plays(GAME.pk, PLAYS[1:]) == 1
+        assert [play.event for play in warehouse.plays(GAME.pk)] == ["Goal"]
+        warehouse.write_games([Game(pk=GAME.pk)])
+        assert warehouse.plays(GAME.pk) == []
+
+    def test_teams_are_merged(self, warehouse):
+        warehouse.write_teams([Team(id=1, name="Team 1", abbreviation="ONE")])
+        warehouse.write_games([GAME])
+        assert warehouse.teams() == [
+            Team(id=1, name="Team 1", link="/api/v1/teams/1", abbreviation="ONE"),
+            HOME,
+        ]
+        assert warehouse.teams([2]) == [HOME]
+
+    def test_games_filters(self, warehouse):
+        warehouse.write_games(
+            [
+                GAME,
+                Game(pk=2022030111, season="20222023", type="P"),
+                Game(pk=2021020001, season="20212022", type="R"),
+            ]
+        )
+        assert [game.pk for game in warehouse.games()] == [
+            2021020001,
+            2022020001,
+            2022030111,
+        ]
+        assert [game.pk for game in warehouse.games("20222023", "R")] == [GAME.pk]
+        assert warehouse.games()[0].all_plays is None
+
+    def test_boxscores(self, warehouse):
+        boxscore = Boxscore(away_team=AWAY, away_goalies=[30], officials=[{"a": 1}])
+        assert warehouse.write_boxscores([(GAME.pk, boxscore)]) == 1
+        row = warehouse.read_sql("SELECT * FROM boxscores").iloc[0]
+        assert row["game_pk"] == GAME.pk and row["away_team_id"] == 1
+        assert row["away_goalies"] == "[30]" and row["officials"] == '[{"a":1}]'
+        assert warehouse.teams() == [AWAY]
+
+    def test_checkpoints(self, warehouse):
+        checkpoint = Checkpoint(GAME.pk, "Final", "hash")
+        assert warehouse.write_checkpointed([(GAME, Boxscore(), checkpoint)]) == 1
+        assert warehouse.checkpoints([GAME.pk, 1]) == {GAME.pk: checkpoint}
+        assert warehouse.game(GAME.pk) is not None
+        assert len(warehouse.read_sql("SELECT * FROM boxscores")) == 1
+        updated = Checkpoint(GAME.pk, "Final", "other")
+        warehouse.write_checkpointed([(GAME, None, updated)])
+        assert warehouse.checkpoints([GAME.pk]) == {GAME.pk: updated}
+
+    def test_many_checkpoints(self, warehouse):
+        checkpoints = {pk: Checkpoint(pk, "Final", str(pk)) for pk in range(1, 1201)}
+        warehouse.write_checkpointed(
+            (Game(pk=pk), None, checkpoint) for pk, checkpoint in checkpoints.items()
+        )
+        assert warehouse.checkpoints(range(1, 1301)) == checkpoints
+
+    def test_schedule(self, warehouse):
+        warehouse.write_games([GAME])
+        date = ScheduleDate.from_dict(
+            {
+                "date": "2022-10-12",
+                "games": [
+                    {
+                        "gamePk": GAME.pk,
+                        "gameDate": "2022-10-12T23:00:00Z",
+                        "status": {"detailedState": "Final"},
+                        "teams": {"away": {"team": {"id": 1, "name": "Team 1"}}},
+                    },
+                    {"gamePk": 2022020002, "season": "20222023"},
+                ],
+            }
+        )
+        assert warehouse.write_schedule([date]) == 1
+        schedule = warehouse.read_sql("SELECT * FROM schedule ORDER BY game_pk")
+        assert schedule.values.tolist() == [
+            ["2022-10-12", GAME.pk],
+            ["2022-10-12", 2022020002],
+        ]
+        # The summary of a game does not remove its plays.
+        stored = warehouse.game(GAME.pk)
+        assert stored.date_time == "2022-10-12T23:00:00Z"
+        assert len(stored.all_plays) == 2
+        assert warehouse.write_schedule([date]) == 1
+        assert len(warehouse.read_sql("SELECT * FROM schedule")) == 2
+
+    def test_ingest(self, warehouse):
+        results = [
+            BatchResult(GAME.pk, value=GAME),
+            BatchResult(2022020002, error=ValueError("boom")),
+            BatchResult(2022020003, value=Boxscore(home_team=HOME)),
+            BatchResult(1, value=AWAY),
+            BatchResult("2022-10-12", value=ScheduleDate(date="2022-10-12")),
+        ]
+        assert warehouse.ingest(iter(results)) == 4
+        assert len(warehouse.plays(GAME.pk)) == 2
+        assert len(warehouse.read_sql("SELECT * FROM boxscores")) == 1
+        with pytest.raises(TypeError):
+            warehouse.ingest([BatchResult(1, value="game")])
+
+    def test_ingest_rejects_lists_of_plays(self, warehouse):
+        """
+        Tests that the scoring plays of a game, from `plays_many`, do not replace
+        all of its stored plays.
+        """
+        warehouse.write_games([GAME])
+        with pytest.raises(TypeError):
+            warehouse.ingest([BatchResult(GAME.pk, value=[PLAYS[1]])])
+        assert [play.event for play in warehouse.plays(GAME.pk)] == ["Faceoff", "Goal"]
+
+    def test_batches(self, warehouse):
+        games = [Game(pk=2022020000 + number) for number in range(1, 6)]
+        writes = []
+        write = warehouse._write
+        warehouse._write = lambda rows: writes.append(rows) or write(rows)
+        assert warehouse.write_games(games) == 5
+        assert len(writes) == 3
+        assert len(warehouse.games()) == 5
+
+    def test_game_without_pk_is_skipped(self, warehouse):
+        assert warehouse.write_games([Game(season="20222023")]) == 1
+        assert warehouse.games() == []
+
+    def test_file_is_reopened(self, tmp_path):
+        path = tmp_path / "nhl.sqlite3"
+        with SqliteWarehouse(path) as warehouse:
+            warehouse.write_games([GAME])
+        with SqliteWarehouse(path) as warehouse:
+            assert warehouse.game(GAME.pk).pk == GAME.pk
+
+    def test_indexes(self, warehouse):
+        plan = warehouse.read_sql(
+            "EXPLAIN QUERY PLAN SELECT * FROM plays WHERE event_type_id = ?", ["GOAL"]
+        )
+        assert "plays_event_type_id" in " ".join(plan["detail"])
+
+    def test_threads(self, warehouse):
+        def write(number):
+            warehouse.write_games([Game(pk=2022020000 + number, all_plays=PLAYS)])
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(warehouse.read_sql("SELECT * FROM plays")) == 16
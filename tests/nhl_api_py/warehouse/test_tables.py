@@ -0,0 +1,83 @@
+"""
+Tests the `nhl_api.warehouse.tables` module.
+"""
+import pytest
+
+from nhl_api_py.models.game import Boxscore, Game, Play
+from nhl_api_py.models.schedule import ScheduleDate
+from nhl_api_py.models.team import Team
+from nhl_api_py.warehouse.tables import (
+    GAMES,
+    PLAYS,
+    TABLES,
+    TEAMS,
+    Checkpoint,
+    Rows,
+    merge,
+    season_of,
+)
+
+
+@pytest.mark.parametrize(
+    "game_pk, season",
+    [(2022020001, "20222023"), (2019030411, "20192020"), (1999010001, "19992000")],
+)
+def test_season_of(game_pk, season):
+    assert season_of(game_pk) == season
+
+
+def test_merge():
+    assert merge(TEAMS, (1, "Old", None), (1, None, "link")) == (1, "Old", "link")
+    assert merge(TEAMS, None, (1, None)) == (1, None)
+    assert merge(PLAYS, (1, 0, "old"), (1, 0, None)) == (1, 0, None)
+
+
+@pytest.mark.parametrize("table", TABLES, ids=[table.name for table in TABLES])
+def test_rows_match_columns(table):
+    rows = Rows()
+    rows.add_team(Team(id=1))
+    rows.add_game(Game(pk=1, all_plays=[Play()]))
+    rows.add_boxscore(1, Boxscore())
+    rows.add_schedule_date(ScheduleDate(date="2022-10-12", games=[Game(pk=1)]))
+    rows.add_checkpoint(Checkpoint(1, "Final", "hash"))
+    for row in rows.tables[table].values():
+        assert len(row) == len(table.columns)
+
+
+class TestRows:
+    """
+    Tests the `Rows` class.
+    """
+
+    def test_teams_are_merged(self):
+        rows = Rows()
+        rows.add_team(Team(id=1, name="Team 1", first_year_of_play="1917"))
+        rows.add_game(Game(pk=1, away=Team(id=1, link="/api/v1/teams/1")))
+        (row,) = rows.tables[TEAMS].values()
+        assert row[:3] == (1, "Team 1", "/api/v1/teams/1")
+        assert row[list(TEAMS.columns).index("first_year_of_play")] == 1917
+
+    def test_plays(self):
+        rows = Rows()
+        plays = [Play(coordinates={"x": 1.0}), Play(team=Team(id=2))]
+        rows.add_game(Game(pk=5, all_plays=plays))
+        assert list(rows.tables[PLAYS]) == [(5, 0), (5, 1)]
+        assert rows.play_counts == {5: 2}
+        first, second = rows.tables[PLAYS].values()
+        columns = list(PLAYS.columns)
+        assert first[columns.index("x")] == 1.0 and first[columns.index("y")] is None
+        assert second[columns.index("team_id")] == 2
+        assert list(rows.tables[GAMES]) == [(5,)]
+
+    def test_game_without_plays(self):
+        rows = Rows()
+        rows.add_game(Game(pk=5))
+        assert rows.play_counts == {5: 0}
+        rows.add_game(Game(pk=6), with_plays=False)
+        assert 6 not in rows.play_counts
+
+    def test_invalid_integers(self):
+        rows = Rows()
+        rows.add_team(Team(id=1, first_year_of_play="unknown"))
+        (row,) = rows.tables[TEAMS].values()
+        assert row[list(TEAMS.columns).index("first_year_of_play")] is None
@@ -0,0 +1,32 @@
+"""
+Sets up the `nhl_web_app` Django project, so its apps can be tested.
+"""
+import os
+import sys
+from pathlib import Path
+
+import django
+import pytest
+from django.core.cache import cache
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+sys.path.insert(0, str(Path(__file__).parents[2] / "nhl_web_app"))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "nhl_web_app.settings")
+django.setup()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_environment():
+    setup_test_environment()
+    yield
+    teardown_test_environment()
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    from api.views import nhl_api
+
+    cache.clear()
+    nhl_api().cache.clear()
+    yield
+    cache.clear()
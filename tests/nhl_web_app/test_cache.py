@@ -0,0 +1,77 @@
+"""
+Tests the `api.cache` module of `nhl_web_app`.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from api.cache import IMMUTABLE_MAX_AGE, Payload, read_through
+from django.core.cache import cache
+
+from nhl_api_py.core.error_exceptions import ResponseError
+
+
+class TestPayload:
+    """
+    Tests the `Payload` class.
+    """
+
+    def test_from_data(self):
+        payload = Payload.from_data({"a": [1, 2]}, ttl=None)
+        assert payload.body == b'{"a":[1,2]}'
+        assert payload.etag.startswith('"') and payload.etag.endswith('"')
+        assert payload.etag == Payload.from_data({"a": [1, 2]}, ttl=10).etag
+        assert payload.etag != Payload.from_data({"a": [2, 1]}, ttl=None).etag
+
+    @pytest.mark.parametrize(
+        "expires_at, max_age",
+        [(None, IMMUTABLE_MAX_AGE), (1009.5, 10), (990, 0)],
+        ids=["never_expires", "fresh", "expired"],
+    )
+    def test_max_age(self, expires_at, max_age):
+        with patch("api.cache.time", return_value=1000):
+            assert Payload(b"{}", '"a"', expires_at).max_age == max_age
+
+
+class TestReadThrough:
+    """
+    Tests the `read_through` function.
+    """
+
+    def test_hits_are_not_fetched(self):
+        fetches = []
+
+        def fetch():
+            fetches.append(1)
+            return {"a": 1}, 60
+
+        first = read_through("key", fetch)
+        assert read_through("key", fetch) == first
+        assert len(fetches) == 1
+        assert cache.get("key") == first
+
+    def test_concurrent_misses_are_coalesced(self):
+        fetches, release = [], threading.Event()
+
+        def fetch():
+            fetches.append(1)
+            release.wait()
+            return {"a": 1}, 60
+
+        with ThreadPoolExecutor(50) as executor:
+            futures = [executor.submit(read_through, "key", fetch) for _ in range(50)]
+            threading.Event().wait(0.05)
+            release.set()
+            payloads = {future.result() for future in futures}
+        assert len(fetches) == 1
+        assert len(payloads) == 1
+
+    def test_errors_are_not_cached(self):
+        def fail():
+            raise ResponseError("upstream failed")
+
+        with pytest.raises(ResponseError):
+            read_through("key", fail)
+        assert cache.get("key") is None
+        assert read_through("key", lambda: ([], None)).body == b"[]"
@@ -0,0 +1,244 @@
+"""
+Tests the `api.live` module, and the live view of `nhl_web_app`.
+"""
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from api.live import GameFeed, LiveGames, encode_event
+from django.test import AsyncClient
+
+from nhl_api_py.core.error_exceptions import ResponseError
+from nhl_api_py.core.live import LiveGamePoller
+from nhl_api_py.core.response import Response
+
+GAME_PK = 2022020001
+
+
+def _feed(plays: int, state: str = "Live") -> dict:
+    return {
+        "metaData": {"timeStamp": f"2022101{plays}"},
+        "gameData": {
+            "game": {"pk": GAME_PK},
+            "status": {"abstractGameState": state, "detailedState": state},
+        },
+        "liveData": {
+            "plays": {
+                "allPlays": [{"result": {"event": f"Play {n}"}} for n in range(plays)]
+            }
+        },
+    }
+
+
+class ScriptedApi:
+    """
+    Stands in for `NhlApi`, answering each request with the next feed of a script,
+    and the last one once the script is over.
+    """
+
+    def __init__(self, *feeds: dict):
+        self.feeds = list(feeds)
+        self.requests = 0
+
+    def get(self, endpoint: str, use_cache: bool = True) -> Response:
+        self.requests += 1
+        return Response(200, self.feeds[min(self.requests, len(self.feeds)) - 1])
+
+
+def _events(stream: bytes) -> list[tuple[str, dict]]:
+    events = []
+    for block in stream.decode().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def _collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+GAME = [_feed(2), _feed(2), _feed(3), _feed(5, "Final")]
+
+
+class TestLiveGames:
+    """
+    Tests the `LiveGames` and `GameFeed` classes.
+    """
+
+    def test_encode_event(self):
+        assert encode_event("plays", [1], 3) == b"id: 3\nevent: plays\ndata: [1]\n\n"
+        assert encode_event("status", {}) == b"event: status\ndata: {}\n\n"
+
+    def test_subscribers_share_one_poller(self):
+        api = ScriptedApi(*GAME)
+        live = LiveGames(api, interval=0.01)
+
+        async def follow():
+            return await asyncio.gather(
+                *[_collect(live.stream(GAME_PK)) for _ in range(100)]
+            )
+
+        streams = asyncio.run(follow())
+        assert len(set(streams)) == 1
+        events = _events(streams[0])
+        assert [(name, len(data)) for name, data in events] == [
+            ("plays", 2),
+            ("status", 2),
+            ("plays", 1),
+            ("plays", 2),
+            ("status", 2),
+        ]
+        assert events[-1][1]["abstract_game_state"] == "Final"
+        assert api.requests == len(GAME)
+        assert live.feeds == {}
+
+    def test_late_subscribers_get_missed_events(self):
+        live = LiveGames(ScriptedApi(*GAME), interval=0.01)
+
+        async def follow():
+            first = asyncio.create_task(_collect(live.stream(GAME_PK)))
+            # Wait for the first two polls.
+            while GAME_PK not in live.feeds or len(live.feeds[GAME_PK].events) < 2:
+                await asyncio.sleep(0.001)
+            late = await _collect(live.stream(GAME_PK, last_event_id=2))
+            return await first, late
+
+        first, late = asyncio.run(follow())
+        assert [len(data) for name, data in _events(late) if name == "plays"] == [1, 2]
+        assert b"id: 3\n" in late and b"id: 2\n" not in late
+        assert _events(late)[-2:] == _events(first)[-2:]
+
+    def test_ended_feed_replays_its_events(self):
+        async def follow():
+            feed = GameFeed(LiveGamePoller(ScriptedApi(_feed(1, "Final")), 1), 0)
+            queue = feed.subscribe()
+            while not feed.ended:
+                await asyncio.sleep(0.001)
+            feed.unsubscribe(queue)
+            late = feed.subscribe(last_event_id=0)
+            return [late.get_nowait() for _ in range(late.qsize())]
+
+        events = asyncio.run(follow())
+        assert events[0][0] == 1 and events[0][1].startswith(b"id: 1\nevent: plays")
+        assert events[1][0] is None and events[1][1].startswith(b"event: status")
+        assert events[2] == (None, b"")
+
+    def test_resubscribing_does_not_overlap_polls(self):
+        started, release = threading.Event(), threading.Event()
+
+        class SlowApi(ScriptedApi):
+            polling, overlapped = 0, False
+
+            def get(self, endpoint: str, use_cache: bool = True) -> Response:
+                self.polling += 1
+                self.overlapped |= self.polling > 1
+                started.set()
+                release.wait(1)
+                try:
+                    return super().get(endpoint, use_cache)
+                finally:
+                    self.polling -= 1
+
+        api = SlowApi(_feed(2))
+
+        async def follow():
+            feed = GameFeed(LiveGamePoller(api, GAME_PK), interval=10)
+            queue = feed.subscribe()
+            await asyncio.to_thread(started.wait)
+            # The last subscriber leaves, and another one comes, mid-poll.
+            feed.unsubscribe(queue)
+            queue = feed.subscribe()
+            await asyncio.sleep(0.01)
+            release.set()
+            return await queue.get()
+
+        event_id, event = asyncio.run(follow())
+        # The plays of the poll in flight are published once it is over.
+        assert event_id == 2
+        assert api.requests == 1 and not api.overlapped
+
+    def test_polling_stops_without_subscribers(self):
+        api = ScriptedApi(_feed(1))
+        live = LiveGames(api, interval=0.01)
+
+        async def follow():
+            await _collect(live.stream(GAME_PK, max_seconds=0.05))
+            requests = api.requests
+            await asyncio.sleep(0.05)
+            return requests
+
+        assert asyncio.run(follow()) == api.requests
+        assert live.feeds == {}
+
+    def test_keepalive(self):
+        live = LiveGames(ScriptedApi(_feed(0)), interval=10, keepalive=0.01)
+        stream = asyncio.run(_collect(live.stream(GAME_PK, max_seconds=0.05)))
+        assert stream.startswith(b"retry: 10000\n\n")
+        assert b": keepalive\n\n" in stream
+
+    def test_slow_subscribers_are_disconnected(self):
+        feeds = [_feed(plays) for plays in range(1, 10)] + [_feed(10, "Final")]
+        live = LiveGames(ScriptedApi(*feeds), interval=0)
+
+        async def follow():
+            slow = live.stream(GAME_PK)
+            assert await slow.__anext__() == b"retry: 0\n\n"
+            fast = await _collect(live.stream(GAME_PK))
+            # The slow subscriber was dropped while it was not reading.
+            return fast, await _collect(slow)
+
+        with patch("api.live.MAX_PENDING_EVENTS", 3):
+            fast, slow = asyncio.run(follow())
+        assert b'"Final"' in fast
+        assert b'"Final"' not in slow
+        assert len(slow) < len(fast)
+
+    @pytest.mark.parametrize(
+        "method, headers, status",
+        [("post", {}, 405), ("get", {"Last-Event-ID": "a"}, 400)],
+        ids=["post", "bad_last_event_id"],
+    )
+    def test_view_errors(self, method, headers, status):
+        response = asyncio.run(
+            getattr(AsyncClient(), method)(
+                f"/api/games/{GAME_PK}/live/", headers=headers
+            )
+        )
+        assert response.status_code == status
+
+    @pytest.mark.parametrize("upstream, status", [(404, 404), (500, 502)])
+    def test_view_upstream_errors(self, upstream, status):
+        class FailingApi:
+            def get(self, endpoint: str, use_cache: bool = True) -> Response:
+                raise ResponseError(
+                    f"HTTP status code {upstream}", status_code=upstream
+                )
+
+        live = LiveGames(FailingApi())
+        with patch("api.views.live_games", return_value=live):
+            response = asyncio.run(AsyncClient().get(f"/api/games/{GAME_PK}/live/"))
+        assert response.status_code == status
+        assert str(upstream) in response.json()["error"]
+        assert live.feeds == {}
+
+    def test_view(self):
+        live = LiveGames(ScriptedApi(*GAME), interval=0.01)
+
+        async def follow():
+            response = await AsyncClient().get(
+                f"/api/games/{GAME_PK}/live/", headers={"Last-Event-ID": "3"}
+            )
+            return response, await _collect(response.streaming_content)
+
+        with patch("api.views.live_games", return_value=live):
+            response, stream = asyncio.run(follow())
+        assert response["Content-Type"] == "text/event-stream"
+        assert response["Cache-Control"] == "no-cache"
+        # The client resumes past the events of the new feed: it only gets the
+        # plays it did not receive yet.
+        events = _events(stream)
+        assert [name for name, data in events] == ["status", "plays", "status"]
+        assert [play["event"] for play in events[1][1]] == ["Play 3", "Play 4"]
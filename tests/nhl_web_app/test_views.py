@@ -0,0 +1,210 @@
+"""
+Tests the `api.views` module of `nhl_web_app`.
+"""
+import asyncio
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+from api.views import nhl_api
+from django.conf import settings
+from django.test import AsyncClient, Client
+
+BASE_URL = "https://statsapi.web.nhl.com/api/v1"
+GAME_PK = 2022020001
+
+
+def _feed(state: str = "Live") -> dict:
+    return {
+        "gameData": {"game": {"pk": GAME_PK}, "status": {"abstractGameState": state}},
+        "liveData": {"plays": {"allPlays": [{"result": {"event": "Goal"}}]}},
+    }
+
+
+def _schedule(state: str) -> dict:
+    return {
+        "dates": [
+            {"games": [{"gamePk": GAME_PK, "status": {"abstractGameState": state}}]}
+        ]
+    }
+
+
+def _upstream_calls(endpoint: str) -> int:
+    return sum(endpoint in call.request.url for call in responses.calls)
+
+
+@pytest.fixture
+def client():
+    return Client()
+
+
+class TestViews:
+    """
+    Tests the JSON views of the `api` app.
+    """
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "state, max_age", [("Live", 10), ("Final", 24 * 60 * 60)], ids=["live", "final"]
+    )
+    def test_game(self, client, state, max_age):
+        responses.get(f"{BASE_URL}/game/{GAME_PK}/feed/live", json=_feed(state))
+        response = client.get(f"/api/games/{GAME_PK}/")
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert response["Cache-Control"] == f"public, max-age={max_age}"
+        data = response.json()
+        assert data["pk"] == GAME_PK and data["abstract_game_state"] == state
+        assert data["all_plays"] is None
+
+    @responses.activate
+    def test_etag_revalidation(self, client):
+        responses.get(f"{BASE_URL}/game/{GAME_PK}/feed/live", json=_feed())
+        etag = client.get(f"/api/games/{GAME_PK}/")["ETag"]
+        response = client.get(f"/api/games/{GAME_PK}/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert response.content == b""
+        assert (
+            client.get(f"/api/games/{GAME_PK}/", HTTP_IF_NONE_MATCH='"old"').status_code
+            == 200
+        )
+        assert _upstream_calls("feed/live") == 1
+
+    @responses.activate
+    def test_plays_share_the_game_feed(self, client):
+        responses.get(f"{BASE_URL}/game/{GAME_PK}/feed/live", json=_feed())
+        client.get(f"/api/games/{GAME_PK}/")
+        response = client.get(f"/api/games/{GAME_PK}/plays/")
+        assert [play["event"] for play in response.json()] == ["Goal"]
+        assert _upstream_calls("feed/live") == 1
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "state, max_age",
+        [("Live", 10), ("Final", 24 * 60 * 60), (None, 10)],
+        ids=["live", "final", "unscheduled"],
+    )
+    def test_boxscore(self, client, state, max_age):
+        responses.get(
+            f"{BASE_URL}/schedule?gamePk={GAME_PK}",
+            json=_schedule(state) if state else {"dates": []},
+        )
+        responses.get(
+            f"{BASE_URL}/game/{GAME_PK}/boxscore",
+            json={"teams": {"away": {"team": {"id": 1}}}},
+        )
+        response = client.get(f"/api/games/{GAME_PK}/boxscore/")
+        assert response.json()["away_team"]["id"] == 1
+        assert response["Cache-Control"] == f"public, max-age={max_age}"
+        # The state of the game is read from its schedule, not its whole feed.
+        assert _upstream_calls("feed/live") == 0
+
+    @responses.activate
+    def test_concurrent_requests_are_coalesced(self):
+        release = threading.Event()
+
+        def slow_feed(request):
+            release.wait()
+            return 200, {}, json.dumps(_feed())
+
+        responses.add_callback(
+            responses.GET, f"{BASE_URL}/game/{GAME_PK}/feed/live", callback=slow_feed
+        )
+        with ThreadPoolExecutor(100) as executor:
+            futures = [
+                executor.submit(Client().get, f"/api/games/{GAME_PK}/")
+                for _ in range(100)
+            ]
+            threading.Event().wait(0.1)
+            release.set()
+            bodies = {future.result().content for future in futures}
+        assert len(bodies) == 1
+        assert _upstream_calls("feed/live") == 1
+
+    @responses.activate
+    def test_slow_upstream_does_not_block_other_requests(self):
+        release, served = threading.Event(), []
+
+        def slow_feed(request):
+            release.wait(1)
+            served.append(request.url)
+            return 200, {}, json.dumps(_feed())
+
+        responses.add_callback(
+            responses.GET, f"{BASE_URL}/game/{GAME_PK}/feed/live", callback=slow_feed
+        )
+        responses.get(re.compile(f"{BASE_URL}/teams.*"), json={"teams": []})
+
+        async def fetch():
+            client = AsyncClient()
+            slow = asyncio.create_task(client.get(f"/api/games/{GAME_PK}/"))
+            await asyncio.sleep(0.01)
+            teams = await client.get("/api/teams/")
+            # The feed is still being fetched in a worker thread.
+            waiting = not served
+            release.set()
+            return teams, await slow, waiting
+
+        teams, slow, waiting = asyncio.run(fetch())
+        assert waiting
+        assert teams.status_code == slow.status_code == 200
+
+    @responses.activate
+    def test_teams(self, client):
+        responses.get(
+            re.compile(f"{BASE_URL}/teams.*"), json={"teams": [{"id": 1, "name": "A"}]}
+        )
+        response = client.get("/api/teams/?ids=1,2&season=2022")
+        assert [team["name"] for team in response.json()] == ["A"]
+        assert "teamId=1,2" in responses.calls[0].request.url
+        assert "season=20222023" in responses.calls[0].request.url
+        # The order of the IDs does not matter.
+        client.get("/api/teams/?ids=2,1&season=2022")
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_schedule(self, client):
+        responses.get(
+            re.compile(f"{BASE_URL}/schedule.*"),
+            json={"dates": [{"date": "2022-10-07", "games": [{"gamePk": GAME_PK}]}]},
+        )
+        response = client.get("/api/schedule/?season=2022&teams=1&game_type=R")
+        assert response.json()[0]["games"][0]["pk"] == GAME_PK
+        url = responses.calls[0].request.url
+        assert "season=20222023" in url and "gameType=R" in url and "teamId=1" in url
+
+    @pytest.mark.parametrize(
+        "url",
+        ["/api/teams/?ids=a", "/api/teams/?season=2021,2022", "/api/schedule/?teams=x"],
+        ids=["not_integer", "many_seasons", "schedule"],
+    )
+    def test_bad_request(self, client, url):
+        response = client.get(url)
+        assert response.status_code == 400
+        assert "error" in response.json()
+
+    def test_client_cache_is_bounded(self):
+        assert nhl_api().cache.maxsize == settings.NHL_API_CACHE["MAXSIZE"]
+        assert nhl_api().cache.max_age == settings.NHL_API_CACHE["MAX_AGE"]
+
+    @responses.activate
+    def test_upstream_errors_are_not_cached(self, client):
+        responses.get(f"{BASE_URL}/schedule?gamePk={GAME_PK}", json=_schedule("Live"))
+        url = f"{BASE_URL}/game/{GAME_PK}/boxscore"
+        responses.get(url, status=404)
+        response = client.get(f"/api/games/{GAME_PK}/boxscore/")
+        assert response.status_code == 502
+        assert "404" in response.json()["error"]
+        responses.replace(responses.GET, url, json={})
+        assert client.get(f"/api/games/{GAME_PK}/boxscore/").status_code == 200
+
+    @responses.activate
+    def test_only_safe_methods(self, client):
+        responses.get(f"{BASE_URL}/game/{GAME_PK}/feed/live", json=_feed())
+        assert client.post(f"/api/games/{GAME_PK}/").status_code == 405
+        response = client.head(f"/api/games/{GAME_PK}/")
+        assert response.status_code == 200 and response.content == b""